@@ -11,6 +11,7 @@ from .hed_group import HedGroup
 from .spreadsheet_input import SpreadsheetInput
 from .hed_string import HedString
 from .hed_tag import HedTag
+from .hed_tokenizer import HedTokenKind, iter_hed_tokens, get_hed_tokens, tokenize_hed_string
 from .sidecar import Sidecar
 from .tabular_input import TabularInput
 from .timeseries_input import TimeseriesInput
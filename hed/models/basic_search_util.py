@@ -2,7 +2,6 @@
 Utilities to support HED searches based on strings.
 """
 from hed.models.hed_string import HedString
-from hed.models.hed_tag import HedTag
 
 
 def convert_query(search_query, schema):
@@ -16,7 +15,8 @@ def convert_query(search_query, schema):
         long_query(str): The converted search query, in long form.
     """
     input_tags = HedString.split_hed_string(search_query)
-    output_string = ""
+    output_parts = []
+    tags_to_convert = []
     skippable_prefix = ("@", "~")
     skippable_suffix = ("*", )
     for is_hed_tag, (startpos, endpos) in input_tags:
@@ -24,15 +24,20 @@ def convert_query(search_query, schema):
         add_suffix = ""
         if is_hed_tag:
             if input_tag.startswith(skippable_prefix):
-                output_string += input_tag[:1]
+                output_parts.append(input_tag[:1])
                 input_tag = input_tag[1:]
 
             if input_tag.endswith(skippable_suffix):
                 add_suffix = input_tag[-1:]
                 input_tag = input_tag[:-1]
-            output_string += HedTag(input_tag, schema).long_tag
-            output_string += add_suffix
+            # Placeholder for the long form, filled in once all the tags are converted together.
+            tags_to_convert.append((len(output_parts), input_tag))
+            output_parts.append(None)
+            output_parts.append(add_suffix)
         else:
-            output_string += input_tag
+            output_parts.append(input_tag)
 
-    return output_string
+    _, long_tags, _, _, _ = schema.resolve_many([input_tag for _, input_tag in tags_to_convert])
+    for (index, _), long_tag in zip(tags_to_convert, long_tags):
+        output_parts[index] = long_tag
+    return "".join(output_parts)
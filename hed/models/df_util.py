@@ -5,6 +5,8 @@ from collections import defaultdict
 from functools import partial
 import pandas as pd
 from hed.models.hed_string import HedString
+from hed.models.hed_tag import HedTag
+from hed.models.hed_tokenizer import HedTokenKind, get_hed_tokens
 from hed.models.model_constants import DefTagNames
 
 
@@ -17,15 +19,11 @@ def convert_to_form(df, hed_schema, tag_form, columns=None):
         tag_form(str): HedTag property to convert tags to.
         columns (list): The columns to modify on the dataframe.
 
-    """
-    if isinstance(df, pd.Series):
-        df[:] = df.apply(partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form))
-    else:
-        if columns is None:
-            columns = df.columns
+    Notes:
+        - Each distinct string across all the columns is only converted once.
 
-        for column in columns:
-            df[column] = df[column].apply(partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form))
+    """
+    _apply_unique(df, partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form), columns)
 
 
 def shrink_defs(df, hed_schema, columns=None):
@@ -37,16 +35,7 @@ def shrink_defs(df, hed_schema, columns=None):
         columns (list or None): The columns to modify on the dataframe.
 
     """
-    if isinstance(df, pd.Series):
-        mask = df.str.contains('Def-expand/', case=False)
-        df[mask] = df[mask].apply(partial(_shrink_defs, hed_schema=hed_schema))
-    else:
-        if columns is None:
-            columns = df.columns
-
-        for column in columns:
-            mask = df[column].str.contains('Def-expand/', case=False)
-            df[column][mask] = df[column][mask].apply(partial(_shrink_defs, hed_schema=hed_schema))
+    _apply_unique(df, partial(_shrink_defs, hed_schema=hed_schema), columns, contains='Def-expand/')
 
 
 def expand_defs(df, hed_schema, def_dict, columns=None):
@@ -60,21 +49,80 @@ def expand_defs(df, hed_schema, def_dict, columns=None):
         def_dict (DefinitionDict): The definitions to expand.
         columns (list or None): The columns to modify on the dataframe.
     """
+    _apply_unique(df, partial(_expand_defs, hed_schema=hed_schema, def_dict=def_dict), columns, contains='Def/')
+
+
+def _apply_unique(df, converter, columns=None, contains=None):
+    """ Apply a string converter (in place) once per distinct value in the selected columns.
+
+    Parameters:
+        df (pd.Dataframe or pd.Series): The dataframe or series to modify.
+        converter (func): Function taking a HED string and returning the converted string.
+        columns (list or None): The columns to modify on the dataframe.  All columns if None.
+        contains (str or None): If given, only values containing this text (case-insensitive) are converted.
+    """
     if isinstance(df, pd.Series):
-        mask = df.str.contains('Def/', case=False)
-        df[mask] = df[mask].apply(partial(_expand_defs, hed_schema=hed_schema, def_dict=def_dict))
+        series_list = [df]
     else:
         if columns is None:
             columns = df.columns
+        series_list = [df[column] for column in columns]
+    if not series_list:
+        return
+
+    masks = [_get_contains_mask(series, contains) for series in series_list]
+    selected = [series if mask is None else series[mask] for series, mask in zip(series_list, masks)]
+    unique_values = pd.unique(pd.concat(selected, ignore_index=True))
+    mapping = {value: converter(value) if isinstance(value, str) else value for value in unique_values}
+
+    if isinstance(df, pd.Series):
+        mask = masks[0]
+        if mask is None:
+            df[:] = df.map(mapping)
+        else:
+            df[mask] = df[mask].map(mapping)
+        return
+
+    for column, series, mask in zip(columns, series_list, masks):
+        if mask is None:
+            df[column] = series.map(mapping)
+        else:
+            df.loc[mask, column] = series[mask].map(mapping)
 
-        for column in columns:
-            mask = df[column].str.contains('Def/', case=False)
-            df.loc[mask, column] = df.loc[mask, column].apply(partial(_expand_defs,
-                                                                      hed_schema=hed_schema, def_dict=def_dict))
+
+def _get_contains_mask(series, contains):
+    """ Return a boolean mask of the values containing the text, or None if no filtering is needed. """
+    if contains is None:
+        return None
+    return series.str.contains(contains, case=False, regex=False, na=False)
 
 
 def _convert_to_form(hed_string, hed_schema, tag_form):
-    return str(HedString(hed_string, hed_schema).get_as_form(tag_form))
+    """ Convert a HED string to the specified form by swapping tag spans, without building the group tree.
+
+    Parameters:
+        hed_string (str): The HED string to convert.
+        hed_schema (HedSchema): The schema to use to convert tags.
+        tag_form (str): HedTag property to convert tags to.
+
+    Returns:
+        str: The converted string, identical to HedString(hed_string, hed_schema).get_as_form(tag_form).
+    """
+    current_tag_group = [[]]
+    for kind, startpos, endpos in get_hed_tokens(hed_string):
+        if kind == HedTokenKind.TAG:
+            current_tag_group[-1].append(getattr(HedTag(hed_string, hed_schema, (startpos, endpos)), tag_form))
+        elif kind == HedTokenKind.OPEN_GROUP:
+            current_tag_group.append([])
+        elif kind == HedTokenKind.CLOSE_GROUP:
+            if len(current_tag_group) == 1:
+                return ""
+            new_group = current_tag_group.pop()
+            current_tag_group[-1].append(f"({','.join(new_group)})")
+
+    if len(current_tag_group) != 1:
+        return ""
+    return ",".join(current_tag_group[0])
 
 
 def _shrink_defs(hed_string, hed_schema):
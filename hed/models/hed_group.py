@@ -30,6 +30,8 @@ class HedGroup:
         else:
             self.children = []
         self._original_children = self.children
+        self._tag_terms = None
+        self._flat_view = None
 
     def append(self, tag_or_group):
         """ Add a tag or group to this group.
@@ -39,6 +41,7 @@ class HedGroup:
         """
         tag_or_group._parent = self
         self.children.append(tag_or_group)
+        self._invalidate_caches()
 
     def check_if_in_original(self, tag_or_group):
         """ Check if the tag or group in original string.
@@ -50,16 +53,14 @@ class HedGroup:
             bool:  True if in this group.
         """
         node_list = [self]
-        final_list = []
-
-        # Using an iterator is worse performance wise here.
         while node_list:
-            current_group_or_tag = node_list.pop(0)
+            current_group_or_tag = node_list.pop()
+            if current_group_or_tag is tag_or_group:
+                return True
             if isinstance(current_group_or_tag, HedGroup):
-                node_list = current_group_or_tag._original_children + node_list
-            final_list.append(current_group_or_tag)
+                node_list.extend(current_group_or_tag._original_children)
 
-        return self._check_in_group(tag_or_group, final_list)
+        return False
 
     @staticmethod
     def replace(item_to_replace, new_contents):
@@ -98,6 +99,7 @@ class HedGroup:
             if item_to_replace is child:
                 self.children[i] = new_contents
                 new_contents._parent = self
+                self._invalidate_caches()
                 return
 
         raise KeyError(f"The tag {item_to_replace} not found in the group.")
@@ -122,6 +124,7 @@ class HedGroup:
                 group._original_children = group.children.copy()
 
             group.children.remove(item)
+            group._invalidate_caches()
             if not group.children and group is not self:
                 empty_groups.append(group)
 
@@ -185,6 +188,7 @@ class HedGroup:
         output_list = tag_list + group_list
         if update_self:
             self.children = [x[0] for x in output_list]
+            self._invalidate_caches()
         return [x[1] for x in output_list]
 
     @property
@@ -192,67 +196,71 @@ class HedGroup:
         """ True if this is a parenthesized group. """
         return True
 
-    def get_all_tags(self):
-        """ Return HedTags, including descendants.
-
-        Returns:
-            list:  A list of all the tags in this group including descendants.
+    def _invalidate_caches(self):
+        """ Clear the cached views of this group and all of its ancestors.
 
+        Notes:
+            - Called by every method that modifies the children of a group, and when a tag is recomputed.
         """
-        node_list = [self]
-        final_list = []
+        group = self
+        while group is not None:
+            group._tag_terms = None
+            group._flat_view = None
+            group = group._parent
 
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = list(current_group_or_tag.children) + node_list
-            else:
-                final_list.append(current_group_or_tag)
-        return final_list
+    def _get_flat_view(self):
+        """ Return the cached preorder view of this group, building it if needed.
 
-    def get_all_groups(self, also_return_depth=False):
-        """ Return HedGroups, including descendants and self.
+        Returns:
+            _FlatView: Preorder arrays of the tags and groups in this group, including self.
 
-        Parameters:
-            also_return_depth (bool): If True, yield tuples (group, depth) rather than just groups.
+        Notes:
+            - The view is built once in linear time and shared by all finders until the group is modified.
+        """
+        if self._flat_view is None:
+            self._flat_view = _FlatView(self)
+        return self._flat_view
+
+    def get_all_tag_terms(self):
+        """ Return the set of all tag terms in this group, including descendants.
 
         Returns:
-            list: The list of all HedGroups in this group, including descendants and self.
+            frozenset: The casefolded terms of every tag in this group.
 
+        Notes:
+            - This is computed lazily and cached until the group is modified.
+            - Used as a fingerprint so searches can reject groups that cannot contain a term.
         """
-        node_list = [self]
-        final_list = []
+        if self._tag_terms is None:
+            self._tag_terms = frozenset(term for tag in self._get_flat_view().tags for term in tag.tag_terms)
+        return self._tag_terms
 
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = list(current_group_or_tag.children) + node_list
-                final_list.append(current_group_or_tag)
+    def get_all_tags(self):
+        """ Return HedTags, including descendants.
 
-        if also_return_depth:
-            top_groups = self.groups()
+        Returns:
+            list:  A list of all the tags in this group including descendants.
 
-            final_list = [(group, self._check_in_group(group, top_groups)) for group in final_list]
-        return final_list
+        """
+        return list(self._get_flat_view().tags)
 
-    @staticmethod
-    def _check_in_group(group, group_list):
-        """ Return True if the group is list.
+    def get_all_groups(self, also_return_depth=False):
+        """ Return HedGroups, including descendants and self.
 
         Parameters:
-            group (HedGroup): The group to check for.
-            group_list (list):    A list of groups to search.
+            also_return_depth (bool): If True, yield tuples (group, is_top_level) rather than just groups.
 
         Returns:
-            bool: True if group is in the group list.
+            list: The list of all HedGroups in this group, including descendants and self.
+
+        Notes:
+            - is_top_level is True for groups that are direct children of this group.
 
         """
-        for val in group_list:
-            if val is group:
-                return True
-        return False
+        flat_view = self._get_flat_view()
+        if also_return_depth:
+            return [(group, depth == 1) for group, depth in zip(flat_view.groups, flat_view.group_depths)]
+        return list(flat_view.groups)
 
     def tags(self):
         """ Return the direct child tags of this group.
@@ -399,7 +407,7 @@ class HedGroup:
         Notes:
             - Assumes a valid HedString with no erroneous "#" characters.
         """
-        for tag in self.get_all_tags():
+        for tag in self._get_flat_view().tags:
             if tag.is_placeholder():
                 return tag
 
@@ -443,7 +451,7 @@ class HedGroup:
         """
         found_tags = []
         if recursive:
-            tags = self.get_all_tags()
+            tags = self._get_flat_view().tags
         else:
             tags = self.tags()
         search_tags = {tag.casefold() for tag in search_tags}
@@ -475,7 +483,7 @@ class HedGroup:
         """
         found_tags = []
         if recursive:
-            tags = self.get_all_tags()
+            tags = self._get_flat_view().tags
         else:
             tags = self.tags()
 
@@ -507,7 +515,7 @@ class HedGroup:
         """
         found_tags = []
         if recursive:
-            tags = self.get_all_tags()
+            tags = self._get_flat_view().tags
         else:
             tags = self.tags()
 
@@ -533,7 +541,7 @@ class HedGroup:
             list: A list of tuples. The contents depend on the values of the include_group.
         """
         if recursive:
-            groups = self.get_all_groups()
+            groups = self._get_flat_view().groups
             def_tags = []
             for group in groups:
                 def_tags += self._get_def_tags_from_group(group)
@@ -575,7 +583,7 @@ class HedGroup:
         """
         found_tags = []
         if recursive:
-            tags = self.get_all_tags()
+            tags = self._get_flat_view().tags
         else:
             tags = self.tags()
 
@@ -587,3 +595,36 @@ class HedGroup:
         if include_groups == 0 or include_groups == 1:
             return [tag[include_groups] for tag in found_tags]
         return found_tags
+
+
+class _FlatView:
+    """ Preorder arrays of the tags and groups in a HedGroup.
+
+    Attributes:
+        tags (tuple): All HedTags in preorder.
+        tag_parents (tuple): For each tag, the index of its containing group in groups.
+        groups (tuple): All HedGroups in preorder, starting with the root group.
+        group_depths (tuple): For each group, its nesting depth with the root at 0.
+        group_parents (tuple): For each group, the index of its parent in groups, or -1 for the root.
+    """
+
+    def __init__(self, root):
+        tags, tag_parents = [], []
+        groups, group_depths, group_parents = [], [], []
+        node_stack = [(root, -1, 0)]
+        while node_stack:
+            node, parent_index, depth = node_stack.pop()
+            if isinstance(node, HedGroup):
+                group_index = len(groups)
+                groups.append(node)
+                group_depths.append(depth)
+                group_parents.append(parent_index)
+                node_stack.extend((child, group_index, depth + 1) for child in reversed(node.children))
+            else:
+                tags.append(node)
+                tag_parents.append(parent_index)
+        self.tags = tuple(tags)
+        self.tag_parents = tuple(tag_parents)
+        self.groups = tuple(groups)
+        self.group_depths = tuple(group_depths)
+        self.group_parents = tuple(group_parents)
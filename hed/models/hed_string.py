@@ -2,6 +2,7 @@
 import copy
 from hed.models.hed_group import HedGroup
 from hed.models.hed_tag import HedTag
+from hed.models.hed_tokenizer import HedTokenKind, get_hed_tokens
 from hed.models.model_constants import DefTagNames
 
 
@@ -96,6 +97,8 @@ class HedString(HedGroup):
         new_string._original_children = copy.deepcopy(self._original_children, memo)
         new_string._from_strings = copy.deepcopy(self._from_strings, memo)
         new_string.children = copy.deepcopy(self.children, memo)
+        new_string._tag_terms = None
+        new_string._flat_view = None
 
         return new_string
 
@@ -188,35 +191,24 @@ class HedString(HedGroup):
         """
         current_tag_group = [[]]
 
-        input_tags = HedString.split_hed_string(hed_string)
-        for is_hed_tag, (startpos, endpos) in input_tags:
-            if is_hed_tag:
+        for kind, startpos, endpos in get_hed_tokens(hed_string):
+            if kind == HedTokenKind.TAG:
                 new_tag = HedTag(hed_string, hed_schema, (startpos, endpos), def_dict)
                 current_tag_group[-1].append(new_tag)
-            else:
-                string_portion = hed_string[startpos:endpos]
-                delimiter_index = 0
-                for i, char in enumerate(string_portion):
-                    if not char.isspace():
-                        delimiter_index = i
-                        break
+            elif kind == HedTokenKind.OPEN_GROUP:
+                paren_start = hed_string.find(HedString.OPENING_GROUP_CHARACTER, startpos, endpos)
+                current_tag_group.append(HedGroup(hed_string, paren_start))
+            elif kind == HedTokenKind.CLOSE_GROUP:
+                # Terminate existing group, and save it off.
+                paren_end = hed_string.find(HedString.CLOSING_GROUP_CHARACTER, startpos, endpos) + 1
 
-                delimiter_char = string_portion[delimiter_index]
+                if len(current_tag_group) > 1:
+                    new_group = current_tag_group.pop()
+                    new_group._endpos = paren_end
 
-                if delimiter_char is HedString.OPENING_GROUP_CHARACTER:
-                    current_tag_group.append(HedGroup(hed_string, startpos + delimiter_index))
-
-                if delimiter_char is HedString.CLOSING_GROUP_CHARACTER:
-                    # Terminate existing group, and save it off.
-                    paren_end = startpos + delimiter_index + 1
-
-                    if len(current_tag_group) > 1:
-                        new_group = current_tag_group.pop()
-                        new_group._endpos = paren_end
-
-                        current_tag_group[-1].append(new_group)
-                    else:
-                        raise ValueError(f"Closing parentheses in HED string {hed_string}")
+                    current_tag_group[-1].append(new_group)
+                else:
+                    raise ValueError(f"Closing parentheses in HED string {hed_string}")
 
         # Comma delimiter issues are ignored and assumed already validated currently.
         if len(current_tag_group) != 1:
@@ -279,51 +271,11 @@ class HedString(HedGroup):
                 - end_pos (int):     Index of end of string in hed_string.
 
             - This function does not validate tags or delimiters in any form.
+            - See hed_tokenizer.tokenize_hed_string for a compact array form of the same spans.
 
         """
-        tag_delimiters = ",()"
-        current_spacing = 0
-        found_symbol = True
-        result_positions = []
-        tag_start_pos = None
-        last_end_pos = 0
-        for i, char in enumerate(hed_string):
-            if char == " ":
-                current_spacing += 1
-                continue
-
-            if char in tag_delimiters:
-                if found_symbol:
-                    if last_end_pos != i:
-                        result_positions.append((False, (last_end_pos, i)))
-                    last_end_pos = i
-                elif not found_symbol:
-                    found_symbol = True
-                    last_end_pos = i - current_spacing
-                    result_positions.append((True, (tag_start_pos, last_end_pos)))
-                    current_spacing = 0
-                    tag_start_pos = None
-                continue
-
-            # If we have a current delimiter, end it here.
-            if found_symbol and last_end_pos is not None:
-                if last_end_pos != i:
-                    result_positions.append((False, (last_end_pos, i)))
-                last_end_pos = None
-
-            found_symbol = False
-            current_spacing = 0
-            if tag_start_pos is None:
-                tag_start_pos = i
-
-        if last_end_pos is not None and len(hed_string) != last_end_pos:
-            result_positions.append((False, (last_end_pos, len(hed_string))))
-        if tag_start_pos is not None:
-            result_positions.append((True, (tag_start_pos, len(hed_string) - current_spacing)))
-            if current_spacing:
-                result_positions.append((False, (len(hed_string) - current_spacing, len(hed_string))))
-
-        return result_positions
+        return [(kind == HedTokenKind.TAG, (startpos, endpos))
+                for kind, startpos, endpos in get_hed_tokens(hed_string)]
 
     def validate(self, allow_placeholders=True, error_handler=None):
         """ Validate the string using the schema.
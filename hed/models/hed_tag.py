@@ -332,6 +332,9 @@ class HedTag:
                 self._extension_value = remainder
         else:
             self.tag_terms = tuple()
+        # The groups containing this tag cache the terms of their tags.
+        if self._parent is not None:
+            self._parent._invalidate_caches()
 
         return tag_issues
 
@@ -0,0 +1,94 @@
+""" Lightweight tokenizer for HED strings that produces token spans without building HedTag objects. """
+import re
+import numpy as np
+
+
+class HedTokenKind:
+    """ The kinds of tokens produced when tokenizing a HED string. """
+
+    TAG = 0
+    COMMA = 1
+    OPEN_GROUP = 2
+    CLOSE_GROUP = 3
+    WHITESPACE = 4
+
+
+# Delimiter tokens absorb the spaces around them, so the text between two delimiters is a bare tag or empty.
+_DELIMITER_SPLIT = re.compile(r"( *[,()] *)")
+
+_DELIMITER_KINDS = {
+    ",": HedTokenKind.COMMA,
+    "(": HedTokenKind.OPEN_GROUP,
+    ")": HedTokenKind.CLOSE_GROUP
+}
+
+
+def iter_hed_tokens(hed_string):
+    """ Yield the tokens of a HED string one at a time.
+
+    Parameters:
+        hed_string (str): The HED string to tokenize.
+
+    Yields:
+        tuple: (kind, start_pos, end_pos) where kind is a HedTokenKind value.
+
+    Notes:
+        - Tag spans exclude surrounding spaces.  Delimiter tokens include them.
+        - Spaces at the very start or end of the string are separate WHITESPACE tokens.
+        - This function does not validate tags or delimiters in any form.
+
+    """
+    tag_kind = HedTokenKind.TAG
+    string_end = len(hed_string)
+    # Spaces at the start are not part of the first tag or delimiter.
+    pos = string_end - len(hed_string.lstrip(" "))
+    if pos:
+        yield HedTokenKind.WHITESPACE, 0, pos
+    for match in _DELIMITER_SPLIT.finditer(hed_string):
+        startpos, endpos = match.span()
+        startpos = max(startpos, pos)
+        if startpos != pos:
+            yield tag_kind, pos, startpos
+        yield _DELIMITER_KINDS[match.group().strip(" ")], startpos, endpos
+        pos = endpos
+
+    # Only the text after the last delimiter can end with spaces.
+    if pos != string_end:
+        tag_end = pos + len(hed_string[pos:].rstrip(" "))
+        yield tag_kind, pos, tag_end
+        if tag_end != string_end:
+            yield HedTokenKind.WHITESPACE, tag_end, string_end
+
+
+def get_hed_tokens(hed_string):
+    """ Return the tokens of a HED string as a list.
+
+    Parameters:
+        hed_string (str): The HED string to tokenize.
+
+    Returns:
+        list: A list of tuples (kind, start_pos, end_pos) where kind is a HedTokenKind value.
+
+    Notes:
+        - See iter_hed_tokens for details.
+    """
+    return list(iter_hed_tokens(hed_string))
+
+
+def tokenize_hed_string(hed_string):
+    """ Tokenize a HED string into compact span arrays.
+
+    Parameters:
+        hed_string (str): The HED string to tokenize.
+
+    Returns:
+        np.ndarray: int32 start positions of the tokens.
+        np.ndarray: int32 end positions of the tokens.
+        np.ndarray: uint8 HedTokenKind of the tokens.
+
+    """
+    tokens = get_hed_tokens(hed_string)
+    if not tokens:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.uint8)
+    kinds, starts, ends = zip(*tokens)
+    return np.array(starts, dtype=np.int32), np.array(ends, dtype=np.int32), np.array(kinds, dtype=np.uint8)
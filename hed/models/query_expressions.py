@@ -41,6 +41,21 @@ class Expression:
             output_str += str(self.right)
         return output_str
 
+    def could_match(self, tag_terms):
+        """Return False if this expression cannot match a group with only the given tag terms.
+
+           This is a cheap prefilter and never rejects a group that handle_expr would match.
+
+           Parameters:
+               tag_terms(set or frozenset): The casefolded tag terms present in the group being searched.
+
+           Returns:
+               bool: False if a match is impossible, True if the full search is required.
+        """
+        if self._match_mode or self._must_not_be_in_line:
+            return True
+        return self.token.text in tag_terms
+
     def handle_expr(self, hed_group, exact=False):
         """Handles parsing the given expression, recursively down the list as needed.
 
@@ -79,6 +94,9 @@ class Expression:
 
 
 class ExpressionAnd(Expression):
+    def could_match(self, tag_terms):
+        return self.left.could_match(tag_terms) and self.right.could_match(tag_terms)
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         if not groups1:
@@ -132,6 +150,9 @@ class ExpressionAnd(Expression):
 
 
 class ExpressionWildcardNew(Expression):
+    def could_match(self, tag_terms):
+        return True
+
     def handle_expr(self, hed_group, exact=False):
         groups_found = []
         if self.token.text == "?":
@@ -160,6 +181,9 @@ class ExpressionWildcardNew(Expression):
 
 
 class ExpressionOr(Expression):
+    def could_match(self, tag_terms):
+        return self.left.could_match(tag_terms) or self.right.could_match(tag_terms)
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         # Don't early out as we need to gather all groups in case tags appear more than once etc
@@ -188,6 +212,9 @@ class ExpressionOr(Expression):
 
 
 class ExpressionNegation(Expression):
+    def could_match(self, tag_terms):
+        return True
+
     def handle_expr(self, hed_group, exact=False):
         found_groups = self.right.handle_expr(hed_group, exact=exact)
 
@@ -203,6 +230,9 @@ class ExpressionNegation(Expression):
 
 
 class ExpressionDescendantGroup(Expression):
+    def could_match(self, tag_terms):
+        return self.right.could_match(tag_terms)
+
     def handle_expr(self, hed_group, exact=False):
         found_groups = self.right.handle_expr(hed_group)
         found_parent_groups = self._get_parent_groups(found_groups)
@@ -214,6 +244,9 @@ class ExpressionExactMatch(Expression):
         super().__init__(token, left, right)
         self.optional = "any"
 
+    def could_match(self, tag_terms):
+        return self.right.could_match(tag_terms)
+
     @staticmethod
     def _filter_exact_matches(search_results):
         filtered_list = []
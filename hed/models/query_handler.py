@@ -56,8 +56,14 @@ class QueryHandler:
         Returns:
             list(SearchResult): Generally you should just treat this as a bool
                                 True if a match was found.
+
+        Notes:
+            - Strings that lack a required term are rejected using their cached tag term set
+              before doing any structural matching.
         """
         current_node = self.tree
+        if not current_node.could_match(hed_string_obj.get_all_tag_terms()):
+            return []
 
         result = current_node.handle_expr(hed_string_obj)
         return result
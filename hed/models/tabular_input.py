@@ -44,6 +44,11 @@ class TabularInput(BaseInput):
             raise ValueError("You are attempting to open a bids_old style file with no column headers provided.\n"
                              "This is probably not intended.")
 
+    @property
+    def sidecar(self):
+        """ The Sidecar associated with this file or None. """
+        return self._sidecar
+
     def reset_column_mapper(self, sidecar=None):
         """ Change the sidecars and settings.
 
@@ -2,6 +2,7 @@
 from .hed_schema import HedSchema
 from .hed_schema_entry import HedSchemaEntry, UnitClassEntry, UnitEntry, HedTagEntry
 from .hed_schema_group import HedSchemaGroup
+from .hed_schema_flat import FlatHedSchema
 from .hed_schema_section import HedSchemaSection
 from .hed_schema_io import load_schema, load_schema_version, from_string, get_hed_xml_version, from_dataframes
 from .hed_schema_constants import HedKey, HedSectionKey
@@ -2,6 +2,8 @@
 
 import shutil
 import os
+import tempfile
+import time
 
 import json
 from hashlib import sha1
@@ -11,7 +13,7 @@ import functools
 
 import re
 from semantic_version import Version
-from hed.schema.hed_cache_lock import CacheException, CacheLock
+from hed.schema.hed_cache_lock import CacheException, CacheLock, CACHE_TIME_THRESHOLD, get_last_cached_time
 from hed.schema.schema_io.schema_util import url_to_file, make_url_request
 from pathlib import Path
 import urllib
@@ -46,6 +48,14 @@ HED_CACHE_DIRECTORY = os.path.join(Path.home(), '.hedtools/hed_cache/')
 INSTALLED_CACHE_LOCATION = os.path.realpath(os.path.join(os.path.dirname(__file__), 'schema_data/'))
 version_pattern = re.compile(HED_VERSION_FINAL)
 
+# The manifest of the schemas in a cache folder and its prerelease subfolder.
+MANIFEST_FILENAME = "cache_manifest.json"
+MANIFEST_FORMAT = 1
+MANIFEST_RECORD_KEYS = ("library", "version", "prerelease", "sha1", "path", "size", "mtime_ns")
+
+# Manifests already read or built by this process, keyed by the folder name they were requested with.
+_manifests = {}
+
 
 def set_cache_directory(new_cache_dir):
     """ Set default global HED cache directory.
@@ -85,36 +95,17 @@ def get_hed_versions(local_hed_directory=None, library_name=None, check_prerelea
     if not library_name:
         library_name = None
 
+    include_prerelease = check_prerelease and not local_hed_directory.endswith(prerelease_suffix)
+    manifest = _get_populated_manifest(local_hed_directory, include_prerelease)
     all_hed_versions = {}
-    local_directories = [local_hed_directory]
-    if check_prerelease and not local_hed_directory.endswith(prerelease_suffix):
-        local_directories.append(os.path.join(local_hed_directory, "prerelease"))
-
-    hed_files = []
-    for hed_dir in local_directories:
-        try:
-            hed_files += os.listdir(hed_dir)
-        except FileNotFoundError:
-            pass
-    if not hed_files:
-        cache_local_versions(local_hed_directory)
-        for hed_dir in local_directories:
-            try:
-                hed_files += os.listdir(hed_dir)
-            except FileNotFoundError:
-                pass
-    for hed_file in hed_files:
-        expression_match = version_pattern.match(hed_file)
-        if expression_match is not None:
-            version = expression_match.group(3)
-            found_library_name = expression_match.group(2)
+    for prerelease in (False, True) if include_prerelease else (False,):
+        for found_library_name, hed_versions in manifest["versions"][prerelease].items():
             if library_name != "all" and found_library_name != library_name:
                 continue
-            if found_library_name not in all_hed_versions:
-                all_hed_versions[found_library_name] = []
-            all_hed_versions[found_library_name].append(version)
-    for name, hed_versions in all_hed_versions.items():
-        all_hed_versions[name] = _sort_version_list(hed_versions)
+            all_hed_versions.setdefault(found_library_name, []).extend(hed_versions)
+    if include_prerelease:
+        for name, hed_versions in all_hed_versions.items():
+            all_hed_versions[name] = _sort_version_list(hed_versions)
     if library_name in all_hed_versions:
         return all_hed_versions[library_name]
     return all_hed_versions
@@ -135,11 +126,15 @@ def get_hed_version_path(xml_version, library_name=None, local_hed_directory=Non
     if not local_hed_directory:
         local_hed_directory = HED_CACHE_DIRECTORY
 
-    hed_versions = get_hed_versions(local_hed_directory, library_name, check_prerelease)
-    if not hed_versions or not xml_version:
+    include_prerelease = check_prerelease and not local_hed_directory.endswith(prerelease_suffix)
+    manifest = _get_populated_manifest(local_hed_directory, include_prerelease)
+    if not xml_version:
         return None
-    if xml_version in hed_versions:
-        return _create_xml_filename(xml_version, library_name, local_hed_directory, check_prerelease)
+    for prerelease in (False, True) if include_prerelease else (False,):
+        path = manifest["paths"].get((prerelease, library_name or None, xml_version))
+        if path:
+            return os.path.join(local_hed_directory, path)
+    return None
 
 
 def cache_local_versions(cache_folder):
@@ -158,6 +153,7 @@ def cache_local_versions(cache_folder):
     try:
         with CacheLock(cache_folder, write_time=False):
             _copy_installed_folder_to_cache(cache_folder)
+            _get_manifest(cache_folder, save=True)
     except CacheException:
         return -1
 
@@ -181,11 +177,16 @@ def cache_xml_versions(hed_base_urls=DEFAULT_URL_LIST, hed_library_urls=DEFAULT_
         - The HED cache folder defaults to HED_CACHE_DIRECTORY.
         - The directories on GitHub are of the form:
             https://api.github.com/repos/hed-standard/hed-schemas/contents/standard_schema
+        - If the cache was updated recently this returns -1 right away without taking the cache lock,
+          so looking up a missing version (for example when offline) fails fast.
 
     """
     if not cache_folder:
         cache_folder = HED_CACHE_DIRECTORY
 
+    if time.time() - get_last_cached_time(cache_folder) < CACHE_TIME_THRESHOLD:
+        return -1
+
     try:
         with CacheLock(cache_folder):
             if isinstance(hed_base_urls, str):
@@ -204,8 +205,9 @@ def cache_xml_versions(hed_base_urls=DEFAULT_URL_LIST, hed_library_urls=DEFAULT_
             for library_name, hed_versions in all_hed_versions.items():
                 for version, version_info in hed_versions.items():
                     _cache_hed_version(version, library_name, version_info, cache_folder=cache_folder)
+            _get_manifest(cache_folder, save=True)
 
-    except CacheException or ValueError or URLError:
+    except (CacheException, ValueError, URLError):
         return -1
 
     return 0
@@ -445,7 +447,7 @@ def _cache_hed_version(version, library_name, version_info, cache_folder):
     sha_hash, download_url, prerelease = version_info
 
     possible_cache_filename = _create_xml_filename(version, library_name, cache_folder, prerelease)
-    local_sha_hash = _calculate_sha1(possible_cache_filename)
+    local_sha_hash = _get_cached_sha1(cache_folder, possible_cache_filename)
 
     if sha_hash == local_sha_hash:
         return possible_cache_filename
@@ -463,3 +465,159 @@ def _cache_specific_url(source_url, cache_filename):
         os.remove(temp_filename)
         return cache_filename
     return None
+
+
+def _get_populated_manifest(cache_folder, include_prerelease):
+    """ Return the manifest of a folder, first copying the installed schemas into it if it has no files. """
+    manifest = _get_manifest(cache_folder)
+    if not manifest["files"][0] and not (include_prerelease and manifest["files"][1]):
+        cache_local_versions(cache_folder)
+        manifest = _get_manifest(cache_folder)
+    return manifest
+
+
+def _get_manifest(cache_folder, save=False):
+    """ Return the manifest of the schemas in a folder and its prerelease subfolder.
+
+    Parameters:
+        cache_folder (str): The folder to index.
+        save (bool): If True, always keep the manifest in the folder, even if it did not have one.
+
+    Returns:
+        dict: The manifest with "files", "schemas", "versions" and "paths" keys.
+
+    Notes:
+        - The manifest lists the library, version, prerelease status, sha1 and path of each schema.
+        - It is kept in memory and in MANIFEST_FILENAME, and only rebuilt when the names of the files
+          in the folders no longer match the ones it was built from.  The names are only listed again
+          when the modification time of one of the folders changes.
+        - The manifest is written to the HED cache directory, to folders that already have one and to folders
+          the schemas are cached into.
+    """
+    signature = _get_folder_signature(cache_folder)
+    manifest = _manifests.get(cache_folder)
+    if manifest is not None and manifest["signature"] == signature and (manifest["saved"] or not save):
+        return manifest
+
+    folder = os.path.realpath(cache_folder)
+    files = (_list_folder(folder), _list_folder(os.path.join(folder, "prerelease")))
+    if manifest is None or manifest["files"] != files or (save and not manifest["saved"]):
+        saved_manifest = _read_manifest(folder)
+        if saved_manifest is not None and saved_manifest["files"] == files:
+            manifest = saved_manifest
+        else:
+            manifest = _build_manifest(folder, files, saved_manifest or manifest)
+            if save or saved_manifest is not None or folder == os.path.realpath(HED_CACHE_DIRECTORY):
+                manifest["saved"] = _write_manifest(folder, manifest)
+    # Folders changed within the last second may still change without a new modification time.
+    settled_time = time.time_ns() - 1_000_000_000
+    manifest["signature"] = signature if all(mtime < settled_time for mtime in signature if mtime) else None
+    _manifests[cache_folder] = manifest
+    return manifest
+
+
+def _get_folder_signature(cache_folder):
+    """ Return the modification times of a folder and its prerelease subfolder (None if missing). """
+    signature = []
+    for folder in (cache_folder, os.path.join(cache_folder, "prerelease")):
+        try:
+            signature.append(os.stat(folder).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _list_folder(folder):
+    """ Return the sorted file names in a folder other than the manifest, or an empty tuple if it doesn't exist. """
+    try:
+        return tuple(sorted(name for name in os.listdir(folder) if not name.startswith(MANIFEST_FILENAME)))
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
+def _build_manifest(folder, files, previous_manifest=None):
+    """ Return a new manifest of the schema files, reusing the sha1 of files unchanged since previous_manifest. """
+    previous_records = {}
+    if previous_manifest:
+        previous_records = {record["path"]: record for record in previous_manifest["schemas"]}
+    records = []
+    for prerelease, names in zip((False, True), files):
+        for name in names:
+            expression_match = version_pattern.match(name)
+            if expression_match is None:
+                continue
+            path = f"prerelease/{name}" if prerelease else name
+            try:
+                stat = os.stat(os.path.join(folder, path))
+            except OSError:
+                continue
+            record = previous_records.get(path)
+            if not record or record["size"] != stat.st_size or record["mtime_ns"] != stat.st_mtime_ns:
+                record = {"library": expression_match.group(2) or "", "version": expression_match.group(3),
+                          "prerelease": prerelease, "sha1": _calculate_sha1(os.path.join(folder, path)),
+                          "path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            records.append(record)
+    return _index_manifest({"format": MANIFEST_FORMAT, "files": files, "schemas": records})
+
+
+def _index_manifest(manifest):
+    """ Add the sorted "versions" {prerelease: {library_name: [versions]}} and the "paths" lookup to a manifest. """
+    versions = {False: {}, True: {}}
+    paths = {}
+    for record in manifest["schemas"]:
+        library_name = record["library"] or None
+        versions[record["prerelease"]].setdefault(library_name, []).append(record["version"])
+        paths[(record["prerelease"], library_name, record["version"])] = record["path"]
+    for prerelease_versions in versions.values():
+        for library_name, hed_versions in prerelease_versions.items():
+            prerelease_versions[library_name] = _sort_version_list(hed_versions)
+    manifest["versions"] = versions
+    manifest["paths"] = paths
+    manifest["saved"] = False
+    manifest["signature"] = None
+    return manifest
+
+
+def _read_manifest(folder):
+    """ Return the manifest saved in a folder or None if it is missing or unreadable. """
+    try:
+        with open(os.path.join(folder, MANIFEST_FILENAME)) as file:
+            saved = json.load(file)
+        if saved["format"] != MANIFEST_FORMAT or \
+                not all(key in record for record in saved["schemas"] for key in MANIFEST_RECORD_KEYS):
+            return None
+        manifest = _index_manifest({"format": MANIFEST_FORMAT, "files": tuple(tuple(names) for names in saved["files"]),
+                                    "schemas": saved["schemas"]})
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    manifest["saved"] = True
+    return manifest
+
+
+def _write_manifest(folder, manifest):
+    """ Atomically replace the manifest saved in a folder and return True if it was written. """
+    contents = {key: manifest[key] for key in ("format", "files", "schemas")}
+    try:
+        with tempfile.NamedTemporaryFile("w", dir=folder, prefix=MANIFEST_FILENAME + ".", suffix=".tmp",
+                                         delete=False) as file:
+            json.dump(contents, file, indent=1)
+        os.replace(file.name, os.path.join(folder, MANIFEST_FILENAME))
+    except OSError:
+        return False
+    return True
+
+
+def _get_cached_sha1(cache_folder, filename):
+    """ Return the sha1 of a cached file from the manifest if the file is unchanged, otherwise compute it. """
+    folder = os.path.realpath(cache_folder)
+    path = os.path.relpath(os.path.realpath(filename), folder).replace(os.sep, "/")
+    for record in _get_manifest(cache_folder)["schemas"]:
+        if record["path"] != path:
+            continue
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        if record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+            return record["sha1"]
+    return _calculate_sha1(filename)
@@ -52,6 +52,19 @@ class CacheLock:
         self.cache_lock.release()
 
 
+def get_last_cached_time(cache_folder):
+    """ Return the time the given cache folder was last updated, or zero if it never was.
+
+    Parameters:
+        cache_folder (str): The folder we're caching hed schema in.
+
+    Returns:
+        float: The time we last updated the cache.
+
+    """
+    return _read_last_cached_time(cache_folder)
+
+
 def _read_last_cached_time(cache_folder):
     """ Check the given cache folder to see when it was last updated.
 
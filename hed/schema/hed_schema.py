@@ -1,3 +1,4 @@
+import copy
 import json
 
 
@@ -25,6 +26,7 @@ class HedSchema(HedSchemaBase):
             A HedSchema can be used for validation, checking tag attributes, parsing tags, etc.
         """
         super().__init__()
+        self._frozen = False
         self.header_attributes = {}
         self.filename = None
         self.prologue = ""
@@ -74,6 +76,55 @@ class HedSchema(HedSchemaBase):
         """Returns the schema namespace prefix"""
         return self._namespace
 
+    @property
+    def frozen(self):
+        """ Returns True if this schema is frozen and can no longer be modified. """
+        return self._frozen
+
+    def freeze(self):
+        """ Make this schema immutable, so it can be shared between threads and used as a cache key.
+
+        Returns:
+            HedSchema: This schema.
+
+        Notes:
+            - Schemas returned by load_schema_version are frozen, as the same object is returned to every caller.
+            - Afterwards setting attributes, set_schema_prefix and the loading functions raise an AttributeError.
+            - Use with_namespace for a view with another namespace, or copy.deepcopy for a modifiable copy.
+
+        """
+        if not self._frozen:
+            # Compute the lazily cached values now, so reading a frozen schema never writes to it.
+            self._schema83 = None
+            _ = self.schema_83_props
+            self._frozen = True
+        return self
+
+    def with_namespace(self, schema_namespace):
+        """ Return a frozen view of this schema that accepts tags with a different namespace.
+
+        Parameters:
+            schema_namespace (str): Should be empty, or end with a colon.(Colon will be automated added if missing).
+
+        Returns:
+            HedSchema: A schema sharing all the entries and sections of this one.
+
+        :raises HedFileError:
+            - The prefix is invalid
+
+        Notes:
+            - No entries are copied, so this is cheap enough to call per request.  This schema should not be
+              modified afterwards, as the changes would also appear in the view.
+
+        """
+        schema_namespace = self._format_namespace(schema_namespace)
+        if self._frozen and schema_namespace == self._namespace:
+            return self
+        view = copy.copy(self)
+        object.__setattr__(view, "_frozen", False)
+        view._namespace = schema_namespace
+        return view.freeze()
+
     def can_save(self):
         """ Returns if it's legal to save this schema.
 
@@ -336,6 +387,15 @@ class HedSchema(HedSchemaBase):
         Parameters:
             schema_namespace (str): Should be empty, or end with a colon.(Colon will be automated added if missing).
 
+        :raises HedFileError:
+            - The prefix is invalid
+        """
+        self._check_not_frozen()
+        self._namespace = self._format_namespace(schema_namespace)
+
+    def _format_namespace(self, schema_namespace):
+        """ Return the schema namespace ending with a colon.
+
         :raises HedFileError:
             - The prefix is invalid
         """
@@ -346,8 +406,30 @@ class HedSchema(HedSchemaBase):
             raise HedFileError(HedExceptions.INVALID_LIBRARY_PREFIX,
                                "Schema namespace must contain only alpha characters",
                                self.filename)
-
-        self._namespace = schema_namespace
+        return schema_namespace
+
+    def _check_not_frozen(self):
+        """ Raise an AttributeError if this schema is frozen. """
+        if self.__dict__.get("_frozen"):
+            raise AttributeError("A frozen HedSchema cannot be modified.  Use copy.deepcopy for a modifiable copy.")
+
+    def __setattr__(self, name, value):
+        self._check_not_frozen()
+        super().__setattr__(name, value)
+
+    def __deepcopy__(self, memo):
+        """ Return a deep copy of this schema, which is never frozen. """
+        new_schema = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_schema
+        new_schema.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        new_schema.__dict__["_frozen"] = False
+        return new_schema
+
+    def __hash__(self):
+        """ Frozen schemas are hashed by version, consistently with __eq__. """
+        if not self._frozen:
+            raise TypeError("unhashable type: 'HedSchema' that is not frozen")
+        return hash(self.version)
 
     def __eq__(self, other):
         """ Return True if these schema match exactly.
@@ -399,7 +481,7 @@ class HedSchema(HedSchemaBase):
     def __getitem__(self, section_key):
         return self._sections[section_key]
 
-    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None):
+    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None, workers=None):
         """ Check for HED3 compliance of this schema.
 
         Parameters:
@@ -407,12 +489,13 @@ class HedSchema(HedSchemaBase):
             name (str): If present, use as the filename for context, rather than using the actual filename.
                         Useful for temp filenames when supporting web services.
             error_handler (ErrorHandler or None): Used to report errors.  Uses a default one if none passed in.
+            workers (int or None): If greater than 1, the sections are checked by this many processes.
 
         Returns:
             list: A list of all warnings and errors found in the file. Each issue is a dictionary.
         """
         from hed.schema import schema_compliance
-        return schema_compliance.check_compliance(self, check_for_warnings, name, error_handler)
+        return schema_compliance.check_compliance(self, check_for_warnings, name, error_handler, workers)
 
     def get_tags_with_attribute(self, attribute, key_class=HedSectionKey.Tags):
         """ Return tag entries with the given attribute.
@@ -430,6 +513,23 @@ class HedSchema(HedSchemaBase):
         return self._sections[key_class].get_entries_with_attribute(attribute, return_name_only=True,
                                                                     schema_namespace=self._namespace)
 
+    def query_tags(self, query, key_class=HedSectionKey.Tags):
+        """ Return the names of the entries matching a query over their attributes.
+
+        Parameters:
+            query (str, tuple, or dict): An attribute name, an (attribute, value) pair, or a dict combining
+                queries with "and", "or" or "not".  See HedSchemaSection.query_entries.
+            key_class (HedSectionKey): The HedSectionKey for the section to retrieve from.
+
+        Returns:
+            list: The names of the matching entries, with the schema namespace.
+
+        :raises ValueError:
+            - The query is invalid.
+        """
+        return self._sections[key_class].query_entries(query, return_name_only=True,
+                                                       schema_namespace=self._namespace)
+
     def get_tag_entry(self, name, key_class=HedSectionKey.Tags, schema_namespace=""):
         """ Return the schema entry for this tag, if one exists.
 
@@ -601,6 +701,24 @@ class HedSchema(HedSchemaBase):
     # ===============================================
     # Semi-private creation finalizing functions
     # ===============================================
+    def _shared_copy(self):
+        """ Return a copy of this schema that shares its entries until loading or finalizing would change them.
+
+        Returns:
+            HedSchema: The new schema.
+
+        Notes:
+            - Used when loading a partnered library schema on top of a cached standard schema.
+            - The section containers are copied, while the entries are copied into the new schema by
+              finalize_dictionaries only if the added entries would change them, so this schema is never altered.
+
+        """
+        new_schema = copy.copy(self)
+        object.__setattr__(new_schema, "_frozen", False)
+        new_schema.header_attributes = self.header_attributes.copy()
+        new_schema._sections = {key: section._shared_copy() for key, section in self._sections.items()}
+        return new_schema
+
     def finalize_dictionaries(self):
         """ Call to finish loading. """
         # Kludge - Reset this here so it recalculates while having all properties
@@ -609,10 +727,70 @@ class HedSchema(HedSchemaBase):
 
     def _update_all_entries(self):
         """ Call finalize_entry on every schema entry(tag, unit, etc). """
-        for key_class, section in self._sections.items():
+        for key_class in self._sections:
             self._initialize_attributes(key_class)
+        self._own_changed_entries()
+        for section in self._sections.values():
             section._finalize_section(self)
 
+    def _own_changed_entries(self):
+        """ Copy the shared entries (see _shared_copy) whose finalized state depends on entries added here. """
+        sections = self._sections
+        for key_class in (HedSectionKey.Properties, HedSectionKey.Attributes, HedSectionKey.ValueClasses):
+            section = sections[key_class]
+            section._own_entries([entry for entry in section.all_entries if section._is_shared_and_changed(entry)])
+
+        # Units depend on the modifiers and unit classes on their units, so changed classes are copied with their units.
+        modifier_section = sections[HedSectionKey.UnitModifiers]
+        modifier_section._own_entries([entry for entry in modifier_section.all_entries
+                                       if modifier_section._is_shared_and_changed(entry)])
+        unit_section = sections[HedSectionKey.Units]
+        class_section = sections[HedSectionKey.UnitClasses]
+        modifiers_added = any(entry._section is modifier_section for entry in modifier_section.all_entries)
+        changed_units = {id(entry) for entry in unit_section.all_entries
+                         if entry._section is unit_section or modifiers_added
+                         or unit_section._is_shared_and_changed(entry)}
+        changed_classes = [entry for entry in class_section.all_entries
+                           if entry._section is class_section or class_section._is_shared_and_changed(entry)
+                           or any(id(unit_entry) in changed_units for unit_entry in entry._units)]
+        unit_copies = unit_section._own_entries([unit_entry for entry in changed_classes
+                                                 for unit_entry in entry._units])
+        class_section._own_entries(changed_classes)
+        for entry in class_section.all_entries:
+            if entry._section is class_section:
+                entry._units = [unit_copies.get(id(unit_entry), unit_entry) for unit_entry in entry._units]
+
+        # Tags depend on their whole top level tree, so a tree is copied entirely if anything in it changed.
+        # Tags added here also change the children of their parent, which may be in another tree.
+        tag_section = sections[HedSectionKey.Tags]
+        inheritance_changed = tag_section.inheritable_attributes != tag_section._get_inheritable_attributes(self)
+        changed_trees = set()
+        for entry in tag_section.all_entries:
+            if entry._section is tag_section:
+                parent_entry = self._get_tag_entry(entry.name.rpartition("/")[0])
+                if parent_entry is not None:
+                    changed_trees.add(parent_entry.long_tag_name.partition("/")[0])
+            elif not inheritance_changed and not tag_section._is_shared_and_changed(entry) and \
+                    not self._tag_classes_changed(entry):
+                continue
+            changed_trees.add(entry.long_tag_name.partition("/")[0])
+        tag_section._own_entries([entry for entry in tag_section.all_entries
+                                  if entry.long_tag_name.partition("/")[0] in changed_trees])
+
+    def _tag_classes_changed(self, tag_entry):
+        """ Return True if the unit or value classes of a takes value tag are not the entries in this schema. """
+        if not tag_entry.name.endswith("/#"):
+            return False
+        for classes, attribute_key, section_key in ((tag_entry.unit_classes, HedKey.UnitClass,
+                                                     HedSectionKey.UnitClasses),
+                                                    (tag_entry.value_classes, HedKey.ValueClass,
+                                                     HedSectionKey.ValueClasses)):
+            new_classes = tag_entry._finalize_classes(self, attribute_key, section_key)
+            if new_classes.keys() != classes.keys() or \
+                    any(classes[name] is not class_entry for name, class_entry in new_classes.items()):
+                return True
+        return False
+
     def _initialize_attributes(self, key_class):
         """ Set the valid attributes for a section.
 
@@ -620,6 +798,7 @@ class HedSchema(HedSchemaBase):
             key_class (HedSectionKey): The section key for the section to update.
 
         """
+        self._check_not_frozen()
         self._sections[key_class].valid_attributes = self._get_attributes_for_section(key_class)
 
     # ===============================================
@@ -737,6 +916,7 @@ class HedSchema(HedSchemaBase):
     # Semi private function used to create a schema in memory(usually from a source file)
     # ===============================================
     def _add_tag_to_dict(self, long_tag_name, new_entry, key_class):
+        self._check_not_frozen()
         section = self._sections[key_class]
         return section._add_to_dict(long_tag_name, new_entry)
 
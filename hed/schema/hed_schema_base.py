@@ -97,6 +97,23 @@ class HedSchemaBase(ABC):
         """
         raise NotImplementedError("This function must be implemented in the baseclass")
 
+    @abstractmethod
+    def query_tags(self, query, key_class=HedSectionKey.Tags):
+        """ Return the names of the entries matching a query over their attributes.
+
+        Parameters:
+            query (str, tuple, or dict): An attribute name, an (attribute, value) pair, or a dict combining
+                queries with "and", "or" or "not".  See HedSchemaSection.query_entries.
+            key_class (HedSectionKey): The HedSectionKey for the section to retrieve from.
+
+        Returns:
+            list: The names of the matching entries, with the schema namespace.
+
+        :raises ValueError:
+            - The query is invalid.
+        """
+        raise NotImplementedError("This function must be implemented in the baseclass")
+
     # todo: maybe tweak this API so you don't have to pass in library namespace?
     @abstractmethod
     def get_tag_entry(self, name, key_class=HedSectionKey.Tags, schema_namespace=""):
@@ -132,12 +149,55 @@ class HedSchemaBase(ABC):
         """
         raise NotImplementedError("This function must be implemented in the baseclass")
 
+    def resolve_many(self, tags):
+        """ Find the schema entries and canonical forms of many tags at once.
+
+        Parameters:
+            tags (list of str): Tags in any form.  They can have a schema namespace, an extension, a value, etc.
+
+        Returns:
+            list: The HedTagEntry of each tag or None if it could not be found.
+            list: The long form of each tag, or the tag itself if it could not be found.
+            list: The short form of each tag, or the tag itself if it could not be found.
+            list: The remainder of each tag that isn't part of the base tag, or None if it could not be found.
+            list: A list of the conversion issues of each tag.
+
+        Notes:
+            - The forms are the same as the long_tag and short_tag of a HedTag made from each tag.
+            - Each distinct tag is only looked up once, so this is meant for converting many tags with repeats,
+              such as the unique tags of a sidecar or a batch of queries.
+
+        """
+        from hed.models.hed_tag import HedTag
+        resolved = {}
+        for tag in tags:
+            if tag in resolved:
+                continue
+            schema_namespace = HedTag._get_schema_namespace(tag)
+            entry, remainder, issues = self.find_tag_entry(tag, schema_namespace)
+            if entry:
+                extension = remainder if remainder else ""
+                resolved[tag] = (entry, f"{schema_namespace}{entry.long_tag_name}{extension}",
+                                 f"{schema_namespace}{entry.short_tag_name}{extension}", remainder, issues)
+            else:
+                resolved[tag] = (None, tag, tag, remainder, issues)
+
+        entries, long_tags, short_tags, remainders, issues_list = [], [], [], [], []
+        for tag in tags:
+            entry, long_tag, short_tag, remainder, issues = resolved[tag]
+            entries.append(entry)
+            long_tags.append(long_tag)
+            short_tags.append(short_tag)
+            remainders.append(remainder)
+            issues_list.append(list(issues))
+        return entries, long_tags, short_tags, remainders, issues_list
+
     @abstractmethod
     def __eq__(self, other):
         raise NotImplementedError("This function must be implemented in the baseclass")
 
     @abstractmethod
-    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None):
+    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None, workers=None):
         """ Check for HED3 compliance of this schema.
 
         Parameters:
@@ -145,6 +205,7 @@ class HedSchemaBase(ABC):
             name (str): If present, use as the filename for context, rather than using the actual filename.
                         Useful for temp filenames when supporting web services.
             error_handler (ErrorHandler or None): Used to report errors.  Uses a default one if none passed in.
+            workers (int or None): If greater than 1, the sections are checked by this many processes.
 
         Returns:
             list: A list of all warnings and errors found in the file. Each issue is a dictionary.
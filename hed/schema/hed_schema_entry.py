@@ -1,6 +1,8 @@
 from hed.schema.hed_schema_constants import HedSectionKey
 from hed.schema.hed_schema_constants import HedKey
 
+import copy
+import hashlib
 import inflect
 
 pluralize = inflect.engine()
@@ -31,6 +33,9 @@ class HedSchemaEntry:
         # that isn't valid in this section.
         self._unknown_attributes = None
 
+        # Digest of the compared content, computed on first use after the entry is finalized.
+        self._fingerprint = None
+
     def finalize_entry(self, schema):
         """ Called once after loading to set internal state.
 
@@ -48,6 +53,45 @@ class HedSchemaEntry:
             for item in to_remove:
                 self._unknown_attributes.pop(item)
 
+    def _copy_to_section(self, section):
+        """ Return a copy of this entry that belongs to section and can be finalized without altering this one.
+
+        Parameters:
+            section (HedSchemaSection):  The section the copy belongs to.
+
+        Returns:
+            HedSchemaEntry: The copy.
+
+        """
+        new_entry = copy.copy(self)
+        new_entry._section = section
+        new_entry.attributes = self.attributes.copy()
+        if self._unknown_attributes is not None:
+            new_entry._unknown_attributes = self._unknown_attributes.copy()
+        return new_entry
+
+    @property
+    def fingerprint(self):
+        """ A digest of the content that == compares, so entries with different fingerprints are not equal.
+
+        Returns:
+            str: A hex digest of the name, attributes and description (and of the units of a unit class or
+                 the inherited attributes of a tag).
+
+        Notes:
+            - The digest does not depend on the order of attributes or of comma separated attribute values.
+            - It is computed once and kept until the entry is finalized again.
+
+        """
+        if self._fingerprint is None:
+            content = repr(self._get_fingerprint_content()).encode()
+            self._fingerprint = hashlib.blake2b(content, digest_size=16).hexdigest()
+        return self._fingerprint
+
+    def _get_fingerprint_content(self):
+        """ Return the content compared by __eq__ in a form that does not depend on attribute order. """
+        return self.name, self._get_unordered_attributes(self.attributes), self.description
+
     def has_attribute(self, attribute, return_value=False):
         """ Checks for the existence of an attribute in this entry.
 
@@ -105,6 +149,7 @@ class HedSchemaEntry:
                 self._unknown_attributes = {}
             self._unknown_attributes[attribute] = attribute_value
         self.attributes[attribute] = attribute_value
+        self._fingerprint = None
 
     @property
     def section_key(self):
@@ -135,6 +180,12 @@ class HedSchemaEntry:
 
         return left == right
 
+    @staticmethod
+    def _get_unordered_attributes(attributes):
+        """ Return the attributes as sorted pairs, which are equal if _compare_attributes_no_order is True. """
+        return sorted((name, tuple(sorted(set(value.split(",")))) if isinstance(value, str) else value)
+                      for name, value in attributes.items())
+
 
 class UnitClassEntry(HedSchemaEntry):
     """ A single unit class entry in the HedSchema. """
@@ -163,6 +214,13 @@ class UnitClassEntry(HedSchemaEntry):
         """
         self._units.append(unit_entry)
 
+    def _copy_to_section(self, section):
+        new_entry = super()._copy_to_section(section)
+        new_entry._units = self._units.copy()
+        new_entry.units = self.units.copy()
+        new_entry.derivative_units = self.derivative_units.copy()
+        return new_entry
+
     def finalize_entry(self, schema):
         """ Called once after schema load to set state.
 
@@ -186,6 +244,10 @@ class UnitClassEntry(HedSchemaEntry):
             return False
         return True
 
+    def _get_fingerprint_content(self):
+        units = sorted((name, unit_entry.fingerprint) for name, unit_entry in self.units.items())
+        return super()._get_fingerprint_content(), units
+
     def get_derivative_unit_entry(self, units):
         """ Gets the (derivative) unit entry if it exists
 
@@ -216,6 +278,12 @@ class UnitEntry(HedSchemaEntry):
         self.derivative_units = {}
         self.unit_class_entry = None
 
+    def _copy_to_section(self, section):
+        new_entry = super()._copy_to_section(section)
+        new_entry.unit_modifiers = self.unit_modifiers.copy()
+        new_entry.derivative_units = self.derivative_units.copy()
+        return new_entry
+
     def finalize_entry(self, schema):
         """ Called once after loading to set internal state.
 
@@ -277,6 +345,17 @@ class HedTagEntry(HedSchemaEntry):
         # Descendent tags below this one
         self.children = {}
 
+    def _copy_to_section(self, section):
+        new_entry = super()._copy_to_section(section)
+        if self.inherited_attributes is self.attributes:
+            new_entry.inherited_attributes = new_entry.attributes
+        else:
+            new_entry.inherited_attributes = self.inherited_attributes.copy()
+        new_entry.unit_classes = self.unit_classes.copy()
+        new_entry.value_classes = self.value_classes.copy()
+        new_entry.children = self.children.copy()
+        return new_entry
+
     def __eq__(self, other):
         if not super().__eq__(other):
             return False
@@ -284,6 +363,9 @@ class HedTagEntry(HedSchemaEntry):
             return False
         return True
 
+    def _get_fingerprint_content(self):
+        return super()._get_fingerprint_content(), self._get_unordered_attributes(self.inherited_attributes)
+
     def has_attribute(self, attribute, return_value=False):
         """ Returns th existence or value of an attribute in this entry.
 
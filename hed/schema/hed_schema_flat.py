@@ -0,0 +1,528 @@
+""" A read-only, array-backed form of a HedSchema that can be shared between processes without copying. """
+import json
+import mmap
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from hed.errors import ErrorHandler
+from hed.errors.error_types import ValidationErrors
+from hed.errors.exceptions import HedFileError, HedExceptions
+from hed.schema.hed_schema_constants import HedKey, HedSectionKey
+from hed.schema.hed_schema_base import HedSchemaBase
+
+FLAT_SCHEMA_MAGIC = b"HEDFLAT1"
+_ALIGNMENT = 8
+# Value id for attributes whose value is True rather than a string.
+_TRUE_VALUE = -1
+
+
+class FlatTagEntry:
+    """ A lightweight view of one tag in a FlatHedSchema.
+
+        Provides the parts of the HedTagEntry interface used to identify and convert tags.
+    """
+
+    def __init__(self, flat_schema, index):
+        self._flat_schema = flat_schema
+        self.index = index
+        self.name = flat_schema._get_string("tag_names", index)
+        self.long_tag_name = self.name[:-2] if self.name.endswith("/#") else self.name
+        self.short_tag_name = self.long_tag_name.rpartition("/")[2]
+        self.tag_terms = tuple(self.long_tag_name.casefold().split("/"))
+
+    @property
+    def parent(self):
+        """ The parent FlatTagEntry of this tag, or None. """
+        return self._flat_schema._get_entry(int(self._flat_schema._arrays["tag_parents"][self.index]))
+
+    @property
+    def takes_value_child_entry(self):
+        """ The child takes value FlatTagEntry of this tag, or None. """
+        return self._flat_schema._get_entry(int(self._flat_schema._arrays["tag_value_children"][self.index]))
+
+    @property
+    def attributes(self):
+        """ A dict of the attributes of this tag, including inherited ones. """
+        return self._flat_schema._get_attributes(self.index)
+
+    @property
+    def unit_class_names(self):
+        """ The names of the unit classes this tag accepts. """
+        return self._flat_schema._get_class_names("unit_class", self.index)
+
+    @property
+    def value_class_names(self):
+        """ The names of the value classes this tag accepts. """
+        return self._flat_schema._get_class_names("value_class", self.index)
+
+    def has_attribute(self, attribute, return_value=False):
+        """ Return the existence or value of an attribute of this tag, including inherited attributes.
+
+        Parameters:
+            attribute (str): The attribute to check for.
+            return_value (bool): If True, returns the actual value of the attribute.
+
+        Returns:
+            bool or any: The presence of the attribute or its value (None if absent).
+        """
+        if not return_value:
+            return self._flat_schema._has_attribute_bit(self.index, attribute)
+        return self.attributes.get(attribute)
+
+    def base_tag_has_attribute(self, tag_attribute):
+        """ Check if the base tag has a specific attribute.
+
+        Parameters:
+            tag_attribute (str): A tag attribute.
+
+        Returns:
+            bool: True if the tag has the specified attribute. False, if otherwise.
+        """
+        base_entry = self
+        if self.has_attribute(HedKey.TakesValue):
+            base_entry = base_entry.parent
+        return base_entry.has_attribute(tag_attribute)
+
+    def __eq__(self, other):
+        if not isinstance(other, FlatTagEntry):
+            return False
+        return self.name == other.name and self.attributes == other.attributes
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __str__(self):
+        return self.name
+
+
+class FlatHedSchema:
+    """ A read-only, flat, array-backed HED schema.
+
+        Tags are stored as a term table with parent indices, attribute bitsets and unit/value class tables, all
+        in one contiguous buffer.  The buffer can be a bytes object, a memory-mapped file or a shared memory block,
+        and the arrays are numpy views into it, so attaching from another process does not copy the schema.
+
+    Notes:
+        - Supports tag identification and conversion (long/short forms, terms, attributes).
+        - Validation still requires a full HedSchema.
+    """
+
+    def __init__(self, buffer, _owner=None):
+        """ Attach to a buffer created by FlatHedSchema.from_schema.
+
+        Parameters:
+            buffer (bytes, memoryview, mmap or similar): The buffer holding a flat schema.
+            _owner (SharedMemory, mmap or None): Object that must be kept alive while the buffer is in use.
+
+        :raises HedFileError:
+            - The buffer does not hold a flat schema.
+        """
+        self._buffer = memoryview(buffer)
+        self._owner = _owner
+        if bytes(self._buffer[:len(FLAT_SCHEMA_MAGIC)]) != FLAT_SCHEMA_MAGIC:
+            raise HedFileError(HedExceptions.CANNOT_PARSE_XML, "Buffer does not contain a flat HED schema", "")
+        header_len = int(np.frombuffer(self._buffer, dtype=np.uint64, count=1, offset=len(FLAT_SCHEMA_MAGIC))[0])
+        header_start = len(FLAT_SCHEMA_MAGIC) + _ALIGNMENT
+        header = json.loads(bytes(self._buffer[header_start:header_start + header_len]).decode("utf-8"))
+        self.header_attributes = header["header_attributes"]
+        self._namespace = header["namespace"]
+        self._attribute_names = header["attribute_names"]
+        self._attribute_ids = {name: index for index, name in enumerate(self._attribute_names)}
+        self._arrays = {name: np.frombuffer(self._buffer, dtype=np.dtype(dtype), count=count, offset=offset)
+                        for name, (dtype, count, offset) in header["arrays"].items()}
+        self._arrays["attribute_bits"] = self._arrays["attribute_bits"].reshape(-1, header["attribute_words"])
+        self._entry_cache = {}
+
+    # ===============================================
+    # Creation, saving and sharing
+    # ===============================================
+    @classmethod
+    def from_schema(cls, hed_schema):
+        """ Create a flat schema from a loaded HedSchema.
+
+        Parameters:
+            hed_schema (HedSchema): The schema to flatten.
+
+        Returns:
+            FlatHedSchema: The flat schema backed by an in-memory bytes buffer.
+        """
+        return cls(_flatten_schema(hed_schema))
+
+    @classmethod
+    def load(cls, filename):
+        """ Memory-map a flat schema file saved with save.
+
+        Parameters:
+            filename (str): The file to map.
+
+        Returns:
+            FlatHedSchema: The flat schema backed by a read-only memory map of the file.
+        """
+        with open(filename, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, _owner=mapped)
+
+    @classmethod
+    def from_shared_memory(cls, name):
+        """ Attach to a flat schema placed in shared memory by to_shared_memory.
+
+        Parameters:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            FlatHedSchema: The flat schema backed by the shared memory block.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm.buf[:shm.size], _owner=shm)
+
+    def to_bytes(self):
+        """ Return the serialized flat schema. """
+        return bytes(self._buffer)
+
+    def save(self, filename):
+        """ Save the flat schema so that it can be memory-mapped with load.
+
+        Parameters:
+            filename (str): The file to write.
+        """
+        with open(filename, "wb") as file:
+            file.write(self._buffer)
+
+    def to_shared_memory(self, name=None):
+        """ Copy the flat schema into a new shared memory block.
+
+        Parameters:
+            name (str or None): The name of the block, or None to generate one.
+
+        Returns:
+            SharedMemory: The block.  The caller owns it and must close and unlink it when done.
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(self._buffer))
+        shm.buf[:len(self._buffer)] = self._buffer
+        return shm
+
+    def close(self):
+        """ Release the buffer.  The schema cannot be used afterwards. """
+        self._arrays = {}
+        self._entry_cache = {}
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __del__(self):
+        # The numpy views must be dropped before the shared memory or memory map they point into is closed.
+        if getattr(self, "_buffer", None) is not None:
+            self.close()
+
+    def __reduce__(self):
+        # Shared memory schemas are pickled by name, so sending one to a worker does not copy it.
+        if isinstance(self._owner, shared_memory.SharedMemory):
+            return FlatHedSchema.from_shared_memory, (self._owner.name,)
+        return FlatHedSchema, (self.to_bytes(),)
+
+    # ===============================================
+    # Schema interface used by HedTag
+    # ===============================================
+    @property
+    def version(self):
+        """ The complete schema version, including prefix and library name(if applicable). """
+        libraries = self.header_attributes.get("library", "").split(",")
+        versions = self.header_attributes.get("version", "").split(",")
+        namespace = self._namespace
+        combined_versions = [f"{namespace}{version}" if not library else f"{namespace}{library}_{version}"
+                             for library, version in zip(libraries, versions)]
+        return ",".join(combined_versions)
+
+    @property
+    def schema_namespace(self):
+        """ Returns the schema namespace prefix. """
+        return self._namespace
+
+    @property
+    def valid_prefixes(self):
+        """ Return a list of all prefixes this schema will accept. """
+        return [self._namespace]
+
+    def __len__(self):
+        return len(self._arrays["tag_parents"])
+
+    def get_tag_entry(self, name, key_class=HedSectionKey.Tags, schema_namespace=""):
+        """ Return the entry for this tag, if one exists.
+
+        Parameters:
+            name (str): Any form of basic tag to look up.  This will not handle extensions or similar.
+            key_class (HedSectionKey): Only HedSectionKey.Tags is stored in a flat schema.
+            schema_namespace (str): If incorrect, will return None.
+
+        Returns:
+            FlatTagEntry or None: The entry for the given tag.
+        """
+        if key_class != HedSectionKey.Tags or schema_namespace != self._namespace:
+            return None
+        if name.startswith(self._namespace):
+            name = name[len(self._namespace):]
+        return self._get_entry(self._lookup(name))
+
+    def find_tag_entry(self, tag, schema_namespace=""):
+        """ Find the entry for a given source tag.
+
+        Parameters:
+            tag (str, HedTag): Any form of tag to look up.  Can have an extension, value, etc.
+            schema_namespace (str): The schema namespace of the tag, if any.
+
+        Returns:
+            FlatTagEntry: The located tag entry for this tag.
+            str: The remainder of the tag that isn't part of the base tag.
+            list: A list of errors while converting.
+
+        Notes:
+            - Identifies tags exactly as HedSchema.find_tag_entry does.
+        """
+        if schema_namespace != self._namespace:
+            validation_issues = ErrorHandler.format_error(ValidationErrors.HED_LIBRARY_UNMATCHED, tag,
+                                                          schema_namespace, self.valid_prefixes)
+            return None, None, validation_issues
+        clean_tag = str(tag)[len(schema_namespace):]
+        working_tag = clean_tag.casefold()
+
+        found_index = self._lookup(working_tag)
+        if found_index != -1:
+            remainder = working_tag[-2:] if working_tag.endswith("/#") else ""
+            return self._get_entry(found_index), remainder, []
+
+        prefix_tag_adj = len(schema_namespace)
+        current_slash_index = -1
+        current_index = -1
+        while True:
+            next_index = working_tag.find("/", current_slash_index + 1)
+            if next_index == -1:
+                next_index = len(working_tag)
+            parent_index = self._lookup(working_tag[:next_index])
+            if parent_index == -1:
+                if current_index == -1:
+                    return None, None, ErrorHandler.format_error(ValidationErrors.NO_VALID_TAG_FOUND, tag,
+                                                                 index_in_tag=prefix_tag_adj,
+                                                                 index_in_tag_end=prefix_tag_adj + next_index)
+                if self._arrays["tag_value_children"][current_index] == -1:
+                    issues = self._validate_remaining_terms(tag, working_tag, prefix_tag_adj, current_slash_index)
+                    if issues:
+                        return None, None, issues
+                break
+            current_index = parent_index
+            current_slash_index = next_index
+            if next_index == len(working_tag):
+                break
+
+        found_entry = self._get_entry(current_index)
+        remainder = clean_tag[current_slash_index:] if current_slash_index != -1 else None
+        if remainder and found_entry.takes_value_child_entry:
+            found_entry = found_entry.takes_value_child_entry
+        return found_entry, remainder, []
+
+    def resolve_many(self, tags):
+        """ Find the schema entries and canonical forms of many tags at once, as HedSchemaBase.resolve_many does.
+
+        Parameters:
+            tags (list of str): Tags in any form.  They can have a schema namespace, an extension, a value, etc.
+
+        Returns:
+            tuple: Parallel lists of the entries, long forms, short forms, remainders and issues of the tags.
+        """
+        return HedSchemaBase.resolve_many(self, tags)
+
+    def get_tags_with_attribute(self, attribute, key_class=HedSectionKey.Tags):
+        """ Return the names of the tags with the given attribute.
+
+        Parameters:
+            attribute (str): A tag attribute.  Eg HedKey.ExtensionAllowed
+            key_class (HedSectionKey): Only HedSectionKey.Tags is stored in a flat schema.
+
+        Returns:
+            list: A list of all tag names with this attribute.
+        """
+        attribute_id = self._attribute_ids.get(attribute)
+        if key_class != HedSectionKey.Tags or attribute_id is None:
+            return []
+        word, bit = divmod(attribute_id, 64)
+        mask = np.uint64(1) << np.uint64(bit)
+        indices = np.flatnonzero(self._arrays["attribute_bits"][:, word] & mask)
+        return [f"{self._namespace}{self._get_string('tag_names', index)}" for index in indices]
+
+    # ===============================================
+    # Private lookup functions
+    # ===============================================
+    def _validate_remaining_terms(self, tag, working_tag, prefix_tag_adj, current_slash_index):
+        word_start_index = current_slash_index + 1 + prefix_tag_adj
+        for name in working_tag[current_slash_index + 1:].split("/"):
+            found_index = self._lookup(name)
+            if found_index != -1:
+                return ErrorHandler.format_error(ValidationErrors.INVALID_PARENT_NODE, tag,
+                                                 index_in_tag=word_start_index,
+                                                 index_in_tag_end=word_start_index + len(name),
+                                                 expected_parent_tag=self._get_entry(found_index).name)
+            word_start_index += len(name) + 1
+        return []
+
+    def _lookup(self, name):
+        """ Return the index of the tag with this (casefolded) long or short form, or -1. """
+        keys = self._arrays["lookup_keys"]
+        key = name.casefold().encode("utf-8")
+        if not key or len(key) > keys.dtype.itemsize:
+            return -1
+        position = int(np.searchsorted(keys, key))
+        if position < len(keys) and keys[position] == key:
+            return int(self._arrays["lookup_indices"][position])
+        return -1
+
+    def _get_entry(self, index):
+        if index < 0:
+            return None
+        entry = self._entry_cache.get(index)
+        if entry is None:
+            entry = FlatTagEntry(self, index)
+            self._entry_cache[index] = entry
+        return entry
+
+    def _get_string(self, table, index):
+        offsets = self._arrays[f"{table}_offsets"]
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        return bytes(self._arrays[f"{table}_blob"][start:end]).decode("utf-8")
+
+    def _has_attribute_bit(self, index, attribute):
+        attribute_id = self._attribute_ids.get(attribute)
+        if attribute_id is None:
+            return False
+        word, bit = divmod(attribute_id, 64)
+        return bool((int(self._arrays["attribute_bits"][index, word]) >> bit) & 1)
+
+    def _get_attributes(self, index):
+        offsets = self._arrays["attribute_value_offsets"]
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        attributes = {}
+        for attribute_id, value_id in zip(self._arrays["attribute_value_ids"][start:end],
+                                          self._arrays["attribute_value_strings"][start:end]):
+            value = True if value_id == _TRUE_VALUE else self._get_string("strings", int(value_id))
+            attributes[self._attribute_names[attribute_id]] = value
+        return attributes
+
+    def _get_class_names(self, table, index):
+        offsets = self._arrays[f"tag_{table}_offsets"]
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        return tuple(self._get_string(f"{table}_names", int(class_id))
+                     for class_id in self._arrays[f"tag_{table}_ids"][start:end])
+
+
+def _string_table(strings):
+    """ Encode a list of strings as a utf-8 blob plus int32 offsets. """
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _csr_table(rows):
+    """ Encode a list of int lists as int32 offsets plus int32 values. """
+    offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(row) for row in rows], dtype=np.int64)
+    values = np.array([value for row in rows for value in row], dtype=np.int32)
+    return offsets, values
+
+
+def _flatten_schema(hed_schema):
+    """ Serialize the tag, unit class and value class information of a schema into one buffer. """
+    tag_entries = list(hed_schema.tags.all_entries)
+    tag_ids = {id(entry): index for index, entry in enumerate(tag_entries)}
+    unit_class_names = list(hed_schema.unit_classes.keys())
+    unit_class_ids = {name: index for index, name in enumerate(unit_class_names)}
+    value_class_names = list(hed_schema.value_classes.keys())
+    value_class_ids = {name: index for index, name in enumerate(value_class_names)}
+
+    attribute_names = sorted({name for entry in tag_entries for name in entry.inherited_attributes})
+    attribute_ids = {name: index for index, name in enumerate(attribute_names)}
+    attribute_words = max(1, (len(attribute_names) + 63) // 64)
+    attribute_bits = np.zeros((len(tag_entries), attribute_words), dtype=np.uint64)
+
+    strings, string_ids = [], {}
+    value_rows, value_string_rows = [], []
+    for index, entry in enumerate(tag_entries):
+        row_ids, row_strings = [], []
+        for name, value in entry.inherited_attributes.items():
+            attribute_id = attribute_ids[name]
+            word, bit = divmod(attribute_id, 64)
+            attribute_bits[index, word] |= np.uint64(1) << np.uint64(bit)
+            if isinstance(value, str):
+                if value not in string_ids:
+                    string_ids[value] = len(strings)
+                    strings.append(value)
+                value_id = string_ids[value]
+            else:
+                value_id = _TRUE_VALUE
+            row_ids.append(attribute_id)
+            row_strings.append(value_id)
+        value_rows.append(row_ids)
+        value_string_rows.append(row_strings)
+
+    lookup = sorted((key.encode("utf-8"), tag_ids[id(entry)])
+                    for key, entry in hed_schema.tags.long_form_tags.items())
+    max_key_len = max((len(key) for key, _ in lookup), default=1)
+
+    arrays = {}
+    arrays["tag_names_blob"], arrays["tag_names_offsets"] = _string_table([entry.name for entry in tag_entries])
+    arrays["strings_blob"], arrays["strings_offsets"] = _string_table(strings)
+    arrays["unit_class_names_blob"], arrays["unit_class_names_offsets"] = _string_table(unit_class_names)
+    arrays["value_class_names_blob"], arrays["value_class_names_offsets"] = _string_table(value_class_names)
+    arrays["tag_parents"] = np.array([tag_ids.get(id(entry.parent), -1) for entry in tag_entries], dtype=np.int32)
+    arrays["tag_value_children"] = np.array([tag_ids.get(id(entry.takes_value_child_entry), -1)
+                                             for entry in tag_entries], dtype=np.int32)
+    arrays["attribute_bits"] = attribute_bits.reshape(-1)
+    arrays["attribute_value_offsets"], arrays["attribute_value_ids"] = _csr_table(value_rows)
+    arrays["attribute_value_strings"] = _csr_table(value_string_rows)[1]
+    arrays["tag_unit_class_offsets"], arrays["tag_unit_class_ids"] = \
+        _csr_table([[unit_class_ids[name] for name in entry.unit_classes] for entry in tag_entries])
+    arrays["tag_value_class_offsets"], arrays["tag_value_class_ids"] = \
+        _csr_table([[value_class_ids[name] for name in entry.value_classes] for entry in tag_entries])
+    arrays["lookup_keys"] = np.array([key for key, _ in lookup], dtype=f"S{max_key_len}")
+    arrays["lookup_indices"] = np.array([index for _, index in lookup], dtype=np.int32)
+
+    header = {
+        "header_attributes": hed_schema.header_attributes,
+        "namespace": hed_schema.schema_namespace,
+        "attribute_names": attribute_names,
+        "attribute_words": attribute_words,
+        "arrays": {}
+    }
+    return _pack(header, arrays)
+
+
+def _pack(header, arrays):
+    """ Lay out the header and arrays in one aligned buffer. """
+    def aligned(position):
+        return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+    # The header holds the array offsets, so lay out the arrays after the space reserved for the header
+    # and redo the layout with more space until the resulting header fits.
+    header_start = len(FLAT_SCHEMA_MAGIC) + _ALIGNMENT
+    header_space = 0
+    while True:
+        first_offset = aligned(header_start + header_space)
+        position = first_offset
+        for name, array in arrays.items():
+            header["arrays"][name] = (array.dtype.str, len(array), position)
+            position = aligned(position + array.nbytes)
+        header_bytes = json.dumps(header).encode("utf-8")
+        if header_start + len(header_bytes) <= first_offset:
+            break
+        header_space = len(header_bytes) + 64
+
+    buffer = bytearray(position)
+    buffer[:len(FLAT_SCHEMA_MAGIC)] = FLAT_SCHEMA_MAGIC
+    buffer[len(FLAT_SCHEMA_MAGIC):header_start] = np.uint64(len(header_bytes)).tobytes()
+    buffer[header_start:header_start + len(header_bytes)] = header_bytes
+    for name, array in arrays.items():
+        _, _, offset = header["arrays"][name]
+        buffer[offset:offset + array.nbytes] = array.tobytes()
+    return bytes(buffer)
@@ -44,6 +44,8 @@ class HedSchemaGroup(HedSchemaBase):
         # All must be same source format or return None.
         self.source_format = source_formats[0] if len(set(source_formats)) == 1 else None
         self._name = name
+        # Names with each attribute in all the schemas, keyed by (attribute, key_class).
+        self._attribute_tags = {}
 
     def get_schema_versions(self):
         """ A list of HED version strings including namespace and library name if any of this schema.
@@ -87,7 +89,7 @@ class HedSchemaGroup(HedSchemaBase):
         """
         return list(self._schemas.keys())
 
-    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None):
+    def check_compliance(self, check_for_warnings=True, name=None, error_handler=None, workers=None):
         """ Check for HED3 compliance of this schema.
 
         Parameters:
@@ -95,13 +97,14 @@ class HedSchemaGroup(HedSchemaBase):
             name (str): If present, use as the filename for context, rather than using the actual filename.
                         Useful for temp filenames when supporting web services.
             error_handler (ErrorHandler or None): Used to report errors.  Uses a default one if none passed in.
+            workers (int or None): If greater than 1, the sections are checked by this many processes.
 
         Returns:
             list: A list of all warnings and errors found in the file. Each issue is a dictionary.
         """
         issues_list = []
         for schema in self._schemas.values():
-            issues_list += schema.check_compliance(check_for_warnings, name, error_handler)
+            issues_list += schema.check_compliance(check_for_warnings, name, error_handler, workers)
         return issues_list
 
     def get_tags_with_attribute(self, attribute, key_class=HedSectionKey.Tags):
@@ -116,11 +119,30 @@ class HedSchemaGroup(HedSchemaBase):
 
         Notes:
             - The result is cached so will be fast after first call.
+            - Schemas of the group that differ only in namespace share the attribute index of their sections.
         """
-        tags = set()
-        for schema in self._schemas.values():
-            tags.update(schema.get_tags_with_attribute(attribute, key_class))
-        return list(tags)
+        if (attribute, key_class) not in self._attribute_tags:
+            self._attribute_tags[(attribute, key_class)] = \
+                tuple(dict.fromkeys(tag for schema in self._schemas.values()
+                                    for tag in schema.get_tags_with_attribute(attribute, key_class)))
+        return list(self._attribute_tags[(attribute, key_class)])
+
+    def query_tags(self, query, key_class=HedSectionKey.Tags):
+        """ Return the names of the entries matching a query over their attributes in any schema of the group.
+
+        Parameters:
+            query (str, tuple, or dict): An attribute name, an (attribute, value) pair, or a dict combining
+                queries with "and", "or" or "not".  See HedSchemaSection.query_entries.
+            key_class (HedSectionKey): The HedSectionKey for the section to retrieve from.
+
+        Returns:
+            list: The names of the matching entries, with their schema namespace.
+
+        :raises ValueError:
+            - The query is invalid.
+        """
+        return list(dict.fromkeys(tag for schema in self._schemas.values()
+                                  for tag in schema.query_tags(query, key_class)))
 
     def get_tag_entry(self, name, key_class=HedSectionKey.Tags, schema_namespace=""):
         """ Return the schema entry for this tag, if one exists.
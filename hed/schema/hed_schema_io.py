@@ -29,7 +29,7 @@ def load_schema_version(xml_version=None, xml_folder=None):
         xml_folder (str): Path to a folder containing schema.
 
     Returns:
-        HedSchema or HedSchemaGroup: The schema or schema group extracted.
+        HedSchema or HedSchemaGroup: The schema or schema group extracted.  The schemas are frozen and shared.
 
     :raises HedFileError:
         - The xml_version is not valid.
@@ -247,7 +247,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
         xml_folder (str): Path to a folder containing schema.
 
     Returns:
-        HedSchema or HedSchemaGroup: The requested HedSchema object.
+        HedSchema: The requested HedSchema object, which is frozen as it is cached.
 
     :raises HedFileError:
         - The xml_version is not valid.
@@ -287,7 +287,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
                    f"custom_prefix:schema_version.")
             raise HedFileError(HedExceptions.SCHEMA_DUPLICATE_NAMES, msg, first_schema.filename, issues)
         filenames.append(current_filename)
-    return first_schema
+    return first_schema.freeze()
 
 
 def _load_schema_version_sub(xml_version, schema_namespace="", xml_folder=None, schema=None, name=""):
@@ -1,3 +1,6 @@
+import copy
+from collections import defaultdict
+
 from hed.schema.hed_schema_entry import HedSchemaEntry, UnitClassEntry, UnitEntry, HedTagEntry
 from hed.schema.hed_schema_constants import HedSectionKey, HedKey, HedKeyOld
 
@@ -30,7 +33,9 @@ class HedSchemaSection:
 
         # Points to the entries in attributes
         self.valid_attributes = {}
-        self._attribute_cache = {}
+        # Inverted index of the entry attributes, see _get_attribute_index.
+        self._attribute_index = None
+        self._attribute_names = {}
 
         self._section_entry = entries_by_section.get(section_key)
         self._duplicate_names = {}
@@ -49,6 +54,58 @@ class HedSchemaSection:
         new_entry = self._section_entry(name, self)
         return new_entry
 
+    def _shared_copy(self):
+        """ Return a copy of this section whose containers are copied but whose entries are shared.
+
+        Returns:
+            HedSchemaSection: The new section.
+
+        Notes:
+            - An entry belongs to the section in its _section.  Shared entries must be replaced by
+              _own_entries before anything about them is changed in the new section.
+
+        """
+        new_section = copy.copy(self)
+        new_section.all_names = self.all_names.copy()
+        new_section.all_entries = self.all_entries.copy()
+        new_section._duplicate_names = {key: entries.copy() for key, entries in self._duplicate_names.items()}
+        new_section.valid_attributes = self.valid_attributes.copy()
+        new_section._clear_attribute_index()
+        return new_section
+
+    def _own_entries(self, entries):
+        """ Replace the shared entries in this section by copies that belong to it.
+
+        Parameters:
+            entries (iterable): Entries of this section.  Those already belonging to it are skipped.
+
+        Returns:
+            dict: The copies keyed by the id of the entry they replace.
+
+        """
+        copies = {id(entry): entry._copy_to_section(self) for entry in entries if entry._section is not self}
+        if copies:
+            self._replace_entries(copies)
+            self._clear_attribute_index()
+        return copies
+
+    def _replace_entries(self, copies):
+        """ Replace entries by their copies in all the lookups of this section. """
+        self.all_names = {key: copies.get(id(entry), entry) for key, entry in self.all_names.items()}
+        self.all_entries = [copies.get(id(entry), entry) for entry in self.all_entries]
+        self._duplicate_names = {key: [copies.get(id(entry), entry) for entry in entries]
+                                 for key, entries in self._duplicate_names.items()}
+
+    def _is_shared_and_changed(self, entry):
+        """ Return True if entry is shared and one of its attributes is defined differently in this section. """
+        if entry._section is self:
+            return False
+        valid_attributes = self.valid_attributes
+        shared_attributes = entry._section.valid_attributes
+        return any((valid_attributes.get(attribute) if valid_attributes else None) is not
+                   (shared_attributes.get(attribute) if shared_attributes else None)
+                   for attribute in entry.attributes)
+
     def _check_if_duplicate(self, name_key, new_entry):
         return_entry = new_entry
         if name_key in self.all_names:
@@ -71,26 +128,108 @@ class HedSchemaSection:
         self.all_entries.append(new_entry)
         return return_entry
 
-    def get_entries_with_attribute(self, attribute_name, return_name_only=False, schema_namespace=""):
+    def get_entries_with_attribute(self, attribute_name, return_name_only=False, schema_namespace="",
+                                   attribute_value=None):
         """ Return entries or names with given attribute.
 
         Parameters:
             attribute_name (str): The name of the attribute(generally a HedKey entry).
             return_name_only (bool): If True, return the name as a string rather than the tag entry.
             schema_namespace (str): Prepends given namespace to each name if returning names.
+            attribute_value (str or None): If present, only entries with this among the comma separated
+                                           values of the attribute are returned.
 
         Returns:
-            list: List of HedSchemaEntry or strings representing the names.
+            list: List of HedSchemaEntry or strings representing the names, in section order.
 
         """
-        if attribute_name not in self._attribute_cache:
-            new_val = [tag_entry for tag_entry in self.values() if tag_entry.has_attribute(attribute_name)]
-            self._attribute_cache[attribute_name] = new_val
+        key = attribute_name if attribute_value is None else (attribute_name, attribute_value)
+        entries = self._get_attribute_index()[0].get(key, [])
+        if return_name_only:
+            names_key = (key, schema_namespace)
+            if names_key not in self._attribute_names:
+                self._attribute_names[names_key] = tuple(f"{schema_namespace}{entry.name}" for entry in entries)
+            return list(self._attribute_names[names_key])
+        return list(entries)
+
+    def query_entries(self, query, return_name_only=False, schema_namespace=""):
+        """ Return the entries or names matching a query over their attributes.
+
+        Parameters:
+            query (str, tuple, or dict): One of:
+                - An attribute name, matching the entries with the attribute.
+                - An (attribute name, value) pair, matching the entries with the value among the comma
+                  separated values of the attribute.
+                - {"and": [query, ...]} or {"or": [query, ...]}, matching the entries matching all or any
+                  of the queries.
+                - {"not": query}, matching the entries not matching the query.
+            return_name_only (bool): If True, return the name as a string rather than the tag entry.
+            schema_namespace (str): Prepends given namespace to each name if returning names.
+
+        Returns:
+            list: List of HedSchemaEntry or strings representing the names, in section order.
+
+        :raises ValueError:
+            - The query or one of its parts is not one of the forms above.
+
+        Notes:
+            - For example {"and": [HedKey.TakesValue, {"not": (HedKey.UnitClass, "timeUnits")}]}.
 
-        cache_val = self._attribute_cache[attribute_name]
+        """
+        entries = self._get_attribute_index()[1]
+        matches = [entries[position] for position in sorted(self._evaluate_query(query))]
         if return_name_only:
-            return [f"{schema_namespace}{tag_entry.name}" for tag_entry in cache_val]
-        return cache_val
+            return [f"{schema_namespace}{entry.name}" for entry in matches]
+        return matches
+
+    def _evaluate_query(self, query):
+        """ Return the set of positions (in section order) of the entries matching query. """
+        index, entries, positions = self._get_attribute_index()
+        if isinstance(query, str) or (isinstance(query, (tuple, list)) and len(query) == 2):
+            key = query if isinstance(query, str) else tuple(query)
+            return {positions[id(entry)] for entry in index.get(key, [])}
+        if isinstance(query, dict) and len(query) == 1:
+            operator, operand = next(iter(query.items()))
+            if operator == "not":
+                return set(range(len(entries))).difference(self._evaluate_query(operand))
+            if operator in ("and", "or") and isinstance(operand, (list, tuple)) and operand:
+                results = [self._evaluate_query(sub_query) for sub_query in operand]
+                return set.intersection(*results) if operator == "and" else set.union(*results)
+        raise ValueError(f"Invalid schema attribute query: {query!r}")
+
+    def _get_attribute_index(self):
+        """ Return the inverted attribute index of this section, building it if needed.
+
+        Returns:
+            tuple: A tuple containing:
+            - dict: Each attribute, and each (attribute, value) for the comma separated values of string
+                    attributes, with the list of entries that have it in section order.
+            - list: The entries in section order.
+            - dict: The id of each entry with its position in section order.
+
+        """
+        if self._attribute_index is None:
+            index = defaultdict(list)
+            entries = list(self.values())
+            for entry in entries:
+                for attribute, value in self._get_indexed_attributes(entry).items():
+                    index[attribute].append(entry)
+                    if isinstance(value, str):
+                        for item in dict.fromkeys(value.split(",")):
+                            index[(attribute, item)].append(entry)
+            positions = {id(entry): position for position, entry in enumerate(entries)}
+            self._attribute_index = (dict(index), entries, positions)
+        return self._attribute_index
+
+    @staticmethod
+    def _get_indexed_attributes(entry):
+        """ Return the attributes of entry that has_attribute reports. """
+        return entry.attributes
+
+    def _clear_attribute_index(self):
+        """ Discard the attribute index so it is rebuilt from the current entries. """
+        self._attribute_index = None
+        self._attribute_names = {}
 
     # ===============================================
     # Simple wrapper functions to make this class primarily function as a dict
@@ -146,7 +285,12 @@ class HedSchemaSection:
 
     def _finalize_section(self, hed_schema):
         for entry in self.all_entries:
-            entry.finalize_entry(hed_schema)
+            # Shared entries were finalized by the schema they came from.
+            if entry._section is self:
+                entry._fingerprint = None
+                entry.finalize_entry(hed_schema)
+        self._clear_attribute_index()
+        self._get_attribute_index()
 
 
 class HedSchemaUnitSection(HedSchemaSection):
@@ -174,9 +318,24 @@ class HedSchemaUnitClassSection(HedSchemaSection):
         """Allow adding units to existing unit classes, using a placeholder one with no attributes."""
         if name_key in self and len(new_entry.attributes) == 1 \
                 and HedKey.InLibrary in new_entry.attributes:
-            return self.all_names[name_key]
+            return self._get_own_entry(name_key)
         return super()._check_if_duplicate(name_key, new_entry)
 
+    def _get_own_entry(self, key):
+        """ Return the unit class named key, copying it first if it is shared so units can be added to it.
+
+        Parameters:
+            key (str): The name of the unit class.
+
+        Returns:
+            UnitClassEntry or None: The unit class entry belonging to this section.
+
+        """
+        entry = self.get(key)
+        if entry is not None and entry._section is not self:
+            entry = self._own_entries([entry])[id(entry)]
+        return entry
+
 
 class HedSchemaTagSection(HedSchemaSection):
     """The schema section containing all tags."""
@@ -188,6 +347,18 @@ class HedSchemaTagSection(HedSchemaSection):
         self.inheritable_attributes = {}
         self.root_tags = {}
 
+    def _shared_copy(self):
+        new_section = super()._shared_copy()
+        new_section.long_form_tags = self.long_form_tags.copy()
+        new_section.inheritable_attributes = self.inheritable_attributes.copy()
+        new_section.root_tags = self.root_tags.copy()
+        return new_section
+
+    def _replace_entries(self, copies):
+        super()._replace_entries(copies)
+        self.long_form_tags = {key: copies.get(id(entry), entry) for key, entry in self.long_form_tags.items()}
+        self.root_tags = {key: copies.get(id(entry), entry) for key, entry in self.root_tags.items()}
+
     @staticmethod
     def _get_tag_forms(name):
         name_key = name
@@ -251,6 +422,10 @@ class HedSchemaTagSection(HedSchemaSection):
             key = key.casefold()
         return key in self.long_form_tags
 
+    @staticmethod
+    def _get_indexed_attributes(entry):
+        return entry.inherited_attributes
+
     @staticmethod
     def _group_by_top_level_tag(divide_list):
         result = {}
@@ -262,19 +437,25 @@ class HedSchemaTagSection(HedSchemaSection):
 
         return list(result.values())
 
-    def _finalize_section(self, hed_schema):
-        # Find the attributes with the inherited property
+    @staticmethod
+    def _get_inheritable_attributes(hed_schema):
+        """ Return the names of the attributes with the inherited property in hed_schema. """
         attribute_section = hed_schema.attributes
         if hed_schema.schema_83_props:
-            self.inheritable_attributes = [name for name, value in attribute_section.items()
-                                           if not value.has_attribute(HedKey.AnnotationProperty)]
+            inheritable_attributes = [name for name, value in attribute_section.items()
+                                      if not value.has_attribute(HedKey.AnnotationProperty)]
         else:
-            self.inheritable_attributes = [name for name, value in attribute_section.items()
-                                           if value.has_attribute(HedKeyOld.IsInheritedProperty)]
+            inheritable_attributes = [name for name, value in attribute_section.items()
+                                      if value.has_attribute(HedKeyOld.IsInheritedProperty)]
 
         # Hardcode in extension allowed as it is critical for validation in older schemas
-        if not self.inheritable_attributes:
-            self.inheritable_attributes = [HedKey.ExtensionAllowed]
+        if not inheritable_attributes:
+            inheritable_attributes = [HedKey.ExtensionAllowed]
+        return inheritable_attributes
+
+    def _finalize_section(self, hed_schema):
+        # Find the attributes with the inherited property
+        self.inheritable_attributes = self._get_inheritable_attributes(hed_schema)
 
         split_list = self._group_by_top_level_tag(self.all_entries)
         # Sort the extension allowed lists
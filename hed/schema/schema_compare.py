@@ -1,12 +1,18 @@
 """ Functions supporting comparison of schemas. """
 
-from hed.schema.hed_schema import HedKey
+from hed.schema.hed_schema import HedKey, HedSchema
 from hed.schema.hed_schema_constants import HedSectionKey
+from hed.errors.exceptions import HedFileError, HedExceptions
 from collections import defaultdict
 
 MiscSection = "misc"
 HedIDSection = "HedId changes"
 
+# The order sections are rebuilt in when applying a changeset, so each section's attributes are known first.
+ChangesetSectionOrder = (HedSectionKey.Properties, HedSectionKey.Attributes, HedSectionKey.UnitModifiers,
+                         HedSectionKey.UnitClasses, HedSectionKey.Units, HedSectionKey.ValueClasses,
+                         HedSectionKey.Tags)
+
 SectionEntryNames = {
     HedSectionKey.Tags: "Tag",
     HedSectionKey.Units: "Unit",
@@ -147,13 +153,17 @@ def compare_schemas(schema1, schema2, attribute_filter=HedKey.InLibrary, section
         not_in_schema2[section_key] = {key: dict1[key] for key in dict1 if key not in dict2}
         not_in_schema1[section_key] = {key: dict2[key] for key in dict2 if key not in dict1}
 
-        # Find keys present in both but with unequal entries
-        unequal_entries[section_key] = {key: (dict1[key], dict2[key]) for key in dict1
-                                        if key in dict2 and dict1[key] != dict2[key]}
-
-        # Find matches
-        matches[section_key] = {key: (dict1[key], dict2[key]) for key in dict1
-                                if key in dict2 and dict1[key] == dict2[key]}
+        # Find keys present in both, splitting them into matches and unequal entries by their fingerprints
+        matches[section_key] = {}
+        unequal_entries[section_key] = {}
+        for key, entry1 in dict1.items():
+            entry2 = dict2.get(key)
+            if entry2 is None:
+                continue
+            if entry1.fingerprint == entry2.fingerprint:
+                matches[section_key][key] = (entry1, entry2)
+            else:
+                unequal_entries[section_key][key] = (entry1, entry2)
 
     return matches, not_in_schema1, not_in_schema2, unequal_entries
 
@@ -410,3 +420,139 @@ def _check_other_attributes(change_dict, section_key, entry1, entry2):
                 "tag": entry1.name if section_key != HedSectionKey.Tags else entry1.short_tag_name,
                 "section": section_key
             })
+
+
+def get_schema_changeset(schema1, schema2):
+    """ Return the changes that turn schema1 into schema2 as a dictionary that can be saved as JSON.
+
+    Parameters:
+        schema1 (HedSchema): The schema the changes apply to.
+        schema2 (HedSchema): The schema the changes produce.
+
+    Returns:
+        dict: The changeset, with the keys:
+        - "misc": The new values of whichever of "header_attributes", "prologue" and "epilogue" changed.
+        - "sections": For each section with changes (keyed by the HedSectionKey value), a dict with:
+            - "removed": The keys of the removed entries and their fingerprints in schema1.
+            - "added": The keys of the added entries and their records.
+            - "modified": The keys of the changed entries and their new records, which also hold the
+              fingerprint of the entry in schema1 as "base_fingerprint".
+
+    Notes:
+        - Entries are keyed by name, except tags, which are keyed by short tag name (ending in /# for
+          placeholders).  A record holds the entry name, attributes, description and, for units, the unit class,
+          along with the key of the entry it follows in schema2 as "after", so changed entries keep their place.
+        - Entries with the same fingerprint are skipped without being compared further.
+        - apply_schema_changeset turns schema1 (or any schema equal to it) into schema2.
+    """
+    changeset = {"misc": {}, "sections": {}}
+    if schema1.header_attributes != schema2.header_attributes:
+        changeset["misc"]["header_attributes"] = dict(schema2.header_attributes)
+    if schema1.prologue != schema2.prologue:
+        changeset["misc"]["prologue"] = schema2.prologue
+    if schema1.epilogue != schema2.epilogue:
+        changeset["misc"]["epilogue"] = schema2.epilogue
+
+    for section_key in HedSectionKey:
+        index1 = _get_changeset_index(schema1[section_key])
+        index2 = _get_changeset_index(schema2[section_key])
+        keys2 = list(index2)
+        previous_keys = dict(zip(keys2, [None] + keys2[:-1]))
+        removed = {key: entry.fingerprint for key, entry in index1.items() if key not in index2}
+        added = {key: _get_entry_record(entry, previous_keys[key]) for key, entry in index2.items()
+                 if key not in index1}
+        modified = {}
+        for key, entry1 in index1.items():
+            entry2 = index2.get(key)
+            if entry2 is not None and entry1.fingerprint != entry2.fingerprint:
+                modified[key] = _get_entry_record(entry2, previous_keys[key])
+                modified[key]["base_fingerprint"] = entry1.fingerprint
+        if removed or added or modified:
+            changeset["sections"][section_key.value] = {"removed": removed, "added": added, "modified": modified}
+    return changeset
+
+
+def apply_schema_changeset(schema, changeset):
+    """ Return a new schema with the changes from get_schema_changeset applied to schema.
+
+    Parameters:
+        schema (HedSchema): The schema to apply the changes to.  It is not modified.
+        changeset (dict): The changes as returned by get_schema_changeset.
+
+    Returns:
+        HedSchema: The changed schema.
+
+    :raises HedFileError:
+        - A removed or modified entry is missing from schema or has a different fingerprint there.
+        - An added entry is already in schema.
+    """
+    misc_changes = changeset.get("misc", {})
+    new_schema = HedSchema()
+    new_schema.name = schema.name
+    new_schema.header_attributes = dict(misc_changes.get("header_attributes", schema.header_attributes))
+    new_schema.prologue = misc_changes.get("prologue", schema.prologue)
+    new_schema.epilogue = misc_changes.get("epilogue", schema.epilogue)
+
+    section_changes = changeset.get("sections", {})
+    for section_key in ChangesetSectionOrder:
+        new_schema._initialize_attributes(section_key)
+        records = _get_patched_records(schema, section_key, section_changes.get(section_key.value, {}))
+        for record in records:
+            entry = new_schema._create_tag_entry(record["name"], section_key)
+            entry.description = record["description"]
+            for attribute, value in record["attributes"].items():
+                entry._set_attribute_value(attribute, value)
+            new_schema._add_tag_to_dict(record["name"], entry, section_key)
+            unit_class_entry = new_schema.unit_classes.get(record.get("unit_class") or "")
+            if section_key == HedSectionKey.Units and unit_class_entry is not None:
+                unit_class_entry.add_unit(entry)
+
+    new_schema.finalize_dictionaries()
+    return new_schema
+
+
+def _get_changeset_index(section):
+    """ Return a dict of the changeset keys and entries of a schema section. """
+    if section.section_key != HedSectionKey.Tags:
+        return {entry.name: entry for entry in section.values()}
+    return {entry.short_tag_name + ("/#" if entry.name.endswith("/#") else ""): entry for entry in section.values()}
+
+
+def _get_entry_record(entry, after=None):
+    """ Return the content of an entry, and the key of the entry it follows, as a dict that can be saved as JSON. """
+    record = {"name": entry.name, "attributes": dict(entry.attributes), "description": entry.description,
+              "after": after}
+    if entry.section_key == HedSectionKey.Units:
+        record["unit_class"] = entry.unit_class_entry.name if entry.unit_class_entry else None
+    return record
+
+
+def _get_patched_records(schema, section_key, changes):
+    """ Return the records of a section of schema with the changes to it applied, checking they fit the schema. """
+    index = _get_changeset_index(schema[section_key])
+    removed = changes.get("removed", {})
+    added = changes.get("added", {})
+    modified = changes.get("modified", {})
+    base_fingerprints = dict(removed, **{key: record["base_fingerprint"] for key, record in modified.items()})
+    for key, fingerprint in base_fingerprints.items():
+        if key not in index or index[key].fingerprint != fingerprint:
+            raise HedFileError(HedExceptions.BAD_PARAMETERS,
+                               f"The changeset does not apply: {SectionEntryNames[section_key]} '{key}' "
+                               f"is missing or differs from the one the changes were made to.", schema.name)
+    for key in added:
+        if key in index:
+            raise HedFileError(HedExceptions.BAD_PARAMETERS,
+                               f"The changeset does not apply: {SectionEntryNames[section_key]} '{key}' "
+                               f"is added but already exists.", schema.name)
+
+    # Each changed entry is placed right after the entry it follows, which is at most one per key.
+    changed = dict(modified, **added)
+    following = {record["after"]: key for key, record in changed.items()}
+    records = []
+    for key in [None] + [key for key in index if key not in removed and key not in changed]:
+        if key is not None:
+            records.append(_get_entry_record(index[key]))
+        while key in following:
+            key = following[key]
+            records.append(changed[key])
+    return records
@@ -1,5 +1,8 @@
 """ Utilities for HED schema checking. """
 
+import copy
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from hed.errors.error_types import ErrorContext, SchemaErrors, ErrorSeverity, SchemaAttributeErrors, SchemaWarnings
 from hed.errors.error_reporter import ErrorHandler, sort_issues
 from hed.schema.hed_schema import HedSchema, HedKey, HedSectionKey
@@ -13,8 +16,16 @@ from hed.schema import hed_cache
 from semantic_version import Version
 from hed.schema.schema_attribute_validator_hed_id import HedIDValidator
 
+MAX_COMPLIANCE_CACHE = 20
 
-def check_compliance(hed_schema, check_for_warnings=True, name=None, error_handler=None):
+# Issues of the content checks keyed by (schema content hash, check_for_warnings, previous schema versions).
+_compliance_cache = {}
+
+# The SchemaValidator used by the section checks in a worker process.
+_worker_validator = None
+
+
+def check_compliance(hed_schema, check_for_warnings=True, name=None, error_handler=None, workers=None):
     """ Check for hed3 compliance of a schema object.
 
     Parameters:
@@ -22,16 +33,23 @@ def check_compliance(hed_schema, check_for_warnings=True, name=None, error_handl
         check_for_warnings (bool): If True, check for formatting issues like invalid characters, capitalization, etc.
         name (str): If present, will use as filename for context.
         error_handler (ErrorHandler or None): Used to report errors. Uses a default one if none passed in.
+        workers (int or None): If greater than 1, the sections are split across this many processes.
 
     Returns:
         list: A list of all warnings and errors found in the file. Each issue is a dictionary.
 
     :raises ValueError:
         - Trying to validate a HedSchemaGroup directly
+
+    Notes:
+        - When no error_handler is passed in, the issues are cached by the content hash of the schema,
+          so checking an unchanged schema again only reruns the prerelease version check.
+
     """
     if not isinstance(hed_schema, HedSchema):
         raise ValueError("To check compliance of a HedGroupSchema, call self.check_compliance on the schema itself.")
 
+    use_cache = error_handler is None
     error_handler = error_handler if error_handler else ErrorHandler(check_for_warnings)
     validator = SchemaValidator(hed_schema, error_handler)
     issues_list = []
@@ -41,16 +59,69 @@ def check_compliance(hed_schema, check_for_warnings=True, name=None, error_handl
     error_handler.push_error_context(ErrorContext.FILE_NAME, name)
 
     issues_list += validator.check_if_prerelease_version()
-    issues_list += validator.check_prologue_epilogue()
-    issues_list += validator.check_invalid_chars()
-    issues_list += validator.check_attributes()
-    issues_list += validator.check_duplicate_names()
+    cache_key = _get_cache_key(validator, check_for_warnings) if use_cache else None
+    if cache_key in _compliance_cache:
+        content_issues = copy.deepcopy(_compliance_cache[cache_key])
+        for issue in content_issues:
+            issue[ErrorContext.FILE_NAME] = name
+    else:
+        content_issues = validator.check_prologue_epilogue()
+        content_issues += validator.check_sections(workers)
+        content_issues += validator.check_duplicate_names()
+        if cache_key:
+            if len(_compliance_cache) >= MAX_COMPLIANCE_CACHE:
+                del _compliance_cache[next(iter(_compliance_cache))]
+            _compliance_cache[cache_key] = copy.deepcopy(content_issues)
+    issues_list += content_issues
     error_handler.pop_error_context()
 
     issues_list = sort_issues(issues_list)
     return issues_list
 
 
+def get_content_hash(hed_schema):
+    """ Return a digest of the schema content that the compliance checks depend on.
+
+    Parameters:
+        hed_schema (HedSchema): The schema to hash.
+
+    Returns:
+        str: A hexadecimal digest that changes whenever the header, prologue, epilogue or an entry changes.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((sorted(hed_schema.header_attributes.items()), hed_schema.prologue, hed_schema.epilogue,
+                        hed_schema.schema_namespace)).encode())
+    for section_key in HedSectionKey:
+        section = hed_schema[section_key]
+        duplicates = sorted((name, [entry.fingerprint for entry in entries])
+                            for name, entries in section.duplicate_names.items())
+        digest.update(repr((str(section_key), [entry.fingerprint for entry in section.values()],
+                            duplicates)).encode())
+    return digest.hexdigest()
+
+
+def _get_cache_key(validator, check_for_warnings):
+    """ Return the compliance cache key, which includes the previous schemas that hedId values are checked against. """
+    previous_versions = sorted((library, schema.version)
+                               for library, schema in validator._id_validator._previous_schemas.items())
+    return get_content_hash(validator.hed_schema), check_for_warnings, tuple(previous_versions)
+
+
+def _init_worker(validator):
+    """ Store the validator used by _check_section_job in this worker process. """
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _check_section_job(job):
+    """ Return the (invalid character issues, attribute issues) of a slice of a section in a worker process. """
+    section_key, start, stop = job
+    entries = list(_worker_validator.hed_schema[section_key].values())[start:stop]
+    return (_worker_validator._check_section_invalid_chars(section_key, entries),
+            _worker_validator._check_section_attributes(section_key, entries))
+
+
 class SchemaValidator:
     """Validator class to wrap some code.  In general, just call check_compliance."""
     attribute_validators_old = {
@@ -129,26 +200,72 @@ class SchemaValidator:
         self.error_handler.add_context_and_filter(issues)
         return issues
 
+    def check_sections(self, workers=None):
+        """ Return the issues of check_invalid_chars followed by those of check_attributes.
+
+        Parameters:
+            workers (int or None): If greater than 1, the sections are split into slices checked by this many processes.
+
+        Returns:
+            list: The issues in the same order as checking the sections in a single process.
+        """
+        if not workers or workers <= 1:
+            return self.check_invalid_chars() + self.check_attributes()
+
+        sizes = {section_key: len(self.hed_schema[section_key]) for section_key in HedSectionKey}
+        chunk_size = max(1, -(-sum(sizes.values()) // workers))
+        jobs = [(section_key, start, start + chunk_size) for section_key, size in sizes.items()
+                for start in range(0, size, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            results = list(executor.map(_check_section_job, jobs))
+        issues_list = [issue for char_issues, _ in results for issue in char_issues]
+        issues_list += [issue for _, attribute_issues in results for issue in attribute_issues]
+        return issues_list
+
     def check_attributes(self):
         """Returns issues from validating known attributes in all sections"""
         issues_list = []
         for section_key in HedSectionKey:
-            self.error_handler.push_error_context(ErrorContext.SCHEMA_SECTION, str(section_key))
-            for tag_entry in self.hed_schema[section_key].values():
-                self.error_handler.push_error_context(ErrorContext.SCHEMA_TAG, tag_entry.name)
-                issues_list += self._check_tag_entry_attributes(tag_entry)
-                self.error_handler.pop_error_context()
-            self.error_handler.pop_error_context()
+            issues_list += self._check_section_attributes(section_key, self.hed_schema[section_key].values())
         return issues_list
 
-    def _check_tag_entry_attributes(self, tag_entry):
+    def _check_section_attributes(self, section_key, entries):
+        """ Return the attribute issues of the given entries of a section, ordered by entry.
+
+            The validators are looked up once per attribute and run over all the entries with that attribute.
+        """
         issues_list = []
-        issues_list += self._check_unknown_attributes(tag_entry)
-        for attribute_name in tag_entry.attributes:
-            validators = self._get_validators(attribute_name)
-            issues_list += self._run_validators(tag_entry, attribute_name, validators)
+        entries = list(entries)
+        self.error_handler.push_error_context(ErrorContext.SCHEMA_SECTION, str(section_key))
+        entry_issues = self._check_attributes_by_name(entries)
+        for index, tag_entry in enumerate(entries):
+            self.error_handler.push_error_context(ErrorContext.SCHEMA_TAG, tag_entry.name)
+            issues_list += self._check_unknown_attributes(tag_entry)
+            self.error_handler.pop_error_context()
+            if index in entry_issues:
+                for attribute_name in tag_entry.attributes:
+                    issues_list += entry_issues[index].get(attribute_name, [])
+        self.error_handler.pop_error_context()
         return issues_list
 
+    def _check_attributes_by_name(self, entries):
+        """ Return a dict of entry index to a dict of attribute name to the issues found for that attribute. """
+        entries_by_attribute = {}
+        for index, tag_entry in enumerate(entries):
+            for attribute_name in tag_entry.attributes:
+                entries_by_attribute.setdefault(attribute_name, []).append(index)
+
+        entry_issues = {}
+        for attribute_name, indexes in entries_by_attribute.items():
+            validators = self._get_validators(attribute_name)
+            for index in indexes:
+                self.error_handler.push_error_context(ErrorContext.SCHEMA_TAG, entries[index].name)
+                new_issues = self._run_validators(entries[index], attribute_name, validators)
+                self.error_handler.pop_error_context()
+                if new_issues:
+                    entry_issues.setdefault(index, {})[attribute_name] = new_issues
+        return entry_issues
+
     def _check_unknown_attributes(self, tag_entry):
         issues_list = []
         if tag_entry._unknown_attributes:
@@ -217,6 +334,13 @@ class SchemaValidator:
     def check_invalid_chars(self):
         """Returns issues for bad chars in terms or descriptions."""
         issues_list = []
+        for section_key in HedSectionKey:
+            issues_list += self._check_section_invalid_chars(section_key, self.hed_schema[section_key].values())
+        return issues_list
+
+    def _check_section_invalid_chars(self, section_key, entries):
+        """ Return the issues for bad chars in the terms or descriptions of the given entries of a section. """
+        issues_list = []
         section_validators = {
             HedSectionKey.Tags: validate_schema_tag,
         }
@@ -231,21 +355,20 @@ class SchemaValidator:
             default_validator = validate_schema_term_new
             description_validator = validate_schema_description_new
 
-        for section_key in HedSectionKey:
-            self.error_handler.push_error_context(ErrorContext.SCHEMA_SECTION, str(section_key))
-            for entry in self.hed_schema[section_key].values():
-                if entry.has_attribute(HedKey.DeprecatedFrom):  # Don't validate deprecated terms and descriptions
-                    continue
-                self.error_handler.push_error_context(ErrorContext.SCHEMA_TAG, str(entry))
-                # Everything but tags just does the generic term check
-                validator = section_validators.get(section_key, default_validator)
-                new_issues = []
-                if validator:
-                    new_issues += validator(entry)
-                new_issues += description_validator(entry)
-                self.error_handler.add_context_and_filter(new_issues)
-                issues_list += new_issues
-                self.error_handler.pop_error_context()  # Term
-            self.error_handler.pop_error_context()  # section
+        # Everything but tags just does the generic term check
+        validator = section_validators.get(section_key, default_validator)
+        self.error_handler.push_error_context(ErrorContext.SCHEMA_SECTION, str(section_key))
+        for entry in entries:
+            if entry.has_attribute(HedKey.DeprecatedFrom):  # Don't validate deprecated terms and descriptions
+                continue
+            self.error_handler.push_error_context(ErrorContext.SCHEMA_TAG, str(entry))
+            new_issues = []
+            if validator:
+                new_issues += validator(entry)
+            new_issues += description_validator(entry)
+            self.error_handler.add_context_and_filter(new_issues)
+            issues_list += new_issues
+            self.error_handler.pop_error_context()  # Term
+        self.error_handler.pop_error_context()  # section
 
         return issues_list
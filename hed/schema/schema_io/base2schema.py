@@ -1,5 +1,3 @@
-import copy
-
 from hed.schema.schema_io import schema_util
 from hed.errors.exceptions import HedFileError, HedExceptions
 
@@ -117,8 +115,8 @@ class SchemaLoader(ABC):
                 raise HedFileError(HedExceptions.BAD_WITH_STANDARD,
                                    message=f"Cannot load withStandard schema '{self._schema.with_standard}'",
                                    filename=e.filename)
-            # Copy the non-alterable cached schema
-            self._schema = copy.deepcopy(base_version)
+            # Share the entries of the non-alterable cached schema, copying only those the library changes
+            self._schema = base_version._shared_copy()
             self._schema.filename = self.filename
             self._schema.name = self.name  # Manually set name here as we don't want to pass it to load_schema_version
             self._schema.header_attributes = saved_attr
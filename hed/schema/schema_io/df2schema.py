@@ -2,6 +2,7 @@
 This module is used to create a HedSchema object from a set of .tsv files.
 """
 import io
+from collections import defaultdict
 
 from hed.schema.schema_io import df_util, load_dataframes
 from hed.schema.hed_schema_constants import HedSectionKey, HedKey
@@ -56,7 +57,7 @@ class SchemaLoaderDF(SchemaLoader):
 
     def _get_header_attributes(self, file_data):
         header_attributes = {}
-        for row_number, row in file_data[constants.STRUCT_KEY].iterrows():
+        for row_number, row in _iter_rows(file_data[constants.STRUCT_KEY]):
             cls = row[constants.subclass_of]
             attributes = row[constants.attributes]
             if cls == "HedHeader" and attributes:
@@ -86,7 +87,7 @@ class SchemaLoaderDF(SchemaLoader):
 
     def _get_prologue_epilogue(self, file_data):
         prologue, epilogue = "", ""
-        for row_number, row in file_data[constants.STRUCT_KEY].iterrows():
+        for row_number, row in _iter_rows(file_data[constants.STRUCT_KEY]):
             cls = row[constants.subclass_of]
             description = row[constants.description]
             if cls == "HedPrologue" and description:
@@ -102,45 +103,49 @@ class SchemaLoaderDF(SchemaLoader):
 
         Parameters:
             dataframe (pd.DataFrame): The dataframe for the main tags section
+
+        Notes:
+            - The tags are added in a topological order of their parents, which is the file order for a properly
+              formatted .tsv file.  A tag listed before its parent waits until the parent is added.
+            - A tag whose parent is already in the schema (from the partnered standard schema) can be rooted,
+              so it is read right away and only waits if it turns out not to be rooted.
         """
         self._schema._initialize_attributes(HedSectionKey.Tags)
         known_parent_tags = {"HedTag": []}
-        iterations = 0
-        # Handle this over multiple iterations in case tags have parent tags listed later in the file.
-        # A properly formatted .tsv file will never have parents after the child.
-        current_rows = list(dataframe[constants.TAG_KEY].iterrows())
-        while current_rows:
-            iterations += 1
-            next_round_rows = []
-            for row_number, row in current_rows:
-                # skip blank rows, though there shouldn't be any
-                if not any(row):
-                    continue
+        waiting_rows = defaultdict(list)  # Rows waiting for the parent tag with the given short name.
+        for row_position, (row_number, row) in enumerate(_iter_rows(dataframe[constants.TAG_KEY])):
+            # skip blank rows, though there shouldn't be any
+            if not any(row.values()):
+                continue
 
+            parent_tag = row[constants.subclass_of]
+            if parent_tag not in known_parent_tags and self._schema.tags.get(parent_tag) is None:
+                waiting_rows[parent_tag].append((row_position, row_number, row))
+                continue
+
+            ready_rows = [(row_position, row_number, row)]
+            while ready_rows:
+                row_position, row_number, row = ready_rows.pop()
                 parent_tag = row[constants.subclass_of]
-                org_parent_tags = known_parent_tags.get(parent_tag)
-                tag_entry = self._create_tag_entry(org_parent_tags, row_number, row)
+                parent_tags = known_parent_tags.get(parent_tag)
+                tag_entry = self._create_tag_entry(parent_tags, row_number, row)
                 if not tag_entry:
                     # This will have already raised an error
                     continue
-
-                # If this is NOT a rooted tag and we have no parent, try it in another round.
-                if org_parent_tags is None and not tag_entry.has_attribute(HedKey.Rooted):
-                    next_round_rows.append((row_number, row))
+                if parent_tags is None and not tag_entry.has_attribute(HedKey.Rooted):
+                    waiting_rows[parent_tag].append((row_position, row_number, row))
                     continue
-
                 tag_entry = self._add_tag_entry(tag_entry, row_number, row)
                 if tag_entry:
                     known_parent_tags[tag_entry.short_tag_name] = tag_entry.name.split("/")
+                    # Add the children waiting for this tag next, in file order.
+                    ready_rows.extend(reversed(waiting_rows.pop(tag_entry.short_tag_name, [])))
 
-            if len(next_round_rows) == len(current_rows):
-                for row_number, row in current_rows:
-                    tag_name = self._get_tag_name(row)
-                    msg = (f"Cannot resolve parent tag.  "
-                           f"There is probably an issue with circular parent tags of {tag_name} on row {row_number}.")
-                    self._add_fatal_error(row_number, row, msg, HedExceptions.SCHEMA_TAG_TSV_BAD_PARENT)
-                break
-            current_rows = next_round_rows
+        for row_position, row_number, row in sorted(row for rows in waiting_rows.values() for row in rows):
+            tag_name = self._get_tag_name(row)
+            msg = (f"Cannot resolve parent tag.  "
+                   f"There is probably an issue with circular parent tags of {tag_name} on row {row_number}.")
+            self._add_fatal_error(row_number, row, msg, HedExceptions.SCHEMA_TAG_TSV_BAD_PARENT)
 
     def _add_tag_entry(self, tag_entry, row_number, row):
         try:
@@ -163,7 +168,7 @@ class SchemaLoaderDF(SchemaLoader):
         Parameters:
             parent_tags (list): A list of parent tags in order.
             row_number (int): The row number to report errors as
-            row (str or pd.Series): A tag row or pandas series(depends on format)
+            row (dict): A tag row
 
         Returns:
             HedSchemaEntry: The entry for the added tag.
@@ -185,17 +190,17 @@ class SchemaLoaderDF(SchemaLoader):
     def _read_section(self, df, section_key):
         self._schema._initialize_attributes(section_key)
 
-        for row_number, row in df.iterrows():
+        for row_number, row in _iter_rows(df):
             new_entry = self._create_entry(row_number, row, section_key)
             self._add_to_dict(row_number, row, new_entry, section_key)
 
     def _read_units(self, df):
         self._schema._initialize_attributes(HedSectionKey.Units)
 
-        for row_number, row in df.iterrows():
+        for row_number, row in _iter_rows(df):
             new_entry = self._create_entry(row_number, row, HedSectionKey.Units)
             unit_class_name = row[constants.has_unit_class]
-            unit_class_entry = self._schema.get_tag_entry(unit_class_name, HedSectionKey.UnitClasses)
+            unit_class_entry = self._schema.unit_classes._get_own_entry(unit_class_name)
             unit_class_entry.add_unit(new_entry)
             self._add_to_dict(row_number, row, new_entry, HedSectionKey.Units)
 
@@ -207,7 +212,7 @@ class SchemaLoaderDF(SchemaLoader):
 
     def _read_attribute_section(self, df, annotation_property=False, section_key=HedSectionKey.Attributes):
         # todo: this needs to ALSO check range/domain(and verify they match)
-        for row_number, row in df.iterrows():
+        for row_number, row in _iter_rows(df):
             new_entry = self._create_entry(row_number, row, section_key)
             if annotation_property:
                 new_entry._set_attribute_value(HedKey.AnnotationProperty, True)
@@ -246,14 +251,22 @@ class SchemaLoaderDF(SchemaLoader):
 
         Parameters:
             row_number (int): The row number to report errors as.
-            row (pd.Series): A tag row.
+            row (dict): A tag row.
         Returns:
-            dict: Dictionary of attributes.
+            dict: Dictionary of attributes, empty if they are malformed (which is reported as an error).
         """
         try:
             return df_util.get_attributes_from_row(row)
         except ValueError as e:
-            self._add_fatal_error(row_number, str(row), str(e))
+            self._add_fatal_error(row_number, row, str(e))
+            return {}
+
+    def _add_fatal_error(self, line_number, line, warning_message="Schema term is empty or the line is malformed",
+                         error_code=HedExceptions.WIKI_DELIMITERS_INVALID):
+        if isinstance(line, dict):
+            # Report the row as pandas shows it.
+            line = pd.Series(line, name=line_number)
+        super()._add_fatal_error(line_number, line, warning_message, error_code)
 
     def _add_to_dict(self, row_number, row, entry, key_class):
         if entry.has_attribute(HedKey.InLibrary) and not self._loading_merged and not self.appending_to_schema:
@@ -264,6 +277,20 @@ class SchemaLoaderDF(SchemaLoader):
         return self._add_to_dict_base(entry, key_class)
 
 
+def _iter_rows(df):
+    """ Return an iterator of (index, row) pairs over a dataframe with each row as a dictionary.
+
+    Parameters:
+        df (pd.DataFrame): A schema dataframe.
+
+    Returns:
+        iterator: The (index, dict) pairs, which are much faster to create than the Series from iterrows.
+    """
+    columns = list(df.columns)
+    rows = (dict(zip(columns, values)) for values in zip(*(df[column].tolist() for column in columns)))
+    return zip(df.index, rows)
+
+
 def load_dataframes_from_strings(schema_data):
     """ Load the given strings/dataframes as dataframes.
 
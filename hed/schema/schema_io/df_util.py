@@ -168,18 +168,18 @@ def get_attributes_from_row(row):
     """ Get the tag attributes from a line.
 
     Parameters:
-        row (pd.Series): A tag line.
+        row (pd.Series or dict): A tag line.
     Returns:
         dict: Dictionary of attributes.
     """
-    if constants.properties in row.index:
+    if constants.properties in row:
         attr_string = row[constants.properties]
-    elif constants.attributes in row.index:
+    elif constants.attributes in row:
         attr_string = row[constants.attributes]
     else:
         attr_string = ""
 
-    if constants.subclass_of in row.index and row[constants.subclass_of] == "HedHeader":
+    if constants.subclass_of in row and row[constants.subclass_of] == "HedHeader":
         header_attributes, _ = _parse_header_attributes_line(attr_string)
         return header_attributes
     return parse_attribute_string(attr_string)
@@ -30,7 +30,7 @@ class Schema2DF(Schema2Base):
         """
         super().__init__()
         self._get_as_ids = get_as_ids
-        self._tag_rows = []
+        self._rows = {}
 
     def _get_object_name_and_id(self, object_name, include_prefix=False):
         """ Get the adjusted name and ID for the given object type.
@@ -56,9 +56,27 @@ class Schema2DF(Schema2Base):
     # =========================================
     # Required baseclass function
     # =========================================
+    def process_schema(self, hed_schema, save_merged=False):
+        """ Return the schema as a dictionary of dataframes.
+
+        Parameters:
+            hed_schema (HedSchema): The schema to convert.
+            save_merged (bool): If True, this will save the schema as a merged schema if it is a "withStandard" schema.
+
+        Returns:
+            dict: The dataframes keyed by the constants like TAG_KEY.
+
+        Notes:
+            - The rows are collected in lists while the schema is written and each dataframe is created once at the end.
+        """
+        super().process_schema(hed_schema, save_merged)
+        for df_key, rows in self._rows.items():
+            self.output[df_key] = pd.DataFrame(rows, columns=self.output[df_key].columns, dtype=str)
+        return self.output
+
     def _initialize_output(self):
         self.output = create_empty_dataframes()
-        self._tag_rows = []
+        self._rows = {df_key: [] for df_key in self.output}
 
     def _create_and_add_object_row(self, base_object, attributes="", description=""):
         name, full_hed_id = self._get_object_name_and_id(base_object)
@@ -70,7 +88,7 @@ class Schema2DF(Schema2Base):
             constants.description: description.replace("\n", "\\n"),
             constants.equivalent_to: self._get_header_equivalent_to(attributes, base_object)
         }
-        self.output[constants.STRUCT_KEY].loc[len(self.output[constants.STRUCT_KEY])] = new_row
+        self._rows[constants.STRUCT_KEY].append(new_row)
 
     def _output_header(self, attributes, prologue):
         base_object = "HedHeader"
@@ -88,7 +106,7 @@ class Schema2DF(Schema2Base):
         pass
 
     def _end_tag_section(self):
-        self.output[constants.TAG_KEY] = pd.DataFrame(self._tag_rows, columns=constants.tag_columns, dtype=str)
+        pass
 
     def _write_tag_entry(self, tag_entry, parent_node=None, level=0):
         tag_id = tag_entry.attributes.get(HedKey.HedID, "")
@@ -103,8 +121,7 @@ class Schema2DF(Schema2Base):
             constants.description: tag_entry.description,
             constants.equivalent_to: self._get_tag_equivalent_to(tag_entry),
         }
-        # Todo: do other sections like this as well for efficiency
-        self._tag_rows.append(new_row)
+        self._rows[constants.TAG_KEY].append(new_row)
 
     def _write_entry(self, entry, parent_node, include_props=True):
         df_key = section_key_to_df.get(entry.section_key)
@@ -116,7 +133,6 @@ class Schema2DF(Schema2Base):
             return self._write_property_entry(entry)
         elif df_key == HedSectionKey.Attributes:
             return self._write_attribute_entry(entry, include_props=include_props)
-        df = self.output[df_key]
         tag_id = entry.attributes.get(HedKey.HedID, "")
         new_row = {
             constants.hed_id: f"{tag_id}",
@@ -132,8 +148,7 @@ class Schema2DF(Schema2Base):
             if self._get_as_ids:
                 class_entry_name = f"{entry.unit_class_entry.attributes.get(constants.hed_id)}"
             new_row[constants.has_unit_class] = class_entry_name
-        df.loc[len(df)] = new_row
-        pass
+        self._rows[df_key].append(new_row)
 
     def _write_attribute_entry(self, entry, include_props):
         df_key = constants.OBJECT_KEY
@@ -187,7 +202,6 @@ class Schema2DF(Schema2Base):
             domain_string = " or ".join(domain_attributes[key] for key in domain_keys)
             range_string = " or ".join(range_attributes[key] for key in range_keys)
 
-        df = self.output[df_key]
         tag_id = entry.attributes.get(HedKey.HedID, "")
         new_row = {
             constants.hed_id: f"{tag_id}",
@@ -198,12 +212,11 @@ class Schema2DF(Schema2Base):
             constants.properties: self._format_tag_attributes(entry.attributes) if include_props else "",
             constants.description: entry.description,
         }
-        df.loc[len(df)] = new_row
+        self._rows[df_key].append(new_row)
 
     def _write_property_entry(self, entry):
         df_key = constants.ATTRIBUTE_PROPERTY_KEY
         property_type = "AnnotationProperty"
-        df = self.output[df_key]
         tag_id = entry.attributes.get(HedKey.HedID, "")
         new_row = {
             constants.hed_id: f"{tag_id}",
@@ -211,7 +224,7 @@ class Schema2DF(Schema2Base):
             constants.property_type: property_type,
             constants.description: entry.description,
         }
-        df.loc[len(df)] = new_row
+        self._rows[df_key].append(new_row)
 
     def _attribute_disallowed(self, attribute):
         if super()._attribute_disallowed(attribute):
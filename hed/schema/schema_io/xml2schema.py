@@ -2,6 +2,7 @@
 This module is used to create a HedSchema object from an XML file or tree.
 """
 
+import io
 from defusedxml import ElementTree
 import xml
 
@@ -18,34 +19,114 @@ class SchemaLoaderXML(SchemaLoader):
         Expected usage is SchemaLoaderXML.load(filename)
 
         SchemaLoaderXML(filename) will load just the header_attributes
+
+    Notes:
+        - The XML is read incrementally with iterparse.  Each definition element is reduced to a small
+          _XMLRecord as it closes and is then detached, so the full element tree is never held in memory.
+
     """
     def __init__(self, filename, schema_as_string=None, schema=None, file_format=None, name=""):
+        self._section_records = {}
+        self._section_elements = {}
+        self._prologue_texts = []
+        self._epilogue_texts = []
         super().__init__(filename, schema_as_string, schema, file_format, name)
-        self._root_element = None
-        self._parent_map = {}
         self._schema.source_format = ".xml"
 
     def _open_file(self):
-        """Parses an XML file and returns the root element."""
+        """Parses an XML file incrementally into records and returns the root element."""
+        if self.filename:
+            source = self.filename
+        elif isinstance(self.schema_as_string, bytes):
+            source = io.BytesIO(self.schema_as_string)
+        elif isinstance(self.schema_as_string, str):
+            source = io.StringIO(self.schema_as_string)
+        else:
+            raise TypeError(f"Schema must be given as a file name or string, not {type(self.schema_as_string)}")
         try:
-            if self.filename:
-                hed_xml_tree = ElementTree.parse(self.filename)
-                root = hed_xml_tree.getroot()
-            else:
-                root = ElementTree.fromstring(self.schema_as_string)
+            return self._read_records(ElementTree.iterparse(source, events=("start", "end")))
         except xml.etree.ElementTree.ParseError as e:
             raise HedFileError(HedExceptions.CANNOT_PARSE_XML, e.msg, self.name)
 
+    def _read_records(self, events):
+        """ Build the section records from the iterparse events and return the (emptied) root element.
+
+        Parameters:
+            events (iterator): The ("start", "end") iterparse events of the schema.
+
+        Returns:
+            Element: The root element, which keeps its attributes but not its children.
+
+        """
+        section_keys = {name: key for key, name in xml_constants.SECTION_ELEMENTS.items()}
+        record_keys = {name: key for key, name in xml_constants.ELEMENT_NAMES.items()}
+        root = None
+        stack = []  # (element, record or None) for each open element.
+        for event, element in events:
+            if event == "start":
+                if element.tag in record_keys or element.tag in section_keys:
+                    stack.append((element, self._start_record(element, stack, section_keys, record_keys)))
+                else:
+                    stack.append((element, None))
+                if root is None:
+                    root = element
+                continue
+            _, record = stack.pop()
+            if not stack:
+                continue
+            parent, parent_record = stack[-1]
+            if parent_record is not None:
+                self._add_to_record(parent_record, element)
+            elif element.tag == xml_constants.PROLOGUE_ELEMENT:
+                self._prologue_texts.append(element.text)
+            elif element.tag == xml_constants.EPILOGUE_ELEMENT:
+                self._epilogue_texts.append(element.text)
+            if parent_record is not None or record is not None or parent is root:
+                parent.remove(element)
         return root
 
+    def _start_record(self, element, stack, section_keys, record_keys):
+        """ Return a new record if element is a definition element in its expected place or None otherwise. """
+        tag = element.tag
+        if tag in section_keys and section_keys[tag] not in self._section_records:
+            self._section_records[section_keys[tag]] = []
+            self._section_elements[section_keys[tag]] = element
+            return None
+        if not stack or tag not in record_keys:
+            return None
+        parent, parent_record = stack[-1]
+        key = record_keys[tag]
+        if key == HedSectionKey.Units:
+            if parent_record is None or parent.tag != xml_constants.UNIT_CLASS_DEF_ELEMENT:
+                return None
+            siblings = parent_record.children
+        elif key == HedSectionKey.Tags and parent_record is not None and parent.tag == tag:
+            siblings = parent_record.children
+        elif parent is self._section_elements.get(key):
+            siblings = self._section_records[key]
+        else:
+            return None
+        record = _XMLRecord(key)
+        siblings.append(record)
+        return record
+
+    def _add_to_record(self, record, element):
+        """ Store the name, description or an attribute of a record from one of its closed child elements. """
+        tag = element.tag
+        if tag == xml_constants.NAME_ELEMENT and record.name is None:
+            record.name = self._get_text(element, tag)
+        elif tag == xml_constants.DESCRIPTION_ELEMENT and record.description is None:
+            record.description = self._get_text(element, tag)
+        elif tag == xml_constants.ATTRIBUTE_PROPERTY_ELEMENTS[record.key_class]:
+            attribute_name = self._get_element_tag_value(element)
+            attribute_values = [value.text for value in element.iterfind(f".//{xml_constants.VALUE_ELEMENT}")]
+            record.attributes.append((attribute_name, attribute_values))
+
     def _get_header_attributes(self, root_element):
         """Gets the schema attributes from the XML root node"""
         return self._reformat_xsd_attrib(root_element.attrib)
 
     def _parse_data(self):
-        self._root_element = self.input_data
-        self._parent_map = {c: p for p in self._root_element.iter() for c in p}
-
         parse_order = {
             HedSectionKey.Properties: partial(self._populate_section, HedSectionKey.Properties),
             HedSectionKey.Attributes: partial(self._populate_section, HedSectionKey.Attributes),
@@ -56,47 +137,38 @@ class SchemaLoaderXML(SchemaLoader):
         }
         self._schema.prologue = self._read_prologue()
         self._schema.epilogue = self._read_epilogue()
-        self._parse_sections(self._root_element, parse_order)
+        self._parse_sections(parse_order)
 
-    def _parse_sections(self, root_element, parse_order):
+    def _parse_sections(self, parse_order):
         for section_key in parse_order:
-            section_name = xml_constants.SECTION_ELEMENTS[section_key]
-            section_element = self._get_elements_by_name(section_name, root_element)
-            if section_element:
-                section_element = section_element[0]
-            if isinstance(section_element, list):
+            section_records = self._section_records.get(section_key)
+            if section_records is None:
                 raise HedFileError(HedExceptions.INVALID_HED_FORMAT,
                                    "Attempting to load an outdated or invalid XML schema", self.name)
             parse_func = parse_order[section_key]
-            parse_func(section_element)
+            parse_func(section_records)
 
-    def _populate_section(self, key_class, section):
+    def _populate_section(self, key_class, section_records):
         self._schema._initialize_attributes(key_class)
-        def_element_name = xml_constants.ELEMENT_NAMES[key_class]
-        attribute_elements = self._get_elements_by_name(def_element_name, section)
-        for element in attribute_elements:
-            new_entry = self._parse_node(element, key_class)
+        for record in section_records:
+            new_entry = self._parse_node(record, key_class)
             self._add_to_dict(new_entry, key_class)
 
     def _read_prologue(self):
-        prologue_elements = self._get_elements_by_name(xml_constants.PROLOGUE_ELEMENT)
-        if len(prologue_elements) == 1:
-            return prologue_elements[0].text
+        if len(self._prologue_texts) == 1:
+            return self._prologue_texts[0]
         return ""
 
     def _read_epilogue(self):
-        epilogue_elements = self._get_elements_by_name(xml_constants.EPILOGUE_ELEMENT)
-        if len(epilogue_elements) == 1:
-            return epilogue_elements[0].text
+        if len(self._epilogue_texts) == 1:
+            return self._epilogue_texts[0]
         return ""
 
-    def _add_tags_recursive(self, new_tags, parent_tags):
-        for tag_element in new_tags:
-            current_tag = self._get_element_tag_value(tag_element)
-            parents_and_child = parent_tags + [current_tag]
-            full_tag = "/".join(parents_and_child)
+    def _add_tags_recursive(self, new_tags, parent_tag):
+        for tag_record in new_tags:
+            full_tag = tag_record.tag_name if parent_tag is None else parent_tag + "/" + tag_record.tag_name
 
-            tag_entry = self._parse_node(tag_element, HedSectionKey.Tags, full_tag)
+            tag_entry = self._parse_node(tag_record, HedSectionKey.Tags, full_tag)
 
             rooted_entry = self.find_rooted_entry(tag_entry, self._schema, self._loading_merged)
             if rooted_entry:
@@ -104,37 +176,30 @@ class SchemaLoaderXML(SchemaLoader):
                 loading_from_chain_short = tag_entry.short_tag_name
 
                 full_tag = full_tag.replace(loading_from_chain_short, loading_from_chain)
-                tag_entry = self._parse_node(tag_element, HedSectionKey.Tags, full_tag)
-                parents_and_child = full_tag.split("/")
+                tag_entry = self._parse_node(tag_record, HedSectionKey.Tags, full_tag)
 
             self._add_to_dict(tag_entry, HedSectionKey.Tags)
-            child_tags = tag_element.findall("node")
-            self._add_tags_recursive(child_tags, parents_and_child)
+            self._add_tags_recursive(tag_record.children, full_tag)
 
-    def _populate_tag_dictionaries(self, tag_section):
+    def _populate_tag_dictionaries(self, tag_records):
         """Populates a dictionary of dictionaries associated with tags and their attributes."""
         self._schema._initialize_attributes(HedSectionKey.Tags)
-        root_tags = tag_section.findall("node")
+        self._add_tags_recursive(tag_records, None)
 
-        self._add_tags_recursive(root_tags, [])
-
-    def _populate_unit_class_dictionaries(self, unit_section):
+    def _populate_unit_class_dictionaries(self, unit_class_records):
         """Populates a dictionary of dictionaries associated with all the unit classes, unit class units, and unit
            class default units."""
         self._schema._initialize_attributes(HedSectionKey.UnitClasses)
         self._schema._initialize_attributes(HedSectionKey.Units)
-        def_element_name = xml_constants.ELEMENT_NAMES[HedSectionKey.UnitClasses]
-        unit_class_elements = self._get_elements_by_name(def_element_name, unit_section)
 
-        for unit_class_element in unit_class_elements:
-            unit_class_entry = self._parse_node(unit_class_element, HedSectionKey.UnitClasses)
+        for unit_class_record in unit_class_records:
+            unit_class_entry = self._parse_node(unit_class_record, HedSectionKey.UnitClasses)
             unit_class_entry = self._add_to_dict(unit_class_entry, HedSectionKey.UnitClasses)
             if unit_class_entry is None:
                 continue
-            element_units = self._get_elements_by_name(xml_constants.UNIT_CLASS_UNIT_ELEMENT, unit_class_element)
 
-            for element in element_units:
-                unit_class_unit_entry = self._parse_node(element, HedSectionKey.Units)
+            for unit_record in unit_class_record.children:
+                unit_class_unit_entry = self._parse_node(unit_record, HedSectionKey.Units)
                 self._add_to_dict(unit_class_unit_entry, HedSectionKey.Units)
                 unit_class_entry.add_unit(unit_class_unit_entry)
 
@@ -150,24 +215,19 @@ class SchemaLoaderXML(SchemaLoader):
 
         return final_attrib
 
-    def _parse_node(self, node_element, key_class, element_name=None):
+    def _parse_node(self, node_record, key_class, element_name=None):
         if element_name:
             node_name = element_name
         else:
-            node_name = self._get_element_tag_value(node_element)
-        attribute_desc = self._get_element_tag_value(node_element, xml_constants.DESCRIPTION_ELEMENT)
+            node_name = node_record.tag_name
 
         tag_entry = self._schema._create_tag_entry(node_name, key_class)
 
-        if attribute_desc:
-            tag_entry.description = attribute_desc
+        if node_record.description:
+            tag_entry.description = node_record.description
 
-        for attribute_element in node_element:
-            if attribute_element.tag != xml_constants.ATTRIBUTE_PROPERTY_ELEMENTS[key_class]:
-                continue
-            attribute_name = self._get_element_tag_value(attribute_element)
-            attribute_value_elements = self._get_elements_by_name("value", attribute_element)
-            attribute_value = ",".join(element.text for element in attribute_value_elements)
+        for attribute_name, attribute_values in node_record.attributes:
+            attribute_value = ",".join(attribute_values)
             # Todo: do we need to validate this here?
             if not attribute_value:
                 attribute_value = True
@@ -191,33 +251,16 @@ class SchemaLoaderXML(SchemaLoader):
         """
         element = element.find(tag_name)
         if element is not None:
-            if element.text is None and tag_name != "units":
-                raise HedFileError(HedExceptions.HED_SCHEMA_NODE_NAME_INVALID,
-                                   f"A Schema node is empty for tag of element name: '{tag_name}'.",
-                                   self.name)
-            return element.text
+            return self._get_text(element, tag_name)
         return ""
 
-    def _get_elements_by_name(self, element_name='node', parent_element=None):
-        """ Get the elements that have a specific element name.
-
-        Parameters:
-            element_name (str): The name of the element. The default is 'node'.
-            parent_element (RestrictedElement or None): The parent element.
-
-        Returns:
-            list: A list containing elements that have a specific element name.
-        Notes:
-            If a parent element is specified then only the children of the
-            parent will be returned with the given 'element_name'.
-            If not specified the root element will be the parent.
-
-        """
-        if parent_element is None:
-            elements = self._root_element.findall('.//%s' % element_name)
-        else:
-            elements = parent_element.findall('.//%s' % element_name)
-        return elements
+    def _get_text(self, element, tag_name):
+        """ Return the text of an element, raising an error if a name or description is empty. """
+        if element.text is None and tag_name != "units":
+            raise HedFileError(HedExceptions.HED_SCHEMA_NODE_NAME_INVALID,
+                               f"A Schema node is empty for tag of element name: '{tag_name}'.",
+                               self.name)
+        return element.text
 
     def _add_to_dict(self, entry, key_class):
         if entry.has_attribute(HedKey.InLibrary) and not self._loading_merged and not self.appending_to_schema:
@@ -226,3 +269,20 @@ class SchemaLoaderXML(SchemaLoader):
                                self.name)
 
         return self._add_to_dict_base(entry, key_class)
+
+
+class _XMLRecord:
+    """ The parts of a definition element of an XML schema needed to create its schema entry. """
+    __slots__ = ("key_class", "name", "description", "attributes", "children")
+
+    def __init__(self, key_class):
+        self.key_class = key_class
+        self.name = None
+        self.description = None
+        self.attributes = []   # (attribute name, list of value texts) in document order.
+        self.children = []     # Child tag records of a tag or unit records of a unit class.
+
+    @property
+    def tag_name(self):
+        """ The name of the element or '' if it has no name element. """
+        return self.name if self.name is not None else ""
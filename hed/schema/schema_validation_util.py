@@ -1,5 +1,6 @@
 """Utilities used in HED validation/loading using a HED schema."""
 
+import functools
 from hed.errors.error_reporter import ErrorHandler
 from hed.errors.error_types import SchemaWarnings
 from hed.schema import hed_schema_constants as constants
@@ -42,9 +43,8 @@ def validate_schema_term_new(hed_entry, hed_term=None):
     if not hed_term:
         hed_term = hed_entry.name
     issues_list = []
-    # todo: potentially optimize this someday, as most values are the same
-    character_set = get_allowed_characters_by_name(["name"] +
-                                                   hed_entry.attributes.get("allowedCharacter", "").split(","))
+    character_set = _get_cached_character_set(("name",) +
+                                              tuple(hed_entry.attributes.get("allowedCharacter", "").split(",")))
     indexes = get_problem_indexes(hed_term, character_set)
     for char, index in indexes:
         issues_list += ErrorHandler.format_error(SchemaWarnings.SCHEMA_INVALID_CHARACTERS_IN_TAG,
@@ -64,7 +64,7 @@ def validate_schema_description_new(hed_entry):
     if not hed_entry.description:
         return []
     issues_list = []
-    character_set = get_allowed_characters_by_name(["text", "comma"])
+    character_set = _get_cached_character_set(("text", "comma"))
     indexes = get_problem_indexes(hed_entry.description, character_set)
     # Kludge, just get short name here if we have it for error reporting
     name = hed_entry.name
@@ -143,6 +143,12 @@ def get_allowed_characters_by_name(character_set_names):
     return character_set
 
 
+@functools.lru_cache(maxsize=None)
+def _get_cached_character_set(character_set_names):
+    """ Return the characters allowed by a tuple of character set names, computed once per tuple. """
+    return frozenset(get_allowed_characters_by_name(character_set_names))
+
+
 def get_problem_indexes(validation_string, character_set, index_adj=0):
     """Finds indexes with values not in character set
 
@@ -154,7 +160,7 @@ def get_problem_indexes(validation_string, character_set, index_adj=0):
     Returns:
         index_list(tuple of (str, int)): The list of problematic characters and indices
     """
-    if not character_set:
+    if not character_set or character_set.issuperset(validation_string):
         return []
 
     indexes = [(char, index + index_adj) for index, char in enumerate(validation_string) if char not in character_set]
@@ -5,6 +5,7 @@ from hed.errors.error_types import SchemaWarnings
 
 ALLOWED_TAG_CHARS = "-"
 ALLOWED_DESC_CHARS = "-_:;,./()+ ^"
+_REMOVE_DESC_CHARS = str.maketrans("", "", ALLOWED_DESC_CHARS)
 
 
 def validate_schema_tag(hed_entry):
@@ -49,6 +50,10 @@ def validate_schema_description(hed_entry):
     # Blank description is fine
     if not hed_entry.description:
         return issues_list
+    # Most descriptions are fine, so only scan them character by character if a quick check fails.
+    remaining = hed_entry.description.translate(_REMOVE_DESC_CHARS)
+    if not remaining or remaining.isalnum():
+        return issues_list
     for i, char in enumerate(hed_entry.description):
         if char.isalnum():
             continue
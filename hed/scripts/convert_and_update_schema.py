@@ -6,7 +6,7 @@ from hed.errors import get_printable_issue_string, HedFileError
 import argparse
 
 
-def convert_and_update(filenames, set_ids):
+def convert_and_update(filenames, set_ids, jobs=1):
     """ Validate, convert, and update as needed all schemas listed in filenames
 
         If any schema fails to validate, no schemas will be updated.
@@ -14,10 +14,11 @@ def convert_and_update(filenames, set_ids):
     Parameters:
         filenames(list of str): A list of filenames that have been updated
         set_ids(bool): If True, assign missing hedIds
+        jobs(int): Number of worker processes used to validate the schema files.
     """
     # Find and group the changed files
     schema_files = sort_base_schemas(filenames)
-    all_issues = validate_all_schemas(schema_files)
+    all_issues = validate_all_schemas(schema_files, max_workers=jobs)
 
     if not schema_files:
         print("No schema file changes found in the file list")
@@ -77,13 +78,15 @@ def main():
     parser = argparse.ArgumentParser(description='Update other schema formats based on the changed one.')
     parser.add_argument('filenames', nargs='*', help='List of files to process')
     parser.add_argument('--set-ids', action='store_true', help='Add missing HED ids')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes used to validate the schema files')
 
     args = parser.parse_args()
 
     filenames = args.filenames
     set_ids = args.set_ids
 
-    return convert_and_update(filenames, set_ids)
+    return convert_and_update(filenames, set_ids, jobs=args.jobs)
 
 
 if __name__ == "__main__":
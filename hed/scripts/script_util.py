@@ -1,5 +1,7 @@
+import contextlib
 import os.path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from hed.schema import from_string, load_schema, from_dataframes
 from hed.errors import get_printable_issue_string, HedFileError, SchemaWarnings
 from hed.schema.schema_compare import compare_differences
@@ -143,27 +145,40 @@ def validate_all_schema_formats(basename):
     return []
 
 
-def validate_all_schemas(schema_files):
+def validate_all_schemas(schema_files, max_workers=None):
     """Validates all the schema files/formats in the schema dict
 
        If multiple formats were edited, ensures all 3 formats exist and match.
 
     Parameters:
         schema_files(dict of sets): basename:[extensions] dictionary for all files changed
+        max_workers(int or None): If greater than 1, validate the files with this number of worker processes.
 
     Returns:
         issues(list of str): Any issues found validating or loading schemas.
+
+    Notes:
+        - Each (schema, format) file is validated as a separate job.  The worker processes are reused, so each
+          loads a partnered standard schema once and then takes it from the load_schema_version cache.
+        - The results are reported in the order of schema_files, whatever order the jobs finish in.
     """
+    schema_files = {basename: list(extensions) for basename, extensions in schema_files.items()}
+    file_paths = [add_extension(basename, extension)
+                  for basename, extensions in schema_files.items() for extension in extensions]
+    with _get_executor(max_workers, len(file_paths)) as executor:
+        file_issues = iter(_map_jobs(executor, validate_schema, file_paths))
+        schema_issues = {basename: [issue for _ in extensions for issue in next(file_issues)]
+                         for basename, extensions in schema_files.items()}
+
+        format_basenames = [basename for basename, extensions in schema_files.items()
+                            if len(extensions) > 1 and not schema_issues[basename] and "prerelease" in basename]
+        for basename, issues in zip(format_basenames,
+                                    _map_jobs(executor, validate_all_schema_formats, format_basenames)):
+            schema_issues[basename] += issues
+
     all_issues = []
     for basename, extensions in schema_files.items():
-        single_schema_issues = []
-        for extension in extensions:
-            full_path = add_extension(basename, extension)
-            single_schema_issues += validate_schema(full_path)
-
-        if len(extensions) > 1 and not single_schema_issues and "prerelease" in basename:
-            single_schema_issues += validate_all_schema_formats(basename)
-
+        single_schema_issues = schema_issues[basename]
         print(f"Validating: {basename}...")
         print(f"Extensions: {extensions}")
         if single_schema_issues:
@@ -174,6 +189,20 @@ def validate_all_schemas(schema_files):
     return all_issues
 
 
+def _get_executor(max_workers, job_count):
+    """ Return a process pool if max_workers is greater than 1 and there is more than one job, otherwise None. """
+    if not max_workers or max_workers <= 1 or job_count <= 1:
+        return contextlib.nullcontext()
+    return ProcessPoolExecutor(max_workers=min(max_workers, job_count))
+
+
+def _map_jobs(executor, function, items):
+    """ Return the list of function results for the items, computed by executor if it is not None. """
+    if executor is None:
+        return [function(item) for item in items]
+    return list(executor.map(function, items))
+
+
 def get_schema_filename(schema_name, schema_version):
     """ Returns the assembled name of a schema given the name and version
 
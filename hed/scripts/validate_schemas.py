@@ -8,11 +8,13 @@ def main():
     parser.add_argument('schema_files', nargs='+', help='List of schema files to validate.')
     parser.add_argument('--add-all-extensions', action='store_true',
                         help='Always verify all versions of the same schema are equal.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes used to validate the schema files.')
 
     args = parser.parse_args()
 
     schema_files = sort_base_schemas(args.schema_files, args.add_all_extensions)
-    issues = validate_all_schemas(schema_files)
+    issues = validate_all_schemas(schema_files, max_workers=args.jobs)
 
     if issues:
         return 1
@@ -1,5 +1,6 @@
 """ Basic analysis tools. """
 from .file_dictionary import FileDictionary
+from .analysis_cache import AnalysisCache
 from .annotation_util import (check_df_columns, df_to_hed, extract_tags, generate_sidecar_entry, get_bids_dataset,
                               hed_to_df, str_to_tabular, strs_to_sidecar, to_strlist)
 from .event_manager import EventManager
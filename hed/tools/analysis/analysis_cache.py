@@ -0,0 +1,106 @@
+""" Cache of the HED analysis objects for a tabular file shared by several operations. """
+import hashlib
+import json
+import pandas as pd
+
+from hed.tools.analysis.event_manager import EventManager
+from hed.tools.analysis.hed_tag_manager import HedTagManager
+from hed.tools.analysis.hed_type_manager import HedTypeManager
+
+
+class AnalysisCache:
+    """ Cache of the HED analysis objects for a tabular file shared by several operations.
+
+    Notes:
+        - Entries are keyed by file name, schema and sidecar contents.
+        - An entry is reused only if the assembled HED strings and onsets of the file are unchanged, so
+          an operation that modifies the HED-relevant parts of the data invalidates the entry.
+        - The cached objects are shared, so callers must not modify them.
+
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def clear(self):
+        """ Remove all cached entries. """
+        self._entries = {}
+
+    def get_event_manager(self, input_data, hed_schema):
+        """ Return an EventManager for input_data, reusing a cached one if the HED information is unchanged.
+
+        Parameters:
+            input_data (TabularInput): Represents an events file with its sidecar.
+            hed_schema (HedSchema): HED schema used.
+
+        Returns:
+            EventManager: The event manager for input_data.
+
+        :raises HedFileError:
+            - If there are any unmatched offsets.
+
+        """
+        return self._get_entry(input_data, hed_schema)['event_manager']
+
+    def get_tag_manager(self, input_data, hed_schema, remove_types=[]):
+        """ Return a HedTagManager for input_data, reusing a cached one if the HED information is unchanged.
+
+        Parameters:
+            input_data (TabularInput): Represents an events file with its sidecar.
+            hed_schema (HedSchema): HED schema used.
+            remove_types (list or None): List of type tags (such as condition-variable) to remove.
+
+        Returns:
+            HedTagManager: The tag manager for input_data.
+
+        """
+        entry = self._get_entry(input_data, hed_schema)
+        types_key = tuple(remove_types) if remove_types else ()
+        tag_manager = entry['tag_managers'].get(types_key)
+        if tag_manager is None:
+            tag_manager = HedTagManager(entry['event_manager'], remove_types=list(types_key))
+            entry['tag_managers'][types_key] = tag_manager
+        return tag_manager
+
+    def get_type_manager(self, input_data, hed_schema):
+        """ Return a HedTypeManager for input_data, reusing a cached one if the HED information is unchanged.
+
+        Parameters:
+            input_data (TabularInput): Represents an events file with its sidecar.
+            hed_schema (HedSchema): HED schema used.
+
+        Returns:
+            HedTypeManager: The type manager for input_data.  Types added by earlier callers are kept.
+
+        """
+        entry = self._get_entry(input_data, hed_schema)
+        if entry['type_manager'] is None:
+            entry['type_manager'] = HedTypeManager(entry['event_manager'])
+        return entry['type_manager']
+
+    def _get_entry(self, input_data, hed_schema):
+        name = input_data.name if isinstance(input_data.name, str) else id(input_data.name)
+        key = (name, id(hed_schema), self._sidecar_key(input_data.sidecar))
+        fingerprint = self._fingerprint(input_data)
+        entry = self._entries.get(key)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            entry = {'fingerprint': fingerprint, 'schema': hed_schema,
+                     'event_manager': EventManager(input_data, hed_schema),
+                     'tag_managers': {}, 'type_manager': None}
+            self._entries[key] = entry
+        return entry
+
+    @staticmethod
+    def _sidecar_key(sidecar):
+        if not sidecar:
+            return ""
+        return hashlib.sha1(json.dumps(sidecar.loaded_dict, sort_keys=True).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _fingerprint(input_data):
+        """ Return a digest of the assembled HED strings and onsets of input_data. """
+        digest = hashlib.sha1(pd.util.hash_pandas_object(input_data.series_a, index=False).to_numpy().tobytes())
+        onsets = input_data.onsets
+        if onsets is not None:
+            digest.update(pd.util.hash_pandas_object(onsets.astype(str), index=False).to_numpy().tobytes())
+        return digest.hexdigest()
@@ -1,6 +1,6 @@
 """ Manager of events of temporal extent. """
+import numpy as np
 import pandas as pd
-import bisect
 
 from hed.errors.exceptions import HedFileError
 from hed.models.hed_string import HedString
@@ -35,10 +35,17 @@ class EventManager:
         self.input_data = input_data
         self.def_dict = input_data.get_def_dict(hed_schema, extra_def_dicts=extra_defs)
         self.onsets = None  # list of onset times or None if not an events file
-        self.base = None  # list of strings containing the starts of event processes
         self.context = None  # list of strings containing the contexts of event processes
         self.hed_strings = None  # list of HedString objects without the temporal events
         self.event_list = None
+        self._events = None  # events of temporal extent in order of their starting index
+        self._starts = None  # numpy arrays of the positions and times where the events start and end
+        self._ends = None
+        self._start_times = None
+        self._end_times = None
+        self._base = None  # lazily computed lists of strings with the starts and contexts of event processes
+        self._contexts = None
+        self._unfolded = {}  # results of unfold_context keyed by the types removed
         self._create_event_list(input_data)
 
     def _create_event_list(self, input_data):
@@ -64,28 +71,41 @@ class EventManager:
         self.onsets = pd.to_numeric(delay_df.onset, errors='coerce')
         self.event_list = [[] for _ in range(len(hed_strings))]
         onset_dict = {}  # Temporary dictionary keeping track of temporal events that haven't ended yet.
+        duration_events = []
         for event_index, hed in enumerate(hed_strings):
             self._extract_temporal_events(hed, event_index, onset_dict)
-            self._extract_duration_events(hed, event_index)
+            duration_events.extend(self._extract_duration_events(hed, event_index))
         # Now handle the events that extend to end of list
         for item in onset_dict.values():
             item.set_end(len(self.onsets), None)
+        # Todo: This may need updating.  end_index==len(self.onsets) in the edge
+        end_indices = np.searchsorted(self.onsets.to_numpy(), [event.end_time for event in duration_events])
+        for event, end_index in zip(duration_events, end_indices):
+            event.set_end(int(end_index), event.end_time)
         self.hed_strings = hed_strings
         self._extract_context()
 
     def _extract_duration_events(self, hed, event_index):
+        """ Extract the Duration events and remove them from the HED string.
+
+        Parameters:
+            hed (HedString):  The assembled HedString at position event_index in the data.
+            event_index (int): The position of this string in the data.
+
+        Returns:
+            list:  The TemporalEvent objects created.  Their end indices are set by the caller.
+
+        """
         groups = hed.find_top_level_tags(anchor_tags={DefTagNames.DURATION_KEY})
         to_remove = []
+        new_events = []
         for duration_tag, group in groups:
-            start_time = self.onsets[event_index]
-            new_event = TemporalEvent(group, event_index, start_time)
-            end_time = new_event.end_time
-            # Todo: This may need updating.  end_index==len(self.onsets) in the edge
-            end_index = bisect.bisect_left(self.onsets, end_time)
-            new_event.set_end(end_index, end_time)
+            new_event = TemporalEvent(group, event_index, self.onsets[event_index])
             self.event_list[event_index].append(new_event)
+            new_events.append(new_event)
             to_remove.append(group)
         hed.remove(to_remove)
+        return new_events
 
     def _extract_temporal_events(self, hed, event_index, onset_dict):
         """ Extract the temporal events and remove them from the other HED strings.
@@ -129,9 +149,16 @@ class EventManager:
             list of str or HedString or None representing the onsets of the events of temporal extent.
             list of str or HedString or None representing the ongoing context information.
 
-        If the
+        Notes:
+            - The results are cached for each value of remove_types and copies of the lists are returned.
+
         """
+        key = tuple(remove_types) if remove_types else ()
+        if key not in self._unfolded:
+            self._unfolded[key] = self._unfold_context(remove_types)
+        return tuple(None if item is None else list(item) for item in self._unfolded[key])
 
+    def _unfold_context(self, remove_types):
         remove_defs = self.get_type_defs(remove_types)  # definitions corresponding to remove types to be filtered out
         new_hed = ["" for _ in range(len(self.hed_strings))]
         for index, item in enumerate(self.hed_strings):
@@ -155,26 +182,124 @@ class EventManager:
         for index, item in enumerate(self.hed_strings):
             new_base[index] = self._filter_hed(self.base[index], remove_types=remove_types,
                                                remove_defs=remove_defs, remove_group=True)
-            new_contexts[index] = self._filter_hed(self.contexts[index], remove_types=remove_types,
-                                                   remove_defs=remove_defs, remove_group=True)
+        # Ongoing contexts usually repeat over many rows, so each distinct context is only filtered once.
+        filtered = {}
+        for index, context in enumerate(self.contexts):
+            if context not in filtered:
+                filtered[context] = self._filter_hed(context, remove_types=remove_types,
+                                                     remove_defs=remove_defs, remove_group=True)
+            new_contexts[index] = filtered[context]
         return new_base, new_contexts   # these are each a list of strings
 
     def _extract_context(self):
-        """ Expand the onset and the ongoing context for additional processing.
+        """ Index the events of temporal extent by their starting and ending positions and times.
+
+        Notes: The events are ordered by starting index, so the start arrays are sorted.
+
+        """
+        self._events = [event for events in self.event_list for event in events]
+        self._starts = np.array([event.start_index for event in self._events], dtype=np.int64)
+        self._ends = np.array([event.end_index for event in self._events], dtype=np.int64)
+        self._start_times = np.array([event.start_time for event in self._events], dtype=float)
+        self._end_times = np.array([np.inf if event.end_time is None else event.end_time
+                                    for event in self._events], dtype=float)
+        self._base = None
+        self._contexts = None
+
+    @property
+    def base(self):
+        """ List of strings containing the starts of event processes or None if not an events file. """
+        if self._base is None and self._events is not None:
+            base = [[] for _ in range(len(self.hed_strings))]
+            for event in self._events:
+                base[event.start_index].append(str(event.contents))
+            self._base = self.compress_strings(base)
+        return self._base
+
+    @property
+    def contexts(self):
+        """ List of strings containing the ongoing contexts of event processes or None if not an events file.
+
+        Notes:
+            - An event is in the context of the positions strictly after its start and before its end.
+            - Computed with a sweep over the positions, and rows with the same ongoing events share one string.
+
+        """
+        if self._contexts is None and self._events is not None:
+            self._contexts = self._sweep_contexts()
+        return self._contexts
+
+    def _sweep_contexts(self):
+        """ Return the context strings of all positions by sweeping the active events. """
+        contexts = ["" for _ in range(len(self.hed_strings))]
+        active = {}  # Event ids in insertion order, which is the order of their starts.
+        context = ""
+        starts_at = {}
+        ends_at = {}
+        for event_id, (start, end) in enumerate(zip(self._starts.tolist(), self._ends.tolist())):
+            if end > start + 1:
+                starts_at.setdefault(start + 1, []).append(event_id)
+                ends_at.setdefault(end, []).append(event_id)
+        for index in range(len(contexts)):
+            changed = False
+            for event_id in ends_at.get(index, []):
+                del active[event_id]
+                changed = True
+            for event_id in starts_at.get(index, []):
+                active[event_id] = str(self._events[event_id].contents)
+                changed = True
+            if changed:
+                context = ",".join(active.values())
+            contexts[index] = context
+        return contexts
+
+    def get_context_events(self, index):
+        """ Return the events of temporal extent that are ongoing context at a position.
+
+        Parameters:
+            index (int): The position (row) in the data.
+
+        Returns:
+            list:  TemporalEvent objects that started before index and end after it, in order of start.
+
+        """
+        if self._events is None:
+            return []
+        candidates = np.searchsorted(self._starts, index, side='left')
+        ids = np.flatnonzero(self._ends[:candidates] > index)
+        return [self._events[event_id] for event_id in ids]
+
+    def get_context(self, index):
+        """ Return the ongoing context string at a position without expanding all contexts.
+
+        Parameters:
+            index (int): The position (row) in the data.
+
+        Returns:
+            str:  The comma-separated contents of the events that are ongoing at index.
+
+        """
+        if self._contexts is not None:
+            return self._contexts[index]
+        return ",".join(str(event.contents) for event in self.get_context_events(index))
 
-        Notes: For each event, the Onset goes in the base list and the remainder of the times go in the contexts list.
+    def get_active_events(self, time):
+        """ Return the events of temporal extent that are active at a time.
+
+        Parameters:
+            time (float): The time (usually in seconds).
+
+        Returns:
+            list:  TemporalEvent objects with start_time <= time < end_time, in order of start.
+
+        Notes:
+            - Events that are not ended are active until the end of the data.
 
         """
-        base = [[] for _ in range(len(self.hed_strings))]
-        contexts = [[] for _ in range(len(self.hed_strings))]
-        for events in self.event_list:
-            for event in events:
-                this_str = str(event.contents)
-                base[event.start_index].append(this_str)
-                for i in range(event.start_index + 1, event.end_index):
-                    contexts[i].append(this_str)
-        self.base = self.compress_strings(base)
-        self.contexts = self.compress_strings(contexts)
+        if self._events is None:
+            return []
+        ids = np.flatnonzero((self._start_times <= time) & (self._end_times > time))
+        return [self._events[event_id] for event_id in ids]
 
     def _filter_hed(self, hed, remove_types=[], remove_defs=[], remove_group=False):
         """ Remove types and definitions from a HED string.
@@ -1,6 +1,7 @@
 """ Classes for managing counts of HED tags for columnar files. """
 
 import copy
+from collections import Counter
 
 
 class HedTagCount:
@@ -77,13 +78,35 @@ class HedTagCounts:
         name (str):  An identifier for these counts (usually the filename of the tabular file).
         total_events (int):  The total number of events in the columnar file.
 
+    Notes:
+        - Counts are accumulated by integer tag id in Counters, so updating does not create objects per string.
+          The HedTagCount objects of tag_dict are only built when tag_dict is accessed.
+
     """
 
     def __init__(self, name, total_events=0):
-        self.tag_dict = {}
         self.name = name
         self.files = {}
         self.total_events = total_events
+        self._name_ids = {}          # Short base tag (as it appears in the HedTag) to tag id.
+        self._tag_ids = {}           # Casefolded short base tag to tag id.
+        self._tag_protos = []        # HedTagCount of the first occurrence of each tag id (holds tag and tag_terms).
+        self._event_counts = Counter()  # Tag id to the number of events containing the tag.
+        self._value_counts = Counter()  # (tag id, value) to the number of occurrences of the value.
+        self._tag_files = []         # Dictionary of files (in order of first occurrence) for each tag id.
+        self._file_ids = {}          # File name to the set of tag ids seen in that file.
+        self._tag_dict = None
+
+    @property
+    def tag_dict(self):
+        """ Dictionary of casefolded short base tag to HedTagCount with the counts so far. """
+        if self._tag_dict is None:
+            value_dicts = [{} for _ in self._tag_protos]
+            for (tag_id, value), count in self._value_counts.items():
+                value_dicts[tag_id][value] = count
+            self._tag_dict = {key: self._make_tag_count(tag_id, value_dicts[tag_id])
+                              for key, tag_id in self._tag_ids.items()}
+        return self._tag_dict
 
     def update_tag_counts(self, hed_string_obj, file_name):
         """ Update the tag counts based on a HedString object.
@@ -98,15 +121,77 @@ class HedTagCounts:
         if not hed_string_obj:
             return
         tag_list = hed_string_obj.get_all_tags()
-        tag_dict = {}
+        name_ids = self._name_ids
+        tag_ids = []
         for tag in tag_list:
-            str_tag = tag.short_base_tag.casefold()
-            if str_tag not in tag_dict:
-                tag_dict[str_tag] = HedTagCount(tag, file_name)
-            else:
-                tag_dict[str_tag].set_value(tag)
+            tag_id = name_ids.get(tag.short_base_tag)
+            if tag_id is None:
+                tag_id = self._add_tag(tag, file_name)
+            tag_ids.append(tag_id)
+        self._value_counts.update(zip(tag_ids, [tag.extension or None for tag in tag_list]))
+        event_ids = set(tag_ids)
+        self._event_counts.update(event_ids)
+        self._add_files(file_name, event_ids)
+        self._tag_dict = None
+
+    def _add_tag(self, tag, file_name):
+        """ Return the tag id of a HedTag, registering its short base tag first if needed.
+
+        Parameters:
+            tag (HedTag): The tag whose id is needed.
+            file_name (str): The name of the file in which the tag occurs.
+
+        Returns:
+            int: The tag id.
+
+        """
+        short_base_tag = tag.short_base_tag
+        tag_id = self._get_tag_id(short_base_tag.casefold(), HedTagCount(tag, file_name))
+        self._name_ids[short_base_tag] = tag_id
+        return tag_id
+
+    def _get_tag_id(self, key, tag_count):
+        """ Return the tag id of a casefolded short base tag, using tag_count as its prototype if it is new.
+
+        Parameters:
+            key (str): Casefolded short base tag.
+            tag_count (HedTagCount): The counts of the first occurrence of the tag.
 
-        self.merge_tag_dicts(tag_dict)
+        Returns:
+            int: The tag id.
+
+        """
+        tag_id = self._tag_ids.get(key)
+        if tag_id is None:
+            tag_id = len(self._tag_protos)
+            self._tag_ids[key] = tag_id
+            self._tag_protos.append(tag_count.get_empty())
+            self._tag_files.append({})
+        return tag_id
+
+    def _add_files(self, file_name, tag_ids):
+        """ Record that the tags with the given ids occur in a file.
+
+        Parameters:
+            file_name (str): The name of the file.
+            tag_ids (set): The ids of the tags in the file.
+
+        """
+        seen = self._file_ids.setdefault(file_name, set())
+        new_ids = tag_ids - seen
+        if not new_ids:
+            return
+        seen.update(new_ids)
+        for tag_id in sorted(new_ids):
+            self._tag_files[tag_id][file_name] = ''
+
+    def _make_tag_count(self, tag_id, value_dict):
+        """ Return a HedTagCount with the accumulated counts for a tag id. """
+        tag_count = self._tag_protos[tag_id].get_empty()
+        tag_count.events = self._event_counts[tag_id]
+        tag_count.files = dict(self._tag_files[tag_id])
+        tag_count.value_dict = value_dict
+        return tag_count
 
     def organize_tags(self, tag_template):
         """ Organize tags into categories as specified by the tag_template.
@@ -133,18 +218,12 @@ class HedTagCounts:
 
         """
         for tag, count in other_dict.items():
-            if tag not in self.tag_dict:
-                self.tag_dict[tag] = count.get_empty()
-            self.tag_dict[tag].events = self.tag_dict[tag].events + count.events
+            tag_id = self._get_tag_id(tag, count)
+            self._event_counts[tag_id] += count.events
             for file in count.files:
-                self.tag_dict[tag].files[file] = ''
-            if not self.tag_dict[tag].value_dict:
-                continue
-            for value, val_count in count.value_dict.items():
-                if value in self.tag_dict[tag].value_dict:
-                    self.tag_dict[tag].value_dict[value] = self.tag_dict[tag].value_dict + val_count
-                else:
-                    self.tag_dict[tag].value_dict[value] = val_count
+                self._add_files(file, {tag_id})
+            self._value_counts.update({(tag_id, value): val_count for value, val_count in count.value_dict.items()})
+        self._tag_dict = None
 
     def get_summary(self):
         """ Return a summary object containing the tag count information of this summary.
@@ -22,6 +22,7 @@ class HedTagManager:
         self.hed_strings, self.base_strings, self.context_strings = (
             self.event_manager.unfold_context(remove_types=remove_types))
         self.type_def_names = self.event_manager.get_type_defs(remove_types)
+        self._hed_objs = {}  # lists of HED string objects keyed by (include_context, replace_defs)
 
     def get_hed_objs(self, include_context=True, replace_defs=False):
         """ Return a list of HED string objects of same length as the tabular file.
@@ -33,7 +34,16 @@ class HedTagManager:
         Returns:
             list - List of HED strings of same length as tabular file.
 
+        Notes:
+            - The HedString objects are cached and shared between calls, so they should not be modified.
+
         """
+        key = (include_context, replace_defs)
+        if key not in self._hed_objs:
+            self._hed_objs[key] = self._make_hed_objs(include_context, replace_defs)
+        return list(self._hed_objs[key])
+
+    def _make_hed_objs(self, include_context, replace_defs):
         hed_objs = [None for _ in range(len(self.event_manager.onsets))]
         for index in range(len(hed_objs)):
             hed_list = [self.hed_strings[index], self.base_strings[index]]
@@ -78,12 +78,13 @@ class HedType:
             summary[var_name] = var_sum.get_summary()
         return summary
 
-    def get_type_factors(self, type_values=None, factor_encoding="one-hot"):
+    def get_type_factors(self, type_values=None, factor_encoding="one-hot", sparse=False):
         """ Create a dataframe with the indicated type tag values as factors.
 
         Parameters:
             type_values (list or None): A list of values of type tags for which to generate factors.
             factor_encoding (str):      Type of factor encoding (one-hot or categorical).
+            sparse (bool):              If True, one-hot factors are returned as pandas sparse columns.
 
         Returns:
             DataFrame:  Contains the specified factors associated with this type tag.
@@ -97,7 +98,7 @@ class HedType:
             var_sum = self._type_map.get(type_value, None)
             if not var_sum:
                 continue
-            df_list.append(var_sum.get_factors(factor_encoding=factor_encoding))
+            df_list.append(var_sum.get_factors(factor_encoding=factor_encoding, sparse=sparse))
         if not df_list:
             return None
         else:
@@ -148,9 +149,7 @@ class HedType:
             if hed_var is None:
                 hed_var = HedTypeFactors(self.type_tag, var_name, self.total_events)
                 self._type_map[var_name] = hed_var
-            var_levels = hed_var.levels.get(level, {index: 0})
-            var_levels[index] = 0
-            hed_var.levels[level] = var_levels
+            hed_var.add_level_index(level, index)
 
     def _extract_variables(self):
         """ Extract all type_variables from hed_strings and event_contexts. """
@@ -199,4 +198,4 @@ class HedType:
             if hed_var is None:
                 hed_var = HedTypeFactors(self.type_tag, tag_value, self.total_events)
             self._type_map[tag_value] = hed_var
-            hed_var.direct_indices[index] = ''
+            hed_var.add_direct_index(index)
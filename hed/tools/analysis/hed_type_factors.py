@@ -1,11 +1,19 @@
 """ Manager for factor information for a columnar file. """
 
+from collections.abc import Mapping
+import numpy as np
 import pandas as pd
 from hed.errors.exceptions import HedFileError
 
 
 class HedTypeFactors:
-    """ Holds index of positions for a variable type for A columnar file. """
+    """ Holds index of positions for a variable type for A columnar file.
+
+    Notes:
+        - The positions are stored as parallel arrays of (row, level) pairs, compressed on demand into
+          level-major sparse (CSR) form, so factor vectors are built with numpy indexing.
+
+    """
 
     ALLOWED_ENCODINGS = ("categorical", "one-hot")
 
@@ -22,43 +30,80 @@ class HedTypeFactors:
         self.type_value = type_value
         self.number_elements = number_elements
         self.type_tag = type_tag.casefold()
-        self.levels = {}
-        self.direct_indices = {}
+        self._level_names = []     # Level names in order of first occurrence.
+        self._level_ids = {}       # Level name to its position in _level_names.
+        self._level_rows = []      # Rows and level ids of the level occurrences (may contain duplicates).
+        self._level_cols = []
+        self._direct_rows = []     # Rows with direct (non-definition) references to the type value.
+        self._csr = None           # Cached (level offsets, rows) of the unique occurrences.
 
     def __str__(self):
         return f"[{self.type_value},{self.type_tag}]: {self.number_elements} elements " + \
             f"{str(self.levels)} levels {len(self.direct_indices)} references"
 
-    def get_factors(self, factor_encoding="one-hot"):
+    @property
+    def levels(self):
+        """ A live read-only mapping of each level to a dictionary whose keys are the positions of the level. """
+        return _LevelsView(self)
+
+    @property
+    def direct_indices(self):
+        """ A dictionary whose keys are the positions with direct references to the type value. """
+        return dict.fromkeys(np.unique(np.array(self._direct_rows, dtype=np.int64)).tolist(), '')
+
+    def add_level_index(self, level, index):
+        """ Record that a level of this type value occurs at a position.
+
+        Parameters:
+            level (str): The level (usually a lowercase definition name).
+            index (int): The position in the data column.
+
+        """
+        level_id = self._level_ids.get(level)
+        if level_id is None:
+            level_id = len(self._level_names)
+            self._level_ids[level] = level_id
+            self._level_names.append(level)
+        self._level_rows.append(index)
+        self._level_cols.append(level_id)
+        self._csr = None
+
+    def add_direct_index(self, index):
+        """ Record that the type value is referenced directly at a position.
+
+        Parameters:
+            index (int): The position in the data column.
+
+        """
+        self._direct_rows.append(index)
+
+    def get_factors(self, factor_encoding="one-hot", sparse=False):
         """ Return a DataFrame of factor vectors for this type factor.
 
         Parameters:
             factor_encoding (str):   Specifies type of factor encoding (one-hot or categorical).
+            sparse (bool):  If True, one-hot columns are returned as pandas sparse arrays.
 
         Returns:
             DataFrame:   DataFrame containing the factor vectors as the columns.
 
         """
 
-        if not self.levels:
-            df = pd.DataFrame(0, index=range(self.number_elements), columns=[self.type_value])
-            df.loc[list(self.direct_indices.keys()), [self.type_value]] = 1
-            return df
-
-        levels = list(self.levels.keys())
-        levels_list = [f"{self.type_value}.{level}" for level in levels]
-        factors = pd.DataFrame(0, index=range(self.number_elements), columns=levels_list)
-        for index, level in enumerate(levels):
-            index_keys = list(self.levels[level].keys())
-            factors.loc[index_keys, [levels_list[index]]] = 1
+        if not self._level_names:
+            factor = np.zeros(self.number_elements, dtype=np.int64)
+            factor[np.array(self._direct_rows, dtype=np.int64)] = 1
+            return self._make_frame([self.type_value], factor.reshape(-1, 1), sparse)
+
+        levels_list = [f"{self.type_value}.{level}" for level in self._level_names]
+        factors = self._get_one_hot()
         if factor_encoding == "one-hot":
-            return factors
+            return self._make_frame(levels_list, factors, sparse)
         sum_factors = factors.sum(axis=1)
         if factor_encoding == "categorical" and sum_factors.max() > 1:
             raise HedFileError("MultipleFactorSameEvent",
-                               f"{self.type_value} has multiple occurrences at index {sum_factors.idxmax()}", "")
+                               f"{self.type_value} has multiple occurrences at index {int(sum_factors.argmax())}", "")
         elif factor_encoding == "categorical":
-            return self._one_hot_to_categorical(factors, levels)
+            return self._categorical(factors, [level.casefold() for level in self._level_names])
         else:
             raise ValueError("BadFactorEncoding",
                              f"{factor_encoding} is not in the allowed encodings: {str(self.ALLOWED_ENCODINGS)}")
@@ -73,18 +118,56 @@ class HedTypeFactors:
         Return:
             DataFrame:  Contains one-hot representation of requested levels.
 
+        Notes:
+            - A direct type_value column takes precedence, then the levels in the order given.
+
         """
-        df = pd.DataFrame('n/a', index=range(len(factors.index)), columns=[self.type_value])
-        for index, row in factors.iterrows():
-            if self.type_value in row.index and row[self.type_value]:
-                df.at[index, self.type_value] = self.type_value
-                continue
-            for level in levels:
-                level_str = f"{self.type_value}.{level.casefold()}"
-                if level_str in row.index and row[level_str]:
-                    df.at[index, self.type_value] = level.casefold()
-                    break
-        return df
+        names = []
+        columns = []
+        if self.type_value in factors.columns:
+            names.append(self.type_value)
+            columns.append(self.type_value)
+        for level in levels:
+            level_str = f"{self.type_value}.{level.casefold()}"
+            if level_str in factors.columns:
+                names.append(level.casefold())
+                columns.append(level_str)
+        return self._categorical(factors[columns].to_numpy(), names)
+
+    def _categorical(self, factors, names):
+        """ Return a DataFrame with the name of the first nonzero column of each row of factors or 'n/a'. """
+        values = np.full(len(factors), 'n/a', dtype=object)
+        if len(names):
+            present = factors != 0
+            has_value = present.any(axis=1)
+            values[has_value] = np.array(names, dtype=object)[present.argmax(axis=1)[has_value]]
+        return pd.DataFrame({self.type_value: values})
+
+    def _get_one_hot(self):
+        """ Return the dense one-hot matrix (rows by levels) built with a single fancy-index assignment. """
+        offsets, rows = self._get_csr()
+        cols = np.repeat(np.arange(len(self._level_names)), np.diff(offsets))
+        factors = np.zeros((self.number_elements, len(self._level_names)), dtype=np.int64)
+        factors[rows, cols] = 1
+        return factors
+
+    def _get_csr(self):
+        """ Return the unique level occurrences in CSR form as (level offsets, rows sorted within each level). """
+        if self._csr is None:
+            num_levels = len(self._level_names)
+            keys = np.unique(np.array(self._level_cols, dtype=np.int64) * max(self.number_elements, 1) +
+                             np.array(self._level_rows, dtype=np.int64))
+            cols, rows = np.divmod(keys, max(self.number_elements, 1))
+            offsets = np.zeros(num_levels + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(np.bincount(cols, minlength=num_levels))
+            self._csr = (offsets, rows)
+        return self._csr
+
+    def _make_frame(self, columns, factors, sparse):
+        if not sparse:
+            return pd.DataFrame(factors, columns=columns)
+        return pd.DataFrame({column: pd.arrays.SparseArray(factors[:, index], fill_value=0)
+                             for index, column in enumerate(columns)})
 
     def get_summary(self):
         """ Return the summary of the type tag value as a dictionary.
@@ -93,15 +176,12 @@ class HedTypeFactors:
             dict:  Contains the summary.
 
         """
-        count_list = [0] * self.number_elements
-        for index in list(self.direct_indices.keys()):
-            count_list[index] = count_list[index] + 1
-        for level, cond in self.levels.items():
-            for index, item in cond.items():
-                count_list[index] = count_list[index] + 1
+        direct_rows = np.unique(np.array(self._direct_rows, dtype=np.int64))
+        count_list = np.bincount(direct_rows, minlength=self.number_elements) + \
+            np.bincount(self._get_csr()[1], minlength=self.number_elements)
         number_events, number_multiple, max_multiple = self._count_level_events(count_list)
         summary = {'type_value': self.type_value, 'type_tag': self.type_tag,
-                   'levels': len(self.levels.keys()), 'direct_references': len(self.direct_indices.keys()),
+                   'levels': len(self._level_names), 'direct_references': len(direct_rows),
                    'total_events': self.number_elements, 'events': number_events,
                    'events_with_multiple_refs': number_multiple, 'max_refs_per_event': max_multiple,
                    'level_counts': self._get_level_counts()}
@@ -114,10 +194,8 @@ class HedTypeFactors:
             dict:  Dictionary with counts of level values.
 
         """
-        count_dict = {}
-        for level, cond in self.levels.items():
-            count_dict[level] = len(cond.values())
-        return count_dict
+        counts = np.diff(self._get_csr()[0]).tolist()
+        return dict(zip(self._level_names, counts))
 
     @staticmethod
     def _count_level_events(count_list):
@@ -131,14 +209,26 @@ class HedTypeFactors:
         """
         if not len(count_list):
             return 0, 0, None
-        number_events = 0
-        number_multiple = 0
-        max_multiple = count_list[0]
-        for index, count in enumerate(count_list):
-            if count_list[index] > 0:
-                number_events = number_events + 1
-            if count_list[index] > 1:
-                number_multiple = number_multiple + 1
-            if count_list[index] > max_multiple:
-                max_multiple = count_list[index]
-        return number_events, number_multiple, max_multiple
+        counts = np.asarray(count_list)
+        return int(np.count_nonzero(counts > 0)), int(np.count_nonzero(counts > 1)), int(counts.max())
+
+
+class _LevelsView(Mapping):
+    """ Read-only view of the levels of a HedTypeFactors as a dictionary of dictionaries keyed by position. """
+
+    def __init__(self, factors):
+        self._factors = factors
+
+    def __getitem__(self, level):
+        level_id = self._factors._level_ids[level]
+        offsets, rows = self._factors._get_csr()
+        return dict.fromkeys(rows[offsets[level_id]:offsets[level_id + 1]].tolist(), 0)
+
+    def __iter__(self):
+        return iter(self._factors._level_names)
+
+    def __len__(self):
+        return len(self._factors._level_names)
+
+    def __repr__(self):
+        return str(dict(self.items()))
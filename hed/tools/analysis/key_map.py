@@ -1,5 +1,6 @@
 """ A map of column value keys into new column values. """
 
+import numpy as np
 import pandas as pd
 from hed.errors.exceptions import HedFileError
 from hed.tools.util import data_util
@@ -15,6 +16,7 @@ class KeyMap:
 
     Notes: This mapping converts all columns in the mapping to strings.
     The remapping does not support other types of columns.
+    Keys are tuples of the string values of the key columns and are computed column-wise for all rows at once.
 
     """
 
@@ -40,7 +42,7 @@ class KeyMap:
                              f"Key cols {str(key_cols)} and target cols {str(target_cols)} must be disjoint", "")
         self.name = name
         self.col_map = pd.DataFrame(columns=self.key_cols + self.target_cols)
-        self.map_dict = {}  # Index of key to position in the col_map DataFrame
+        self.map_dict = {}  # Key tuple to position in the col_map DataFrame
         self.count_dict = {}  # Keeps a running count of the number of times a key appears in the data
 
     @property
@@ -54,9 +56,8 @@ class KeyMap:
 
     def __str__(self):
         temp_list = [f"{self.name} counts for key [{str(self.key_cols)}]:"]
-        for index, row in self.col_map.iterrows():
-            key_hash = data_util.get_row_hash(row, self.columns)
-            temp_list.append(f"{str(list(row.values))}:\t{self.count_dict[key_hash]}")
+        for values, count in zip(self.col_map.values.tolist(), self._get_counts()):
+            temp_list.append(f"{str(values)}:\t{count}")
         return "\n".join(temp_list)
 
     def make_template(self, additional_cols=None, show_counts=True):
@@ -97,9 +98,8 @@ class KeyMap:
 
         """
         counts = [0 for _ in range(len(self.col_map))]
-        for index, row in self.col_map.iterrows():
-            key_hash = data_util.get_row_hash(row, self.key_cols)
-            counts[index] = self.count_dict[key_hash]
+        for key, position in self.map_dict.items():
+            counts[position] = self.count_dict[key]
         return counts
 
     def remap(self, data):
@@ -136,36 +136,26 @@ class KeyMap:
         Returns:
             list:  The row numbers that had no correspondence in the mapping.
         """
-        key_series = df.apply(lambda row: data_util.get_row_hash(row, self.key_cols), axis=1)
-        # Key series now contains row_number: hash for each row in the dataframe
-
-        # Add a column containing the mapped index for each row
-        map_series = pd.Series(self.map_dict)  # map_series is hash:row_index for each entry in the map_dict index
-        key_values = key_series.map(map_series)  # key_values is df_row_number:map_dict_index
-        # e.g. a key_value entry of 0:79 means row 0 maps to row 79 in the map_dict
-
-        # This adds the map_dict_index column, to merged_df as a new column "key_value"
-        merged_df = df.assign(key_value=key_values.values)
-
-        # Copy all the map_dict data into merged_df as new columns, merging on the map_dict_index number of both
-        remapped_df = pd.merge(merged_df, self.col_map, left_on='key_value', right_index=True,
-                               suffixes=('', '_new'), how='left').fillna("n/a")
-
-        # Override the original columns with our newly calculated ones
+        # Look up the col_map position of every row at once (-1 when the key is not in the map).
+        map_positions = np.fromiter(self.map_dict.values(), dtype=np.int64, count=len(self.map_dict))
+        map_index = pd.MultiIndex.from_tuples(list(self.map_dict.keys()), names=self.key_cols) \
+            if self.map_dict else pd.MultiIndex.from_arrays([[]] * len(self.key_cols), names=self.key_cols)
+        codes = map_index.get_indexer(self._get_key_index(df))
+        positions = np.full(len(codes), -1, dtype=np.int64)
+        positions[codes >= 0] = map_positions[codes[codes >= 0]]
+
+        # Rows with missing keys reindex to NaN, which becomes n/a as in a left merge.
+        remapped_df = self.col_map[self.target_cols].reindex(positions).fillna("n/a")
         for col in self.target_cols:
-            df[col] = remapped_df[col + '_new']
+            df[col] = remapped_df[col].to_numpy()
 
-        # Finally calculate missing indices
-        missing_indices = key_series.index[key_values.isna()].tolist()
-
-        return missing_indices
+        return df.index[codes < 0].tolist()
 
     def resort(self):
         """ Sort the col_map in place by the key columns. """
         self.col_map.sort_values(by=self.key_cols, inplace=True, ignore_index=True)
-        for index, row in self.col_map.iterrows():
-            key_hash = data_util.get_row_hash(row, self.key_cols)
-            self.map_dict[key_hash] = index
+        for index, key in enumerate(self._get_key_index(self.col_map)):
+            self.map_dict[key] = index
 
     def update(self, data, allow_missing=True):
         """ Update the existing map with information from data.
@@ -204,38 +194,44 @@ class KeyMap:
 
         """
 
-        row_list = []
+        if base_df.empty:
+            return
+        # Factorize the keys: unique keys are in order of first appearance.
+        codes, unique_keys = self._get_key_index(base_df).factorize()
+        counts = np.bincount(codes, minlength=len(unique_keys))
+        first_rows = np.unique(codes, return_index=True)[1]
+        new_rows = []
         next_pos = len(self.col_map)
-        for index, row in base_df.iterrows():
-            key, pos_update = self._handle_update(row, row_list, next_pos)
-            next_pos += pos_update
-        if row_list:
-            df = pd.DataFrame(row_list)
+        for key, count, first_row in zip(unique_keys, counts.tolist(), first_rows.tolist()):
+            if key not in self.map_dict:
+                self.map_dict[key] = next_pos
+                self.count_dict[key] = 0
+                new_rows.append(first_row)
+                next_pos += 1
+            self.count_dict[key] = self.count_dict[key] + count
+        if new_rows:
+            df = base_df.iloc[new_rows]
             # Ignore empty col_map to suppress warning
             col_map = self.col_map if not self.col_map.empty else None
             self.col_map = pd.concat([col_map, df], axis=0, ignore_index=True)
 
-    def _handle_update(self, row, row_list, next_pos):
-        """ Update the dictionary and counts of the number of times this combination of key columns appears.
+    def _get_key_index(self, df):
+        """ Return a MultiIndex of the key tuples of the rows of df.
 
         Parameters:
-            row (DataSeries):  Data the values in a row.
-            row_list (list):   A list of rows to be appended to hold the unique rows.
-            next_pos (int):    Index into the row_list of this row
+            df (DataFrame): DataFrame containing the key columns.
 
         Returns:
-            tuple: (key, pos_update)  key is the row hash and pos_update is 1 if new row or 0 otherwise.
+            MultiIndex:  The string values of the key columns for each row, with missing values as n/a.
+
+        :raises HedFileError:
+            - If df doesn't have all the key columns.
 
         """
-        key = data_util.get_row_hash(row, self.key_cols)
-        pos_update = 0
-        if key not in self.map_dict:
-            self.map_dict[key] = next_pos
-            row_list.append(row)
-            pos_update = 1
-            self.count_dict[key] = 0
-        self.count_dict[key] = self.count_dict[key] + 1
-        return key, pos_update
+        columns_present, columns_missing = data_util.separate_values(list(df.columns), self.key_cols)
+        if columns_missing:
+            raise HedFileError("lookup_row", f"row must have all keys, missing{str(columns_missing)}", "")
+        return pd.MultiIndex.from_frame(df[self.key_cols].fillna('n/a').astype(str))
 
     @staticmethod
     def remove_quotes(df, columns=None):
@@ -3,6 +3,9 @@
 import os
 import json
 import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from hed.errors.exceptions import HedFileError
 from hed.tools.util import io_util
@@ -13,7 +16,9 @@ class BackupManager:
     DEFAULT_BACKUP_NAME = 'default_back'
     RELATIVE_BACKUP_LOCATION = './derivatives/remodel/backups'
     BACKUP_DICTIONARY = 'backup_lock.json'
+    BACKUP_HASHES = 'backup_hashes.json'
     BACKUP_ROOT = 'backup_root'
+    BACKUP_STRATEGIES = ('copy', 'link', 'reflink')
 
     def __init__(self, data_root, backups_root=None):
         """ Constructor for the backup manager.
@@ -37,47 +42,75 @@ class BackupManager:
         self.backups_path = os.path.realpath(self.backups_path)
         os.makedirs(self.backups_path, exist_ok=True)
         self.backups_dict = self._get_backups()
+        self._hashes_dict = {}
 
-    def create_backup(self, file_list, backup_name=None, verbose=False):
+    def create_backup(self, file_list, backup_name=None, verbose=False, strategy='copy', max_workers=None):
         """ Create a new backup from file_list.
 
         Parameters:
             file_list (list):   Full paths of the files to be in the backup.
             backup_name (str or None):  Name of the backup. If None, uses the default
             verbose (bool):     If True, print out the files that are being backed up.
+            strategy (str):     How new files are stored: 'copy', 'link' (hard link) or 'reflink' (copy-on-write clone).
+            max_workers (int or None):  Number of threads used for hashing and copying (None uses the default).
 
         Returns:
             bool:  True if the backup was successful. False if a backup of that name already exists.
 
         :raises HedFileError:
             - For missing or incorrect files.
+            - If strategy is not one of BACKUP_STRATEGIES.
 
         :raises OS-related error:
             - OS-related error when file copying occurs.
 
+        Notes:
+            - Files whose content matches a file in an existing backup are hard linked to that backup file,
+              unless that backup file is itself a hard link to a data file (as stored by the 'link' strategy).
+            - The 'link' and 'reflink' strategies fall back to copying when the file system does not support them.
+            - A 'link' backup shares the data files, so they must be replaced rather than rewritten in place
+              (as run_remodel and restore_backup do) for the backup to stay intact.
+
         """
+        if strategy not in self.BACKUP_STRATEGIES:
+            raise HedFileError("BadBackupStrategy",
+                               f"{strategy} is not in the allowed strategies: {str(self.BACKUP_STRATEGIES)}", "")
         if not backup_name:
             backup_name = self.DEFAULT_BACKUP_NAME
         if self.backups_dict and backup_name in self.backups_dict:
             return False
         backup = {}
+        hashes = {}
         time_stamp = f"{str(datetime.now())}"
         if verbose:
             print(f"Creating backup {backup_name}")
         backup_dir_path = os.path.realpath(os.path.join(self.backups_path, backup_name, BackupManager.BACKUP_ROOT))
         os.makedirs(backup_dir_path, exist_ok=True)
-        for file in file_list:
-            backup_file = self.get_backup_path(backup_name, file)
-            os.makedirs(os.path.dirname(backup_file), exist_ok=True)
-            if verbose:
-                print(f"Copying {file} to {backup_file}")
-            shutil.copy2(file, backup_file)
-            backup[self.get_file_key(file)] = time_stamp
+        existing_files = self._get_hash_index()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            tasks = {}
+            backup_dirs = set()
+            for file in file_list:
+                file_key = self.get_file_key(file)
+                backup_file = os.path.join(backup_dir_path, *file_key.split('/'))
+                if os.path.dirname(backup_file) not in backup_dirs:
+                    os.makedirs(os.path.dirname(backup_file), exist_ok=True)
+                    backup_dirs.add(os.path.dirname(backup_file))
+                tasks[file_key] = (file, backup_file,
+                                   pool.submit(_store_file, file, backup_file, strategy, existing_files))
+                backup[file_key] = time_stamp
+            for file_key, (file, backup_file, task) in tasks.items():
+                hashes[file_key], stored_by = task.result()
+                if verbose:
+                    print(f"{_STORE_MESSAGES[stored_by]} {file} to {backup_file}")
         self.backups_dict[backup_name] = backup
+        self._hashes_dict[backup_name] = hashes
         backup_dict_path = os.path.realpath(os.path.join(self.backups_path, backup_name,
                                                          self.BACKUP_DICTIONARY))
         with open(backup_dict_path, 'w') as fp:
             json.dump(backup, fp, indent=4)
+        with open(os.path.join(self.backups_path, backup_name, self.BACKUP_HASHES), 'w') as fp:
+            json.dump(hashes, fp, indent=4)
         return True
 
     def get_backup(self, backup_name):
@@ -136,30 +169,117 @@ class BackupManager:
         return os.path.realpath(os.path.join(self.backups_path, backup_name, self.BACKUP_ROOT,
                                              self.get_file_key(file_name)))
 
+    def get_backup_hashes(self, backup_name):
+        """ Return the content hashes of the files in a backup.
+
+        Parameters:
+            backup_name (str): Name of the backup.
+
+        Returns:
+            dict:  The SHA-256 hex digests keyed by file key (empty for backups made without hashes).
+
+        """
+        if backup_name not in self._hashes_dict:
+            hashes_path = os.path.join(self.backups_path, backup_name, self.BACKUP_HASHES)
+            hashes = {}
+            if os.path.isfile(hashes_path):
+                with open(hashes_path, 'r') as fp:
+                    hashes = json.load(fp)
+            self._hashes_dict[backup_name] = hashes
+        return self._hashes_dict[backup_name]
+
     def get_file_key(self, file_name):
         file_comp = io_util.get_path_components(self.data_root, file_name) + [os.path.basename(file_name)]
         return '/'.join(file_comp)
 
-    def restore_backup(self, backup_name=DEFAULT_BACKUP_NAME, task_names=[], verbose=True):
+    @staticmethod
+    def get_file_hash(file_path):
+        """ Return the SHA-256 hex digest of the contents of a file.
+
+        Parameters:
+            file_path (str): Full path of the file.
+
+        Returns:
+            str:  The hex digest.
+
+        """
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(1 << 20), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def restore_backup(self, backup_name=DEFAULT_BACKUP_NAME, task_names=[], verbose=True, max_workers=None):
         """ Restore the files from backup_name to the main directory.
 
         Parameters:
             backup_name (str):  Name of the backup to restore.
             task_names (list):  A list of task names to restore.
             verbose (bool):  If True, print out the file names being restored.
+            max_workers (int or None):  Number of threads used for checking and copying (None uses the default).
+
+        Returns:
+            list:  Full paths of the data files that were restored.
+
+        Notes:
+            - Only files whose contents differ from the backup are copied.
+            - Files are replaced rather than rewritten in place, so hard-linked backups are never modified.
 
         """
         if verbose:
             print(f"Restoring from backup {backup_name}")
         backup_files = self.get_backup_files(backup_name)
         data_files = self.get_backup_files(backup_name, original_paths=True)
-        for index, file in enumerate(backup_files):
-            if task_names and not self.get_task(task_names, file):
-                continue
-            os.makedirs(os.path.dirname(data_files[index]), exist_ok=True)
-            if verbose:
-                print(f"Copying {file} to {data_files[index]}")
-            shutil.copy2(file, data_files[index])
+        hashes = self.get_backup_hashes(backup_name)
+        file_keys = list(self.backups_dict[backup_name].keys())
+        restore_list = [(file, data_files[index], hashes.get(file_keys[index]))
+                        for index, file in enumerate(backup_files)
+                        if not task_names or self.get_task(task_names, file)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            changed = list(pool.map(lambda item: self._is_changed(*item), restore_list))
+            tasks = []
+            restored = []
+            for (file, data_file, _), is_changed in zip(restore_list, changed):
+                if not is_changed:
+                    continue
+                os.makedirs(os.path.dirname(data_file), exist_ok=True)
+                if verbose:
+                    print(f"Copying {file} to {data_file}")
+                tasks.append(pool.submit(_replace_file, file, data_file))
+                restored.append(data_file)
+            for task in tasks:
+                task.result()
+        return restored
+
+    def _get_hash_index(self):
+        """ Return a dictionary mapping content hash to the path of a backed up file with that content.
+
+        Notes:
+            - Backup files that are still hard linked to their data file are left out, since editing
+              the data file in place would also change them.
+
+        """
+        index = {}
+        for backup_name in self.backups_dict:
+            for file_key, file_hash in self.get_backup_hashes(backup_name).items():
+                if file_hash in index:
+                    continue
+                backup_file = os.path.join(self.backups_path, backup_name, self.BACKUP_ROOT, *file_key.split('/'))
+                if not _is_same_file(backup_file, os.path.join(self.data_root, *file_key.split('/'))):
+                    index[file_hash] = backup_file
+        return index
+
+    def _is_changed(self, backup_file, data_file, backup_hash):
+        """ Return True if data_file is missing or its contents differ from backup_file. """
+        if not os.path.exists(data_file):
+            return True
+        if os.path.samefile(backup_file, data_file):
+            return False
+        if os.path.getsize(backup_file) != os.path.getsize(data_file):
+            return True
+        if not backup_hash:
+            backup_hash = self.get_file_hash(backup_file)
+        return self.get_file_hash(data_file) != backup_hash
 
     def _get_backups(self):
         """ Set the manager's backup-dictionary based on backup directory contents.
@@ -176,7 +296,7 @@ class BackupManager:
             backup_root = os.path.realpath(os.path.join(self.backups_path, backup))
             if not os.path.isdir(backup_root):
                 raise HedFileError('BadBackupPath', f"{backup_root} is not a backup directory.", "")
-            if len(os.listdir(backup_root)) != 2:
+            if len(set(os.listdir(backup_root)).difference([self.BACKUP_HASHES])) != 2:
                 raise HedFileError("BadBackupFormat",
                                    f"Backup {backup_root} must only contain backup_root and backup_lock.json file.", "")
             backup_dict, files_not_in_backup, backups_not_in_directory = self._check_backup_consistency(backup)
@@ -242,3 +362,103 @@ class BackupManager:
                 return task
         else:
             return ''
+
+
+# Verbose messages of create_backup for each way _store_file can store a file.
+_STORE_MESSAGES = {
+    'duplicate': "Linking duplicate of",
+    'link': "Linking",
+    'reflink': "Cloning",
+    'copy': "Copying"
+}
+
+
+def _store_file(file_path, backup_file, strategy, existing_files):
+    """ Store a file in a backup, linking to a backed up duplicate or using the strategy if possible.
+
+    Parameters:
+        file_path (str):  Full path of the file to back up.
+        backup_file (str):  Full path of the file in the backup.
+        strategy (str):  One of BackupManager.BACKUP_STRATEGIES.
+        existing_files (dict):  Full paths of already backed up files keyed by content hash.
+
+    Returns:
+        tuple: (file_hash, stored_by) the SHA-256 hex digest of the file contents and how the file was stored:
+               'duplicate', 'link', 'reflink' or 'copy'.
+
+    Notes:
+        - A duplicate is only linked to if its contents still have the recorded hash.
+
+    """
+    file_hash = BackupManager.get_file_hash(file_path)
+    duplicate_file = existing_files.get(file_hash)
+    if duplicate_file and _has_hash(duplicate_file, file_hash) and _link_file(duplicate_file, backup_file):
+        return file_hash, 'duplicate'
+    if strategy == 'link' and _link_file(file_path, backup_file):
+        return file_hash, 'link'
+    if strategy == 'reflink' and _clone_file(file_path, backup_file):
+        return file_hash, 'reflink'
+    shutil.copy2(file_path, backup_file)
+    return file_hash, 'copy'
+
+
+def _has_hash(file_path, file_hash):
+    """ Return True if the contents of file_path have the SHA-256 hex digest file_hash. """
+    try:
+        return BackupManager.get_file_hash(file_path) == file_hash
+    except OSError:
+        return False
+
+
+def _is_same_file(path1, path2):
+    """ Return True if both paths exist and refer to the same file. """
+    try:
+        return os.path.samefile(path1, path2)
+    except OSError:
+        return False
+
+
+def _link_file(source, dest):
+    """ Hard link dest to source and return True, or return False if linking is not possible. """
+    try:
+        if os.path.lexists(dest):
+            os.remove(dest)
+        os.link(source, dest)
+        return True
+    except (OSError, NotImplementedError):
+        return False
+
+
+def _clone_file(source, dest):
+    """ Make dest a copy-on-write clone of source and return True, or return False if cloning is not possible. """
+    try:
+        import fcntl
+        ficlone = 0x40049409  # The Linux FICLONE ioctl request.
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+        shutil.copystat(source, dest)
+        return True
+    except (ImportError, OSError):
+        if os.path.exists(dest):
+            os.remove(dest)
+        return False
+
+
+def _replace_file(source, dest):
+    """ Atomically replace dest with a copy of source, so other hard links to dest keep their contents.
+
+    Notes:
+        - If dest is a symbolic link, the file it points to is replaced and the link is kept.
+
+    """
+    dest = os.path.realpath(dest)
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(dest), prefix='.' + os.path.basename(dest))
+    os.close(handle)
+    try:
+        if not _clone_file(source, temp_path):
+            shutil.copy2(source, temp_path)
+        os.replace(temp_path, dest)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
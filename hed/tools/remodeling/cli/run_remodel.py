@@ -3,12 +3,17 @@
 import os
 import json
 import argparse
+import shutil
 import logging
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from hed.errors.exceptions import HedFileError
 
 from hed.tools.bids.bids_dataset import BidsDataset
 from hed.tools.remodeling.remodeler_validator import RemodelerValidator
 from hed.tools.remodeling.dispatcher import Dispatcher
+from hed.tools.remodeling.operations.base_op import ColumnSet
 from hed.tools.remodeling.backup_manager import BackupManager
 from hed.tools.util import io_util
 
@@ -60,6 +65,8 @@ def get_parser():
                         help="If present, output informative messages as computation progresses.")
     parser.add_argument("-w", "--work-dir", default="", dest="work_dir",
                         help="If given, is the path to directory for saving, otherwise derivatives/remodel is used.")
+    parser.add_argument("--workers", type=int, default=0, dest="workers",
+                        help="If greater than 1, the files are remodeled by this number of worker processes.")
     parser.add_argument("-x", "--exclude-dirs", nargs="*", default=[], dest="exclude_dirs",
                         help="Directories names to exclude from search for files.")
     return parser
@@ -147,6 +154,9 @@ def run_bids_ops(dispatch, args, tabular_files):
         args (Object): The command-line arguments as an object.
         tabular_files (list): List of tabular files to run the ops on.
 
+    Returns:
+        list: List of (file path, error message) for files that could not be remodeled by a worker.
+
     """
     bids = BidsDataset(dispatch.data_root, tabular_types=['events'], exclude_dirs=args.exclude_dirs)
     dispatch.hed_schema = bids.schema
@@ -156,17 +166,15 @@ def run_bids_ops(dispatch, args, tabular_files):
     if args.verbose:
         print(f"Processing {dispatch.data_root}")
     filtered_events = [data.datafile_dict[key] for key in tabular_files]
+    file_list = []
     for data_obj in filtered_events:
         sidecar_list = data.get_sidecars_from_path(data_obj)
         if sidecar_list:
             sidecar = data.sidecar_dict[sidecar_list[-1]].contents
         else:
             sidecar = None
-        if args.verbose:
-            print(f"Tabular file {data_obj.file_path}  sidecar {sidecar}")
-        df = dispatch.run_operations(data_obj.file_path, sidecar=sidecar, verbose=args.verbose)
-        if not args.no_update:
-            df.to_csv(data_obj.file_path, sep='\t', index=False, header=True)
+        file_list.append((data_obj.file_path, sidecar))
+    return run_files(dispatch, args, file_list)
 
 
 def run_direct_ops(dispatch, args, tabular_files):
@@ -177,6 +185,9 @@ def run_direct_ops(dispatch, args, tabular_files):
         args (argparse.Namespace): Dictionary of arguments and their values.
         tabular_files (list): List of files to include in this run.
 
+    Returns:
+        list: List of (file path, error message) for files that could not be remodeled by a worker.
+
     """
 
     if args.verbose:
@@ -185,12 +196,126 @@ def run_direct_ops(dispatch, args, tabular_files):
         sidecar = args.json_sidecar
     else:
         sidecar = None
-    for file_path in tabular_files:
+    return run_files(dispatch, args, [(file_path, sidecar) for file_path in tabular_files])
+
+
+def run_files(dispatch, args, file_list):
+    """ Run the operations of the dispatcher on a list of files, in worker processes if args.workers > 1.
+
+    Parameters:
+        dispatch (Dispatcher): Manages the execution of the operations and holds the summaries.
+        args (argparse.Namespace): The command-line arguments as an object.
+        file_list (list): List of (file path, sidecar) tuples to be remodeled.
+
+    Returns:
+        list: List of (file path, error message) for files that could not be remodeled by a worker.
+
+    Notes:
+        - Each worker process has its own Dispatcher. The summaries of each file are merged into dispatch
+          in the order of file_list, so the result does not depend on the order in which the workers finish.
+        - A file that fails in a worker is reported in the returned list and does not stop the other files.
+          In sequential mode errors are raised as before.
+
+    """
+    workers = getattr(args, 'workers', 0)
+    if workers > 1 and len(file_list) > 1 and not all(op.PARALLEL_SAFE for op in dispatch.parsed_ops):
         if args.verbose:
-            print(f"Tabular file {file_path}  sidecar {sidecar}")
-        df = dispatch.run_operations(file_path, verbose=args.verbose, sidecar=sidecar)
-        if not args.no_update:
-            df.to_csv(file_path, sep='\t', index=False, header=True)
+            print("The operations include summaries that span files, so the files are remodeled sequentially")
+        workers = 0
+    if workers <= 1 or len(file_list) <= 1:
+        for file_path, sidecar in file_list:
+            _remodel_file(dispatch, file_path, sidecar, args.no_update, args.verbose)
+        return []
+
+    errors = []
+    init_args = (dispatch.parsed_ops, dispatch.data_root, dispatch.backup_name, dispatch.hed_schema,
+                 dispatch.read_columns, args.no_update, args.verbose)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+        for file_path, summary_dicts, op_stats, error in executor.map(_run_worker_file, file_list):
+            dispatch.merge_op_stats(op_stats)
+            if error:
+                if args.verbose:
+                    print(f"Tabular file {file_path} could not be remodeled:\n{error}")
+                errors.append((file_path, error))
+                continue
+            for summary_name, summary in summary_dicts.items():
+                if summary_name in dispatch.summary_dicts:
+                    dispatch.summary_dicts[summary_name].merge_summary(summary)
+                else:
+                    dispatch.summary_dicts[summary_name] = summary
+    return errors
+
+
+def _remodel_file(dispatch, file_path, sidecar, no_update, verbose):
+    """ Run the operations of the dispatcher on a file and save the result unless no_update.
+
+    Parameters:
+        dispatch (Dispatcher): Manages the execution of the operations.
+        file_path (str): Full path of the file to be remodeled.
+        sidecar (Sidecar, str, or None): The sidecar for the HED operations.
+        no_update (bool): If True, the result is not written back.
+        verbose (bool): If True, print out progress reports.
+
+    """
+    if verbose:
+        print(f"Tabular file {file_path}  sidecar {sidecar}")
+    df = dispatch.run_operations(file_path, sidecar=sidecar, verbose=verbose)
+    if not no_update:
+        _write_data_file(df, file_path)
+
+
+def _write_data_file(df, file_path):
+    """ Replace file_path with the tab-separated contents of df.
+
+    Notes:
+        - The file is written next to file_path and renamed, so hard-linked backups of the original are kept intact.
+        - If file_path is a symbolic link, the file it points to is replaced and the link is kept.
+
+    """
+    file_path = os.path.realpath(file_path)
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix='.' + os.path.basename(file_path))
+    os.close(handle)
+    try:
+        df.to_csv(temp_path, sep='\t', index=False, header=True)
+        shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+_worker_state = {}
+
+
+def _init_worker(parsed_ops, data_root, backup_name, hed_schema, read_columns, no_update, verbose):
+    """ Create the Dispatcher of a worker process. """
+    dispatch = Dispatcher([], data_root=data_root, backup_name=backup_name, hed_versions=hed_schema)
+    dispatch.parsed_ops = parsed_ops
+    dispatch.read_columns = read_columns
+    _worker_state.update(dispatch=dispatch, no_update=no_update, verbose=verbose)
+
+
+def _run_worker_file(file_info):
+    """ Remodel a file in a worker process.
+
+    Parameters:
+        file_info (tuple): The (file path, sidecar) of the file.
+
+    Returns:
+        tuple: The file path, the summaries of the file (dict), the operation statistics (dict),
+               and an error message or None.
+
+    """
+    file_path, sidecar = file_info
+    dispatch = _worker_state['dispatch']
+    dispatch.summary_dicts = {}
+    dispatch.op_stats = {}
+    try:
+        _remodel_file(dispatch, file_path, sidecar, _worker_state['no_update'], _worker_state['verbose'])
+    except Exception:
+        return file_path, {}, dispatch.op_stats, traceback.format_exc()
+    return file_path, dispatch.summary_dicts, dispatch.op_stats, None
 
 
 def main(arg_list=None):
@@ -221,16 +346,26 @@ def main(arg_list=None):
         files = io_util.get_file_list(args.data_dir, name_suffix=args.file_suffix, extensions=args.extensions,
                                       exclude_dirs=args.exclude_dirs)
         task_dict = parse_tasks(files, args.task_names)
+        file_errors = []
         for task, files in task_dict.items():
             dispatch = Dispatcher(operations, data_root=args.data_dir, backup_name=backup_name,
                                   hed_versions=args.hed_versions)
+            if args.no_update:
+                # The remodeled files are discarded, so only the columns read by the operations are loaded.
+                dispatch.read_columns = dispatch.get_input_columns(ColumnSet())
             if args.use_bids:
-                run_bids_ops(dispatch, args, files)
+                file_errors += run_bids_ops(dispatch, args, files)
             else:
-                run_direct_ops(dispatch, args, files)
+                file_errors += run_direct_ops(dispatch, args, files)
+            if args.verbose:
+                print(dispatch.get_op_report())
             if not args.no_summaries:
                 dispatch.save_summaries(args.save_formats, individual_summaries=args.individual_summaries,
                                         summary_dir=save_dir, task_name=task)
+        if file_errors:
+            raise HedFileError("RemodelingFileErrors",
+                               f"{len(file_errors)} files could not be remodeled:\n" +
+                               "\n".join(f"{file_path}:\n{error}" for file_path, error in file_errors), "")
     except Exception:
         if args.log_dir:
             log_name = io_util.get_alphanumeric_path(os.path.realpath(args.data_dir)) + '_' + timestamp + '.txt'
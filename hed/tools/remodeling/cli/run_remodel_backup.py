@@ -24,9 +24,15 @@ def get_parser():
     parser.add_argument("-f", "--file-suffix", dest="file_suffix", nargs="*", default=['events'],
                         help="Filename suffix of files to be backed up. A * indicates all files allowed.")
 
+    parser.add_argument("-s", "--strategy", default="copy", dest="strategy",
+                        choices=list(BackupManager.BACKUP_STRATEGIES),
+                        help="How files are stored in the backup: copy, link (hard link) or reflink (copy-on-write). " +
+                             "Files already in another backup are always linked to it.")
     parser.add_argument("-t", "--task-names", dest="task_names", nargs="*", default=[], help="The name of the task.")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If present, output informative messages as computation progresses.")
+    parser.add_argument("-w", "--workers", type=int, default=None, dest="workers",
+                        help="Number of threads used to hash and copy files (defaults to the Python default).")
     parser.add_argument("-x", "--exclude-dirs", nargs="*", default=['derivatives'], dest="exclude_dirs",
                         help="Directories names to exclude from search for files. " +
                              "If omitted, no directories except the backup directory will be excluded." +
@@ -65,7 +71,8 @@ def main(arg_list=None):
     if backup_man.get_backup(args.backup_name):
         raise HedFileError("BackupExists", f"Backup {args.backup_name} already exists", "")
     else:
-        backup_man.create_backup(file_list, backup_name=args.backup_name, verbose=args.verbose)
+        backup_man.create_backup(file_list, backup_name=args.backup_name, verbose=args.verbose,
+                                 strategy=args.strategy, max_workers=args.workers)
 
 
 if __name__ == '__main__':
@@ -21,6 +21,8 @@ def get_parser():
     parser.add_argument("-t", "--task-names", dest="task_names", nargs="*", default=[], help="The names of the task.")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If present, output informative messages as computation progresses.")
+    parser.add_argument("-w", "--workers", type=int, default=None, dest="workers",
+                        help="Number of threads used to hash and copy files (defaults to the Python default).")
     return parser
 
 
@@ -44,7 +46,8 @@ def main(arg_list=None):
     backup_man = BackupManager(args.data_dir, backups_root=backups_root)
     if not backup_man.get_backup(args.backup_name):
         raise HedFileError("BackupDoesNotExist", f"{args.backup_name}", "")
-    backup_man.restore_backup(args.backup_name, task_names=args.task_names, verbose=args.verbose)
+    backup_man.restore_backup(args.backup_name, task_names=args.task_names, verbose=args.verbose,
+                              max_workers=args.workers)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 """ Controller for applying operations to tabular files and saving the results. """
 
 import os
+import time
 import numpy as np
 import pandas as pd
 import json
@@ -8,7 +9,9 @@ from hed.errors.exceptions import HedFileError
 from hed.schema.hed_schema_io import load_schema_version
 from hed.schema.hed_schema import HedSchema
 from hed.schema.hed_schema_group import HedSchemaGroup
+from hed.tools.analysis.analysis_cache import AnalysisCache
 from hed.tools.remodeling.backup_manager import BackupManager
+from hed.tools.remodeling.operations.base_op import ColumnSet
 from hed.tools.remodeling.operations.valid_operations import valid_operations
 from hed.tools.util import io_util
 
@@ -52,6 +55,9 @@ class Dispatcher:
         self.parsed_ops = self.parse_operations(operation_list)
         self.hed_schema = self.get_schema(hed_versions)
         self.summary_dicts = {}
+        self.analysis_cache = AnalysisCache()  # HED analysis objects shared by the operations on one file
+        self.op_stats = {}  # Position of operation -> files, time and largest frame, see get_op_report.
+        self.read_columns = None  # If a ColumnSet, only these columns are read from data files.
 
     def get_summaries(self, file_formats=['.txt', '.json']):
         """ Return the summaries in a dictionary of strings suitable for saving or archiving.
@@ -111,13 +117,44 @@ class Dispatcher:
         else:
             actual_path = file_designator
         try:
-            df = pd.read_csv(actual_path, sep='\t', header=0, keep_default_na=False, na_values=",null")
+            df = self._read_data_file(actual_path)
         except Exception:
             raise HedFileError("BadDataFile",
                                f"{str(actual_path)} (orig: {file_designator}) does not correspond to a valid tsv file",
                                "")
         return df
 
+    def _read_data_file(self, file_path):
+        """ Read a tsv file, keeping only the columns in read_columns (but all the rows) if it is set. """
+        read_args = {'sep': '\t', 'header': 0, 'keep_default_na': False, 'na_values': ",null"}
+        if self.read_columns is None or self.read_columns.is_all:
+            return pd.read_csv(file_path, **read_args)
+        header = pd.read_csv(file_path, nrows=0, **read_args).columns
+        use_columns = [column for column in header if column in self.read_columns]
+        if use_columns:
+            return pd.read_csv(file_path, usecols=use_columns, **read_args)
+        # A column is still parsed so that the number of rows is right.
+        return pd.read_csv(file_path, usecols=header[:1], **read_args).iloc[:, :0]
+
+    def get_input_columns(self, output_columns=None):
+        """ Return the columns of a data file that the operations need to produce the given columns.
+
+        Parameters:
+            output_columns (ColumnSet or None): Columns of the result that are used. If None, all columns are used.
+
+        Returns:
+            ColumnSet: The columns of the data file that are read by the operations or appear in output_columns.
+
+        Notes:
+            - The operations are analyzed in reverse order using BaseOp.get_input_columns.
+            - Use ColumnSet() as output_columns when the remodeled file is not saved, which gives just the
+              columns needed by the summaries.
+        """
+        columns = output_columns if output_columns is not None else ColumnSet.all()
+        for operation in reversed(self.parsed_ops):
+            columns = operation.get_input_columns(columns)
+        return columns
+
     def get_summary_save_dir(self):
         """ Return the directory in which to save the summaries.
 
@@ -142,17 +179,69 @@ class Dispatcher:
 
         Returns:
             DataFrame:  The processed dataframe.
+
+        Notes:
+            - The HED operations on the file share the analysis_cache, which is cleared after the file is done.
+            - The n/a entries are replaced by NaN once before the first operation and restored after the last.
+              Operations with READ_ONLY set receive the frame itself. Only the columns in which another
+              operation introduces n/a strings or categories are normalized again.
+            - The time and frame size of each operation are accumulated in op_stats.
         """
 
         # string to functions
         if verbose:
             print(f"Reading {file_path}...")
-        df = self.get_data_file(file_path)
-        for operation in self.parsed_ops:
-            df = self.prep_data(df)
-            df = operation.do_op(self, df, file_path, sidecar=sidecar)
-            df = self.post_proc_data(df)
-        return df
+        df = self.prep_data(self.get_data_file(file_path))
+        try:
+            for index, operation in enumerate(self.parsed_ops):
+                start_time = time.perf_counter()
+                df = operation.do_op(self, df, file_path, sidecar=sidecar)
+                if not operation.READ_ONLY:
+                    df = self.normalize_data(df)
+                self._update_op_stats(index, operation, time.perf_counter() - start_time, df)
+        finally:
+            self.analysis_cache.clear()
+        return self.post_proc_data(df)
+
+    def _update_op_stats(self, index, operation, elapsed, df):
+        """ Add the time and frame size of one application of an operation to op_stats. """
+        stats = self.op_stats.setdefault(index, {'operation': operation.NAME, 'files': 0, 'time': 0.0,
+                                                 'max_memory': 0})
+        stats['files'] += 1
+        stats['time'] += elapsed
+        stats['max_memory'] = max(stats['max_memory'], int(df.memory_usage(index=True).sum()))
+
+    def merge_op_stats(self, op_stats):
+        """ Add the operation statistics of another dispatcher (usually from a worker process) to op_stats.
+
+        Parameters:
+            op_stats (dict): The op_stats of a dispatcher with the same operations.
+
+        """
+        for index, other in op_stats.items():
+            stats = self.op_stats.setdefault(index, dict(other, files=0, time=0.0, max_memory=0))
+            stats['files'] += other['files']
+            stats['time'] += other['time']
+            stats['max_memory'] = max(stats['max_memory'], other['max_memory'])
+
+    def get_op_report(self):
+        """ Return a printable report of the time and memory used by each operation.
+
+        Returns:
+            str: One line per operation with the number of files, the total and mean time, and the largest frame.
+
+        Notes:
+            - The memory is the shallow size of the frame returned by the operation, so object columns
+              count only their references.
+        """
+        lines = ["Operation report:"]
+        for index in sorted(self.op_stats):
+            stats = self.op_stats[index]
+            mean_time = stats['time'] / stats['files'] if stats['files'] else 0.0
+            lines.append(f"Operation[{index}] {stats['operation']}: {stats['files']} files, "
+                         f"{stats['time']:.3f} s total, {1000 * mean_time:.1f} ms per file, "
+                         f"max frame {stats['max_memory'] / 2 ** 20:.2f} MB")
+        return "\n".join(lines)
 
     def save_summaries(self, save_formats=['.json', '.txt'], individual_summaries="separate",
                        summary_dir=None, task_name=""):
@@ -222,12 +311,48 @@ class Dispatcher:
             DataFrame: DataFrame with the 'np.nan replaced by 'n/a'.
         """
 
-        dtypes = df.dtypes.to_dict()
-        for col_name, typ in dtypes.items():
-            if typ == 'category':
-                df[col_name] = df[col_name].astype(str)
+        categories = {col_name: str for col_name, typ in df.dtypes.items() if typ == 'category'}
+        if categories:
+            df = df.astype(categories)
         return df.fillna('n/a')
 
+    @staticmethod
+    def normalize_data(df):
+        """ Replace the n/a entries introduced by an operation by np.nan and convert categorical columns to str.
+
+        Parameters:
+            df (DataFrame): The DataFrame returned by an operation.
+
+        Returns:
+            DataFrame: The DataFrame in the form produced by prep_data.
+
+        Notes:
+            - Only object and categorical columns can hold n/a, so other columns are not scanned.
+            - Only the columns that need to change are replaced, and the other columns are not copied.
+        """
+        new_columns = {}
+        for index, typ in enumerate(df.dtypes):
+            if typ == 'category':
+                column = df.iloc[:, index].astype(str)
+                new_columns[index] = column
+            elif typ == object:
+                column = df.iloc[:, index]
+            else:
+                continue
+            values = column.to_numpy()
+            missing = pd.isna(values)
+            na_values = missing | (values == 'n/a')
+            # Entries that are already NaN need no change, but n/a strings and None do.
+            if na_values.sum() > missing.sum() or any(value is None for value in values[missing]):
+                new_columns[index] = column.mask(na_values)
+        if not new_columns:
+            return df
+        # Columns are rebuilt by position, since column names need not be unique.
+        columns = [new_columns.get(index, df.iloc[:, index]) for index in range(len(df.columns))]
+        new_df = pd.concat(columns, axis=1, copy=False)
+        new_df.columns = df.columns
+        return new_df
+
     @staticmethod
     def errors_to_str(messages, title="", sep='\n'):
         """ Return an error string representing error messages in a list.
@@ -3,9 +3,70 @@
 from abc import ABC, abstractmethod
 
 
+class ColumnSet:
+    """ Immutable set of column names, which can also represent all columns except some names.
+
+    Parameters:
+        names (iterable):  The column names in the set (or excluded from it if all_except is True).
+        all_except (bool): If True, the set contains every column except those in names.
+
+    Notes:
+        - Operations use this to declare the columns they read (see BaseOp.get_input_columns).
+
+    """
+
+    def __init__(self, names=(), all_except=False):
+        self.names = frozenset(names)
+        self.all_except = all_except
+
+    @classmethod
+    def all(cls, excluded=()):
+        """ Return the set of all columns except the excluded ones. """
+        return cls(excluded, all_except=True)
+
+    @property
+    def is_all(self):
+        """ True if this set contains every column. """
+        return self.all_except and not self.names
+
+    def __contains__(self, name):
+        return (name in self.names) != self.all_except
+
+    def __eq__(self, other):
+        return isinstance(other, ColumnSet) and self.names == other.names and self.all_except == other.all_except
+
+    def __repr__(self):
+        return f"ColumnSet({sorted(self.names)}, all_except={self.all_except})"
+
+    def union(self, other):
+        """ Return the union of this set with a ColumnSet or an iterable of column names. """
+        if not isinstance(other, ColumnSet):
+            other = ColumnSet(other)
+        if self.all_except and other.all_except:
+            return ColumnSet.all(self.names & other.names)
+        if self.all_except:
+            return ColumnSet.all(self.names - other.names)
+        if other.all_except:
+            return ColumnSet.all(other.names - self.names)
+        return ColumnSet(self.names | other.names)
+
+    def difference(self, names):
+        """ Return this set without the column names in the iterable names. """
+        if self.all_except:
+            return ColumnSet.all(self.names.union(names))
+        return ColumnSet(self.names.difference(names))
+
+
 class BaseOp(ABC):
     """ Base class for operations. All remodeling operations should extend this class."""
 
+    # False for summary operations whose summaries can't be assembled from files remodeled in separate processes.
+    PARALLEL_SAFE = True
+
+    # True for operations that neither modify the df passed to do_op nor return a different one (e.g. summaries).
+    # The dispatcher then passes the df without copying it and skips normalizing the result.
+    READ_ONLY = False
+
     def __init__(self, parameters):
         """ Constructor for the BaseOp class. Should be extended by operations.
 
@@ -38,6 +99,22 @@ class BaseOp(ABC):
 
         return df.copy()
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The columns of the df passed to do_op that this operation (or a later one) reads.
+
+        Notes:
+            - The default is all columns, which is always safe. Operations that read only specific
+              columns override this, so that the dispatcher can skip loading the others.
+
+        """
+        return ColumnSet.all()
+
     @staticmethod
     @abstractmethod
     def validate_input_data(parameters):
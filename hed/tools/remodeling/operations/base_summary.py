@@ -283,6 +283,20 @@ class BaseSummary(ABC):
         """
         raise NotImplementedError
 
+    def merge_summary(self, other):
+        """ Merge a summary of the same operation computed on other files into this summary.
+
+        Parameters:
+            other (BaseSummary):  Summary of the same operation whose files are not in this summary.
+
+        Notes:
+            - This is used to combine the summaries from files remodeled in separate processes.
+            - The default adds the individual file entries of other, which suffices for summaries that keep
+              all of their information in summary_dict.
+
+        """
+        self.summary_dict.update(other.summary_dict)
+
     @abstractmethod
     def merge_all_info(self):
         """ Return merged information.
@@ -96,6 +96,20 @@ class FactorColumnOp(BaseOp):
             df_new[column] = factor_index.astype(int)
         return df_new
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The factored column and the later columns that are not created by this operation.
+
+        """
+        if self.factor_values:
+            output_columns = output_columns.difference(self.factor_names or [])
+        return output_columns.union([self.column_name])
+
     @staticmethod
     def validate_input_data(parameters):
         """ Check that factor_names and factor_values have same length if given. """
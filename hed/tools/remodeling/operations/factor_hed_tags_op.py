@@ -6,8 +6,6 @@ from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.models.tabular_input import TabularInput
 from hed.models.sidecar import Sidecar
 from hed.models import query_service
-from hed.tools.analysis.event_manager import EventManager
-from hed.tools.analysis.hed_tag_manager import HedTagManager
 from hed.tools.util.data_util import replace_na
 
 
@@ -119,7 +117,8 @@ class FactorHedTagsOp(BaseOp):
                 raise ValueError("QueryNameAlreadyColumn",
                                  f"Query [{query_name}]: is already a column name of the data frame")
         df_list = [input_data.dataframe]
-        tag_man = HedTagManager(EventManager(input_data, dispatcher.hed_schema), remove_types=self.remove_types)
+        tag_man = dispatcher.analysis_cache.get_tag_manager(input_data, dispatcher.hed_schema,
+                                                            remove_types=self.remove_types)
         hed_objs = tag_man.get_hed_objs(include_context=self.expand_context, replace_defs=self.replace_defs)
         df_factors = query_service.search_hed_objs(hed_objs, self.query_handlers, query_names=self.query_names)
         if len(df_factors.columns) > 0:
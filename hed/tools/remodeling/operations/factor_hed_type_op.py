@@ -3,8 +3,6 @@
 import pandas as pd
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.models.tabular_input import TabularInput
-from hed.tools.analysis.event_manager import EventManager
-from hed.tools.analysis.hed_type_manager import HedTypeManager
 from hed.tools.util.data_util import replace_na
 
 
@@ -73,7 +71,7 @@ class FactorHedTypeOp(BaseOp):
 
         input_data = TabularInput(df.copy().fillna('n/a'), sidecar=sidecar, name=name)
         df_list = [input_data.dataframe]
-        var_manager = HedTypeManager(EventManager(input_data, dispatcher.hed_schema))
+        var_manager = dispatcher.analysis_cache.get_type_manager(input_data, dispatcher.hed_schema)
         var_manager.add_type(self.type_tag.casefold())
 
         df_factors = var_manager.get_factor_vectors(
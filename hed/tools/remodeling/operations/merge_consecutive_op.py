@@ -1,5 +1,6 @@
 """ Merge consecutive rows of a columnar file with same column value. """
 
+import numpy as np
 import pandas as pd
 from hed.tools.remodeling.operations.base_op import BaseOp
 
@@ -120,62 +121,73 @@ class MergeConsecutiveOp(BaseOp):
         match_columns.append(self.column_name)
         match_df = df_new.loc[:, match_columns]
         remove_groups = self._get_remove_groups(match_df, code_mask)
-        if self.set_durations and max(remove_groups) > 0:
+        if self.set_durations and remove_groups.max() > 0:
             self._update_durations(df_new, remove_groups)
-        keep_mask = [remove_group == 0 for remove_group in remove_groups]
-        df_new = df_new.loc[keep_mask, :].reset_index(drop=True)
+        df_new = df_new.loc[remove_groups == 0, :].reset_index(drop=True)
         return df_new
 
     @staticmethod
     def _get_remove_groups(match_df, code_mask):
-        """ Return a list of same length as match_df with group numbers of consecutive items.
+        """ Return an array of same length as match_df with group numbers of consecutive items.
 
         Parameters:
             match_df (DataFrame): DataFrame containing columns to be matched.
             code_mask (DataSeries):  Same length as match_df with the names.
 
         Returns:
-            list:  Group numbers set (starting at 1).
+            np.ndarray:  Group numbers (starting at 1) of the rows to be removed and 0 for the rows to be kept.
+
+        Notes:
+            - The runs are found by comparing each row with the previous row across all the match columns
+              (missing values compare equal), so the work is a few vectorized passes over the columns.
 
         # TODO: Handle round off in rows for comparison.
         """
-        in_group = False
-        remove_groups = [0] * len(match_df)
-        group_count = 0
-        for index, row in match_df.iterrows():
-            if not code_mask.iloc[index]:
-                in_group = False
-                continue
-            elif not in_group:
-                in_group = True
-                group_count += 1
-                continue
-            if in_group and row.equals(match_df.loc[index - 1, :]):
-                remove_groups[index] = group_count
-            else:
-                group_count += 1
-        return remove_groups
+        codes = np.asarray(code_mask, dtype=bool)
+        same_as_previous = np.zeros(len(codes), dtype=bool)
+        same_as_previous[1:] = codes[1:] & codes[:-1]
+        for column in match_df.columns:
+            values = match_df[column].to_numpy()
+            missing = pd.isna(values)
+            same = (values[1:] == values[:-1]) | (missing[1:] & missing[:-1])
+            same_as_previous[1:] &= np.asarray(same, dtype=bool)
+        group_ids = np.cumsum(codes & ~same_as_previous)
+        return np.where(same_as_previous, group_ids, 0)
 
     @staticmethod
     def _update_durations(df_new, remove_groups):
-        """ Update the durations for the columns based on merged columns.
+        """ Update the durations of the rows that start merged groups to cover the extent of the group.
 
         Parameters:
             df_new (DataFrame): Tabular data to merge.
-            remove_groups (list): List of names of columns to remove.
+            remove_groups (np.ndarray): Group numbers of the rows to be removed (0 for rows that are kept).
+
+        """
+        removed = remove_groups > 0
+        # Each run of removed rows is anchored by the kept row just before it.
+        anchors = np.flatnonzero(removed[1:] & ~removed[:-1])
+        group_rows = np.concatenate([anchors, np.flatnonzero(removed)])
+        group_ids = np.concatenate([remove_groups[anchors + 1], remove_groups[removed]])
+        end_times = df_new[["onset", "duration"]].sum(axis=1, skipna=True).to_numpy()
+        max_ends = pd.Series(end_times[group_rows]).groupby(group_ids).max()
+        anchor_onsets = df_new["onset"].to_numpy()[anchors]
+        duration_loc = df_new.columns.get_loc("duration")
+        df_new.iloc[anchors, duration_loc] = max_ends.loc[remove_groups[anchors + 1]].to_numpy() - anchor_onsets
+
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The later columns, the merge and match columns, and onset and duration if durations are set.
 
         """
-        remove_df = pd.DataFrame(remove_groups, columns=["remove"])
-        max_groups = max(remove_groups)
-        for index in range(max_groups):
-            df_group = df_new.loc[remove_df["remove"]
-                                  == index + 1, ["onset", "duration"]]
-            max_group = df_group.sum(axis=1, skipna=True).max()
-            anchor = df_group.index[0] - 1
-            max_anchor = df_new.loc[anchor, [
-                "onset", "duration"]].sum(skipna=True).max()
-            df_new.loc[anchor, "duration"] = max(
-                max_group, max_anchor) - df_new.loc[anchor, "onset"]
+        columns = [self.column_name] + (self.match_columns or [])
+        if self.set_durations:
+            columns += ["onset", "duration"]
+        return output_columns.union(columns)
 
     @staticmethod
     def validate_input_data(parameters):
@@ -145,6 +145,18 @@ class RemapColumnsOp(BaseOp):
                              f"{name}: Ignore missing is False, but source values [{missing}] are in data but not map")
         return df_new
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The source columns and the later columns that are not destination columns.
+
+        """
+        return output_columns.difference(self.destination_columns).union(self.source_columns)
+
     @staticmethod
     def validate_input_data(parameters):
         map_list = parameters["map_list"]
@@ -73,6 +73,20 @@ class RemoveColumnsOp(BaseOp):
                            f"{name}: Ignore missing is False but a column in {str(self.column_names)} is "
                            f"not in the data columns [{str(df_new.columns)}]")
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The later columns, plus the removed columns if they must be present.
+
+        """
+        if self.error_handling == 'raise':
+            return output_columns.union(self.column_names)
+        return output_columns.difference(self.column_names)
+
     @staticmethod
     def validate_input_data(parameters):
         """ Additional validation required of operation parameters not performed by JSON schema validator. """
@@ -72,6 +72,18 @@ class RemoveRowsOp(BaseOp):
         df_new = df_new.reset_index(drop=True)
         return df_new
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The later columns and the column whose values are checked.
+
+        """
+        return output_columns.union([self.column_name])
+
     @staticmethod
     def validate_input_data(parameters):
         """ Additional validation required of operation parameters not performed by JSON schema validator. """
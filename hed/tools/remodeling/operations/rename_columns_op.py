@@ -1,6 +1,6 @@
 """ Rename columns in a columnar file. """
 
-from hed.tools.remodeling.operations.base_op import BaseOp
+from hed.tools.remodeling.operations.base_op import BaseOp, ColumnSet
 
 
 class RenameColumnsOp (BaseOp):
@@ -76,6 +76,23 @@ class RenameColumnsOp (BaseOp):
                            f"{name}: ignore_missing is False, mapping columns [{self.column_mapping}]"
                            f" but df columns are [{str(df.columns)}")
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The later columns under both their old and new names.
+
+        """
+        if output_columns.all_except:
+            return ColumnSet.all()
+        old_names = [old for old, new in self.column_mapping.items() if new in output_columns]
+        if self.error_handling == 'raise':
+            old_names = list(self.column_mapping.keys())
+        return output_columns.union(old_names)
+
     @staticmethod
     def validate_input_data(parameters):
         """ Additional validation required of operation parameters not performed by JSON schema validator. """
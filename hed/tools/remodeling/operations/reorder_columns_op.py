@@ -1,5 +1,5 @@
 """ Reorder columns in a columnar file. """
-from hed.tools.remodeling.operations.base_op import BaseOp
+from hed.tools.remodeling.operations.base_op import BaseOp, ColumnSet
 
 
 class ReorderColumnsOp(BaseOp):
@@ -87,6 +87,24 @@ class ReorderColumnsOp(BaseOp):
         df_new = df_new.loc[:, ordered]
         return df_new
 
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: The ordered columns that must be present or are used later, plus the later columns if
+            other columns are kept.
+
+        """
+        ordered = self.column_order
+        if self.ignore_missing:
+            ordered = [column for column in ordered if column in output_columns]
+        if self.keep_others:
+            return output_columns.union(ordered)
+        return ColumnSet(ordered)
+
     @staticmethod
     def validate_input_data(parameters):
         """ Additional validation required of operation parameters not performed by JSON schema validator. """
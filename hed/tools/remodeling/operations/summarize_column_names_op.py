@@ -44,6 +44,7 @@ class SummarizeColumnNamesOp(BaseOp):
     }
 
     SUMMARY_TYPE = "column_names"
+    READ_ONLY = True
 
     def __init__(self, parameters):
         """ Constructor for summarize column names operation.
@@ -67,20 +68,19 @@ class SummarizeColumnNamesOp(BaseOp):
             sidecar (Sidecar or file-like):  Not needed for this operation.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
             summary = ColumnNamesSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
         summary.update_summary(
-            {"name": name, "column_names": list(df_new.columns)})
-        return df_new
+            {"name": name, "column_names": list(df.columns)})
+        return df
 
     @staticmethod
     def validate_input_data(parameters):
@@ -45,6 +45,8 @@ class SummarizeDefinitionsOp(BaseOp):
     }
 
     SUMMARY_TYPE = 'type_defs'
+    READ_ONLY = True
+    PARALLEL_SAFE = False  # Definitions found in earlier files resolve the def-expands of later ones.
 
     def __init__(self, parameters):
         """ Constructor for the summary of definitions used in the dataset.
@@ -68,18 +70,17 @@ class SummarizeDefinitionsOp(BaseOp):
             sidecar (Sidecar or file-like): Only needed for HED operations.
 
         Returns:
-            DataFrame: a copy of df
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.setdefault(self.summary_name,
                                                       DefinitionSummary(self, dispatcher.hed_schema))
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name, 'sidecar': sidecar,
+        summary.update_summary({'df': dispatcher.post_proc_data(df), 'name': name, 'sidecar': sidecar,
                                 'schema': dispatcher.hed_schema})
-        return df_new
+        return df
 
     @staticmethod
     def validate_input_data(parameters):
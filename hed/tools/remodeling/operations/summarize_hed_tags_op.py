@@ -3,8 +3,7 @@ import os
 import numpy as np
 from hed.models.tabular_input import TabularInput
 from hed.tools.analysis.hed_tag_counts import HedTagCounts
-from hed.tools.analysis.event_manager import EventManager
-from hed.tools.analysis.hed_tag_manager import HedTagManager
+from hed.tools.analysis.analysis_cache import AnalysisCache
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
 from hed.tools.visualization import tag_word_cloud
@@ -151,6 +150,7 @@ class SummarizeHedTagsOp(BaseOp):
     }
 
     SUMMARY_TYPE = "hed_tag_summary"
+    READ_ONLY = True
 
     def __init__(self, parameters):
         """ Constructor for the summarize_hed_tags operation.
@@ -201,20 +201,20 @@ class SummarizeHedTagsOp(BaseOp):
             sidecar (Sidecar or file-like):  Only needed for HED operations.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the context.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
             summary = HedTagSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        summary.update_summary({'df': dispatcher.post_proc_data(df), 'name': name,
+                                'schema': dispatcher.hed_schema, 'sidecar': sidecar,
+                                'analysis_cache': dispatcher.analysis_cache})
+        return df
 
     @staticmethod
     def validate_input_data(parameters):
@@ -244,13 +244,16 @@ class HedTagSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - An optional "analysis_cache" shares the HED analysis objects with other operations.
 
         """
         counts = HedTagCounts(
             new_info['name'], total_events=len(new_info['df']))
         input_data = TabularInput(
             new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
-        tag_man = HedTagManager(EventManager(input_data, new_info['schema']), remove_types=self.sum_op.remove_types)
+        analysis_cache = new_info.get('analysis_cache') or AnalysisCache()
+        tag_man = analysis_cache.get_tag_manager(input_data, new_info['schema'],
+                                                 remove_types=self.sum_op.remove_types)
         hed_objs = tag_man.get_hed_objs(include_context=self.sum_op.include_context,
                                         replace_defs=self.sum_op.replace_defs)
         for hed in hed_objs:
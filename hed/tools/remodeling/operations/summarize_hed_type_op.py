@@ -2,9 +2,8 @@
 
 from hed.models.tabular_input import TabularInput
 from hed.models.sidecar import Sidecar
-from hed.tools.analysis.hed_type import HedType
 from hed.tools.analysis.hed_type_counts import HedTypeCounts
-from hed.tools.analysis.event_manager import EventManager
+from hed.tools.analysis.analysis_cache import AnalysisCache
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
 
@@ -56,6 +55,7 @@ class SummarizeHedTypeOp(BaseOp):
     }
 
     SUMMARY_TYPE = 'hed_type_summary'
+    READ_ONLY = True
 
     def __init__(self, parameters):
         """ Constructor for the summarize HED type operation.
@@ -80,20 +80,20 @@ class SummarizeHedTypeOp(BaseOp):
             sidecar (Sidecar or file-like): Usually required unless event file has a HED column.
 
         Returns:
-            DataFrame: A copy of df
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
             summary = HedTypeSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        summary.update_summary({'df': dispatcher.post_proc_data(df), 'name': name,
+                                'schema': dispatcher.hed_schema, 'sidecar': sidecar,
+                                'analysis_cache': dispatcher.analysis_cache})
+        return df
 
     @staticmethod
     def validate_input_data(parameters):
@@ -122,6 +122,7 @@ class HedTypeSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - An optional "analysis_cache" shares the HED analysis objects with other operations.
 
         """
 
@@ -130,7 +131,10 @@ class HedTypeSummary(BaseSummary):
             sidecar = Sidecar(sidecar)
         input_data = TabularInput(
             new_info['df'], sidecar=sidecar, name=new_info['name'])
-        type_values = HedType(EventManager(input_data, new_info['schema']), new_info['name'], type_tag=self.type_tag)
+        analysis_cache = new_info.get('analysis_cache') or AnalysisCache()
+        type_manager = analysis_cache.get_type_manager(input_data, new_info['schema'])
+        type_manager.add_type(self.type_tag)
+        type_values = type_manager.get_type(self.type_tag)
         counts = HedTypeCounts(new_info['name'], self.type_tag)
         counts.update_summary(type_values.get_summary(),
                               type_values.total_events, new_info['name'])
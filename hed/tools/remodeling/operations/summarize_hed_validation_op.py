@@ -54,6 +54,7 @@ class SummarizeHedValidationOp(BaseOp):
     }
 
     SUMMARY_TYPE = 'hed_validation'
+    READ_ONLY = True
 
     def __init__(self, parameters):
         """ Constructor for the summarize HED validation operation.
@@ -78,20 +79,19 @@ class SummarizeHedValidationOp(BaseOp):
             sidecar (Sidecar or file-like): Usually needed unless only HED tags in HED column of event file.
 
         Returns:
-            DataFrame: A copy of df
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
             summary = HedValidationSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
+        summary.update_summary({'df': dispatcher.post_proc_data(df), 'name': name,
                                 'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        return df
 
     @staticmethod
     def validate_input_data(parameters):
@@ -2,7 +2,7 @@
 
 import json
 from hed.tools.analysis.tabular_summary import TabularSummary
-from hed.tools.remodeling.operations.base_op import BaseOp
+from hed.tools.remodeling.operations.base_op import BaseOp, ColumnSet
 from hed.tools.remodeling.operations.base_summary import BaseSummary
 
 
@@ -65,6 +65,7 @@ class SummarizeSidecarFromEventsOp(BaseOp):
     }
 
     SUMMARY_TYPE = "events_to_sidecar"
+    READ_ONLY = True
 
     def __init__(self, parameters):
         """ Constructor for summarize sidecar from events operation.
@@ -91,21 +92,32 @@ class SummarizeSidecarFromEventsOp(BaseOp):
             sidecar (Sidecar or file-like): Not needed for this operation.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The df itself, which is not modified.
 
         Side effect:
             Updates the associated summary if applicable.
 
         """
 
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
             summary = EventsToSidecarSummary(self)
             dispatcher.summary_dicts[self.summary_name] = summary
         summary.update_summary(
-            {'df': dispatcher.post_proc_data(df_new), 'name': name})
-        return df_new
+            {'df': dispatcher.post_proc_data(df), 'name': name})
+        return df
+
+    def get_input_columns(self, output_columns):
+        """ Return the columns of the input df needed for the columns of the result used later.
+
+        Parameters:
+            output_columns (ColumnSet):  The columns of the df returned by do_op that are used afterwards.
+
+        Returns:
+            ColumnSet: All columns except the skipped columns that are not used later.
+
+        """
+        return output_columns.union(ColumnSet.all(self.skip_columns or []))
 
     @staticmethod
     def validate_input_data(parameters):
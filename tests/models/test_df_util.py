@@ -174,6 +174,25 @@ class TestConvertToForm(unittest.TestCase):
         convert_to_form(df, self.schema, "long_tag", ['column1'])
         pd.testing.assert_frame_equal(df, expected_df)
 
+    def test_convert_to_form_duplicates_across_columns(self):
+        df = pd.DataFrame({"column1": ["CSS-color/White-color/Azure, (Action/Perceive/See)", "n/a",
+                                       "CSS-color/White-color/Azure, (Action/Perceive/See)"],
+                           "column2": ["n/a", "CSS-color/White-color/Azure, (Action/Perceive/See)", "((Nose)"]})
+        expected_df = pd.DataFrame({"column1": ["Azure,(See)", "n/a", "Azure,(See)"],
+                                    "column2": ["n/a", "Azure,(See)", ""]})
+        convert_to_form(df, self.schema, "short_tag")
+        pd.testing.assert_frame_equal(df, expected_df)
+
+    def test_convert_to_form_matches_hed_string(self):
+        from hed.models.df_util import _convert_to_form
+        from hed import HedString
+        test_strings = ["", "  ", "Azure", " Azure , (See, (Nose)) ", "(Azure,,See)", "Azure)", "((Azure)",
+                        "Def/Unknown, Label/#, {column_ref}", "(Azure, ()), Junk/Extension"]
+        for test_string in test_strings:
+            for tag_form in ["short_tag", "long_tag", "org_tag"]:
+                self.assertEqual(_convert_to_form(test_string, self.schema, tag_form),
+                                 HedString(test_string, self.schema).get_as_form(tag_form))
+
     def test_basic_expand_detection(self):
         # all simple cases with no duplicates
         test_strings = [
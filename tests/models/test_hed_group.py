@@ -2,7 +2,7 @@ import unittest
 import os
 
 from hed import schema
-from hed.models import HedString
+from hed.models import HedString, QueryHandler
 import copy
 
 
@@ -132,6 +132,38 @@ class Test(unittest.TestCase):
         self.assertEqual(str(original_hed_string), str(hed_string))
         self.assertIsNot(sorted_hed_string, hed_string)
 
+    def test_flat_view(self):
+        hed_string = HedString("A, (B, (C, D)), (E)", self.hed_schema)
+        flat_view = hed_string._get_flat_view()
+        self.assertEqual([str(tag) for tag in flat_view.tags], ["A", "B", "C", "D", "E"])
+        self.assertEqual(flat_view.group_depths, (0, 1, 2, 1))
+        self.assertEqual(flat_view.group_parents, (-1, 0, 1, 0))
+        self.assertEqual(flat_view.tag_parents, (0, 1, 2, 2, 3))
+        self.assertIs(flat_view, hed_string._get_flat_view())
+        groups = hed_string.get_all_groups(also_return_depth=True)
+        self.assertEqual([is_top_level for _, is_top_level in groups], [False, True, False, True])
+
+    def test_flat_view_invalidated(self):
+        hed_string = HedString("A, (B, (C, D)), (E)", self.hed_schema)
+        inner_group = hed_string.get_all_groups()[2]
+        self.assertEqual(len(hed_string.get_all_tags()), 5)
+        inner_group.remove([inner_group.children[0]])
+        self.assertEqual([str(tag) for tag in hed_string.get_all_tags()], ["A", "B", "D", "E"])
+        copied_string = copy.deepcopy(hed_string)
+        copied_tags = copied_string.get_all_tags()
+        self.assertEqual(copied_tags, hed_string.get_all_tags())
+        self.assertTrue(all(tag is not org_tag for tag, org_tag in zip(copied_tags, hed_string.get_all_tags())))
+
+    def test_tag_terms_follow_changed_tags(self):
+        hed_string = HedString("Event, (Red, Blue)", self.hed_schema)
+        self.assertFalse(QueryHandler("Item").search(hed_string))
+        hed_string.get_all_tags()[0].tag = "Item"
+        self.assertTrue(QueryHandler("Item").search(hed_string))
+        inner_group = hed_string.get_all_groups()[1]
+        inner_group.children[0].tag = "Square"
+        self.assertIn("square", inner_group.get_all_tag_terms())
+        self.assertIn("square", hed_string.get_all_tag_terms())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+from hed.models.hed_string import HedString
+from hed.models.hed_tokenizer import HedTokenKind, iter_hed_tokens, get_hed_tokens, tokenize_hed_string
+
+
+class Test(unittest.TestCase):
+
+    def test_token_kinds(self):
+        hed_string = "  Event, (Item/Blue  ,Agent) , Label/3 m  "
+        tokens = [(kind, hed_string[start:end]) for kind, start, end in iter_hed_tokens(hed_string)]
+        self.assertEqual(tokens, [(HedTokenKind.WHITESPACE, "  "),
+                                  (HedTokenKind.TAG, "Event"),
+                                  (HedTokenKind.COMMA, ", "),
+                                  (HedTokenKind.OPEN_GROUP, "("),
+                                  (HedTokenKind.TAG, "Item/Blue"),
+                                  (HedTokenKind.COMMA, "  ,"),
+                                  (HedTokenKind.TAG, "Agent"),
+                                  (HedTokenKind.CLOSE_GROUP, ") "),
+                                  (HedTokenKind.COMMA, ", "),
+                                  (HedTokenKind.TAG, "Label/3 m"),
+                                  (HedTokenKind.WHITESPACE, "  ")])
+
+    def test_leading_spaces_before_delimiter(self):
+        self.assertEqual(get_hed_tokens("  (A)"), [(HedTokenKind.WHITESPACE, 0, 2),
+                                                   (HedTokenKind.OPEN_GROUP, 2, 3),
+                                                   (HedTokenKind.TAG, 3, 4),
+                                                   (HedTokenKind.CLOSE_GROUP, 4, 5)])
+        self.assertEqual(get_hed_tokens("   "), [(HedTokenKind.WHITESPACE, 0, 3)])
+        self.assertEqual(get_hed_tokens(""), [])
+
+    def test_split_hed_string_spans(self):
+        expected = {
+            "": [],
+            "A": [(True, (0, 1))],
+            "A,B": [(True, (0, 1)), (False, (1, 2)), (True, (2, 3))],
+            "(A, (B)), C": [(False, (0, 1)), (True, (1, 2)), (False, (2, 4)), (False, (4, 5)), (True, (5, 6)),
+                            (False, (6, 7)), (False, (7, 8)), (False, (8, 10)), (True, (10, 11))],
+            ",,A,,": [(False, (0, 1)), (False, (1, 2)), (True, (2, 3)), (False, (3, 4)), (False, (4, 5))],
+            "((": [(False, (0, 1)), (False, (1, 2))],
+            "))": [(False, (0, 1)), (False, (1, 2))],
+            " a b ,\tc": [(False, (0, 1)), (True, (1, 4)), (False, (4, 6)), (True, (6, 8))],
+            "(A,)": [(False, (0, 1)), (True, (1, 2)), (False, (2, 3)), (False, (3, 4))],
+            " , ": [(False, (0, 1)), (False, (1, 3))]
+        }
+        for test_string, spans in expected.items():
+            self.assertEqual(HedString.split_hed_string(test_string), spans)
+            covered = "".join(test_string[start:end] for _, start, end in iter_hed_tokens(test_string))
+            self.assertEqual(covered, test_string)
+
+    def test_tokenize_hed_string(self):
+        starts, ends, kinds = tokenize_hed_string("(A, B)")
+        self.assertEqual(starts.dtype, np.int32)
+        self.assertEqual(kinds.dtype, np.uint8)
+        self.assertEqual(starts.tolist(), [0, 1, 2, 4, 5])
+        self.assertEqual(ends.tolist(), [1, 2, 4, 5, 6])
+        self.assertEqual(kinds.tolist(), [HedTokenKind.OPEN_GROUP, HedTokenKind.TAG, HedTokenKind.COMMA,
+                                          HedTokenKind.TAG, HedTokenKind.CLOSE_GROUP])
+        starts, ends, kinds = tokenize_hed_string("")
+        self.assertEqual(len(starts), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -773,3 +773,33 @@ class TestParser(unittest.TestCase):
             "(A, B, C)": True
         }
         self.base_test("{a || b}", test_strings)
+
+    def test_could_match_prefilter(self):
+        hed_string = HedString("A, (B, (C, D))", self.hed_schema)
+        tag_terms = hed_string.get_all_tag_terms()
+        self.assertEqual(tag_terms, frozenset({"a", "b", "c", "d"}))
+        expected = {
+            "a": True,
+            "e": False,
+            "a && e": False,
+            "a || e": True,
+            "[c && d]": True,
+            "[c && e]": False,
+            "{b: e}": True,
+            "{e: b}": False,
+            "~e": True,
+            "@e": True,
+            "e*": True,
+            '"e"': True,
+            "???": True,
+        }
+        for query, result in expected.items():
+            self.assertEqual(QueryHandler(query).tree.could_match(tag_terms), result, query)
+
+    def test_could_match_after_modification(self):
+        hed_string = HedString("A, (B, C)", self.hed_schema)
+        query = QueryHandler("[B && C]")
+        self.assertTrue(query.search(hed_string))
+        hed_string.remove([hed_string.get_all_tags()[1]])
+        self.assertNotIn("b", hed_string.get_all_tag_terms())
+        self.assertFalse(query.search(hed_string))
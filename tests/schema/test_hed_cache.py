@@ -0,0 +1,65 @@
+import unittest
+import os
+import json
+import time
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from hed.schema import hed_cache
+from hed.schema.hed_cache_lock import _write_last_cached_time
+
+
+class TestCacheManifest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        hed_cache.cache_local_versions(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_manifest_matches_folder(self):
+        with open(os.path.join(self.cache_dir, hed_cache.MANIFEST_FILENAME)) as file:
+            saved = json.load(file)
+        installed = [name for name in os.listdir(hed_cache.INSTALLED_CACHE_LOCATION)
+                     if hed_cache.version_pattern.match(name)]
+        self.assertCountEqual([record["path"] for record in saved["schemas"]], installed)
+        for record in saved["schemas"]:
+            self.assertFalse(record["prerelease"])
+            self.assertEqual(record["sha1"], hed_cache._calculate_sha1(os.path.join(self.cache_dir, record["path"])))
+
+        versions = hed_cache.get_hed_versions(self.cache_dir, library_name="all")
+        self.assertEqual(versions[None], ["8.3.0", "8.2.0", "8.1.0", "8.0.0"])
+        self.assertEqual(versions["score"], ["2.0.0", "1.1.0", "1.0.0"])
+        self.assertEqual(hed_cache.get_hed_versions(self.cache_dir, library_name="score"), versions["score"])
+        self.assertEqual(hed_cache.get_hed_versions(self.cache_dir, library_name="not_a_library"), {})
+        self.assertEqual(hed_cache.get_hed_version_path("1.1.0", "score", self.cache_dir),
+                         os.path.join(self.cache_dir, "HED_score_1.1.0.xml"))
+        self.assertIsNone(hed_cache.get_hed_version_path("9.9.9", "score", self.cache_dir))
+
+    def test_manifest_follows_folder_changes(self):
+        os.makedirs(os.path.join(self.cache_dir, "prerelease"))
+        shutil.copy(os.path.join(self.cache_dir, "HED_score_2.0.0.xml"),
+                    os.path.join(self.cache_dir, "prerelease", "HED_score_2.1.0.xml"))
+        os.remove(os.path.join(self.cache_dir, "HED_score_1.0.0.xml"))
+
+        self.assertEqual(hed_cache.get_hed_versions(self.cache_dir, library_name="score"), ["2.0.0", "1.1.0"])
+        self.assertEqual(hed_cache.get_hed_versions(self.cache_dir, library_name="score", check_prerelease=True),
+                         ["2.1.0", "2.0.0", "1.1.0"])
+        self.assertIsNone(hed_cache.get_hed_version_path("2.1.0", "score", self.cache_dir))
+        self.assertEqual(hed_cache.get_hed_version_path("2.1.0", "score", self.cache_dir, check_prerelease=True),
+                         os.path.join(self.cache_dir, "prerelease", "HED_score_2.1.0.xml"))
+
+        # A new process only has the saved manifest.
+        hed_cache._manifests.clear()
+        self.assertEqual(hed_cache.get_hed_versions(self.cache_dir, library_name="score", check_prerelease=True),
+                         ["2.1.0", "2.0.0", "1.1.0"])
+
+    def test_recently_cached_skips_lock(self):
+        _write_last_cached_time(time.time(), self.cache_dir)
+        with patch.object(hed_cache, "CacheLock", side_effect=AssertionError("The lock should not be used")):
+            self.assertEqual(hed_cache.cache_xml_versions(cache_folder=self.cache_dir), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import copy
 import os
 
 from hed.errors import HedFileError
@@ -136,3 +137,71 @@ class TestHedSchema(unittest.TestCase):
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace=None))
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace=''))
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace='unknown'))
+
+    def test_frozen_schema(self):
+        schema = load_schema_version(xml_version="8.3.0")
+        self.assertTrue(schema.frozen)
+        self.assertIs(schema, load_schema_version(xml_version="8.3.0"))
+        with self.assertRaises(AttributeError):
+            schema.set_schema_prefix("sc:")
+        with self.assertRaises(AttributeError):
+            schema.finalize_dictionaries()
+        with self.assertRaises(AttributeError):
+            schema.filename = "other.xml"
+        self.assertEqual({schema: "cached"}[load_schema_version(xml_version="8.3.0")], "cached")
+
+        schema_copy = copy.deepcopy(schema)
+        self.assertFalse(schema_copy.frozen)
+        schema_copy.set_schema_prefix("sc:")
+        self.assertEqual(schema.schema_namespace, "")
+        with self.assertRaises(TypeError):
+            hash(schema_copy)
+
+    def test_with_namespace(self):
+        schema = load_schema_version(xml_version="8.3.0")
+        view = schema.with_namespace("sc")
+        self.assertTrue(view.frozen)
+        self.assertEqual(view.schema_namespace, "sc:")
+        self.assertEqual(schema.schema_namespace, "")
+        self.assertIs(view.tags, schema.tags)
+        self.assertIs(view.with_namespace("sc:"), view)
+        self.assertEqual(view, load_schema_version(xml_version="sc:8.3.0"))
+        self.assertEqual(hash(view), hash(load_schema_version(xml_version="sc:8.3.0")))
+        self.assertTrue(view.get_tag_entry("sc:Event", schema_namespace="sc:"))
+        self.assertFalse(view.get_tag_entry("Event"))
+        tag = HedTag("sc:Event", hed_schema=view)
+        self.assertEqual(tag.long_tag, "sc:Event")
+        with self.assertRaises(HedFileError):
+            schema.with_namespace("s1:")
+
+    def test_query_tags(self):
+        schema = load_schema_version(xml_version="8.3.0")
+        takes_value = schema.get_tags_with_attribute(HedKey.TakesValue)
+        time_tags = schema.query_tags({"and": [HedKey.TakesValue, (HedKey.UnitClass, "timeUnits")]})
+        self.assertIn("Property/Data-property/Data-value/Spatiotemporal-value/Temporal-value/Duration/#", time_tags)
+        self.assertTrue(set(time_tags) < set(takes_value))
+        self.assertEqual(schema.query_tags({"and": [HedKey.TakesValue, {"not": [HedKey.UnitClass, "timeUnits"]}]}),
+                         [tag for tag in takes_value if tag not in time_tags])
+        self.assertEqual(schema.query_tags({"or": [HedKey.Unique, HedKey.Required]}),
+                         [entry.name for entry in schema.tags.values()
+                          if entry.has_attribute(HedKey.Unique) or entry.has_attribute(HedKey.Required)])
+        self.assertEqual(schema.with_namespace("sc:").query_tags(HedKey.Unique),
+                         ["sc:" + tag for tag in schema.get_tags_with_attribute(HedKey.Unique)])
+        with self.assertRaises(ValueError):
+            schema.query_tags({"xor": [HedKey.Unique, HedKey.Required]})
+
+    def test_resolve_many(self):
+        tags = ["Event", "Sensory-event", "Duration/3 s", "Item/Blah/Object", "Red/Extension", "Blah",
+                "tl:Event", "xx:Event", "Event", "duration/3 s"]
+        for schema in (self.hed_schema_3g, self.hed_schema_group):
+            entries, long_tags, short_tags, remainders, issues = schema.resolve_many(tags)
+            self.assertEqual(len(entries), len(tags))
+            for index, tag in enumerate(tags):
+                hed_tag = HedTag(tag, schema)
+                self.assertIs(entries[index], hed_tag._schema_entry)
+                self.assertEqual(long_tags[index], hed_tag.long_tag)
+                self.assertEqual(short_tags[index], hed_tag.short_tag)
+                self.assertEqual(bool(issues[index]), entries[index] is None)
+            self.assertEqual(remainders[2], "/3 s")
+            self.assertIsNot(issues[0], issues[8])
+        self.assertEqual(self.hed_schema_3g.resolve_many([]), ([], [], [], [], []))
@@ -0,0 +1,118 @@
+import unittest
+import os
+import pickle
+import tempfile
+import json
+import numpy as np
+
+from hed.errors import HedFileError
+from hed.models import HedString
+from hed.schema import HedKey, load_schema, FlatHedSchema
+from hed.schema.hed_schema_flat import FLAT_SCHEMA_MAGIC, _ALIGNMENT, _pack
+
+
+class TestFlatHedSchema(unittest.TestCase):
+    schema_file = '../data/schema_tests/HED8.2.0.mediawiki'
+
+    @classmethod
+    def setUpClass(cls):
+        schema_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), cls.schema_file)
+        cls.hed_schema = load_schema(schema_path)
+        cls.hed_schema_ns = load_schema(schema_path, schema_namespace="sc:")
+        cls.flat_schema = FlatHedSchema.from_schema(cls.hed_schema)
+
+    def _assert_same_lookup(self, hed_schema, flat_schema, tag, schema_namespace=""):
+        entry, remainder, issues = hed_schema.find_tag_entry(tag, schema_namespace)
+        flat_entry, flat_remainder, flat_issues = flat_schema.find_tag_entry(tag, schema_namespace)
+        self.assertEqual(entry.name if entry else None, flat_entry.name if flat_entry else None)
+        self.assertEqual(remainder, flat_remainder)
+        self.assertEqual(issues, flat_issues)
+
+    def test_entries_match(self):
+        self.assertEqual(len(self.flat_schema), len(self.hed_schema.tags.all_entries))
+        for entry in self.hed_schema.tags.all_entries:
+            flat_entry = self.flat_schema.get_tag_entry(entry.name)
+            self.assertEqual(flat_entry.long_tag_name, entry.long_tag_name)
+            self.assertEqual(flat_entry.short_tag_name, entry.short_tag_name)
+            self.assertEqual(flat_entry.attributes, entry.inherited_attributes)
+            self.assertEqual(set(flat_entry.unit_class_names), set(entry.unit_classes))
+            self.assertEqual(set(flat_entry.value_class_names), set(entry.value_classes))
+            for attribute in (HedKey.ExtensionAllowed, HedKey.TakesValue, HedKey.SuggestedTag):
+                self.assertEqual(flat_entry.has_attribute(attribute), entry.has_attribute(attribute))
+                self.assertEqual(flat_entry.has_attribute(attribute, return_value=True),
+                                 entry.has_attribute(attribute, return_value=True))
+
+    def test_find_tag_entry(self):
+        test_tags = ["Event", "event/sensory-event", "Red", "Duration/3 s", "Duration/#", "Red/Extension",
+                     "Item/Blah/Object", "Blah/Event", "Property/Red", "Blah", "Age/Blah"]
+        for tag in test_tags:
+            self._assert_same_lookup(self.hed_schema, self.flat_schema, tag)
+
+        flat_schema_ns = FlatHedSchema.from_schema(self.hed_schema_ns)
+        self.assertEqual(flat_schema_ns.version, self.hed_schema_ns.version)
+        for tag in ["sc:Event", "sc:Duration/3 s", "Event"]:
+            self._assert_same_lookup(self.hed_schema_ns, flat_schema_ns, tag, "sc:")
+        self._assert_same_lookup(self.hed_schema_ns, flat_schema_ns, "Event", "")
+
+    def test_hed_string_conversion(self):
+        hed_string = "Sensory-event, (Red, Item/Blah), Duration/3 s"
+        expected = HedString(hed_string, self.hed_schema)
+        flat_string = HedString(hed_string, self.flat_schema)
+        self.assertEqual(flat_string.get_as_long(), expected.get_as_long())
+        self.assertEqual(flat_string.get_as_short(), expected.get_as_short())
+
+    def test_resolve_many(self):
+        tags = ["Sensory-event", "Red", "Item/Blah", "Duration/3 s", "Blah", "Red"]
+        _, long_tags, short_tags, remainders, _ = self.flat_schema.resolve_many(tags)
+        _, expected_long, expected_short, expected_remainders, _ = self.hed_schema.resolve_many(tags)
+        self.assertEqual(long_tags, expected_long)
+        self.assertEqual(short_tags, expected_short)
+        self.assertEqual(remainders, expected_remainders)
+
+    def test_get_tags_with_attribute(self):
+        self.assertCountEqual(self.flat_schema.get_tags_with_attribute(HedKey.Unique),
+                              self.hed_schema.get_tags_with_attribute(HedKey.Unique))
+
+    def test_pack_header_fits(self):
+        # Many arrays make the header grow well past its first estimate.
+        arrays = {f"array_{index}": np.full(index % 7, index, dtype=np.int32) for index in range(500)}
+        buffer = _pack({"arrays": {}}, arrays)
+        header_start = len(FLAT_SCHEMA_MAGIC) + _ALIGNMENT
+        header_len = int(np.frombuffer(buffer[len(FLAT_SCHEMA_MAGIC):header_start], dtype=np.uint64)[0])
+        header = json.loads(buffer[header_start:header_start + header_len].decode("utf-8"))
+        self.assertGreaterEqual(min(offset for _, _, offset in header["arrays"].values()), header_start + header_len)
+        for name, (dtype, length, offset) in header["arrays"].items():
+            array = np.frombuffer(buffer, dtype=dtype, count=length, offset=offset)
+            self.assertTrue(np.array_equal(array, arrays[name]))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "schema.hedflat")
+            self.flat_schema.save(filename)
+            loaded = FlatHedSchema.load(filename)
+            self.assertEqual(loaded.to_bytes(), self.flat_schema.to_bytes())
+            self.assertEqual(loaded.get_tag_entry("Red").long_tag_name,
+                             self.hed_schema.get_tag_entry("Red").long_tag_name)
+            loaded.close()
+        with self.assertRaises(HedFileError):
+            FlatHedSchema(b"Not a schema at all")
+
+    def test_shared_memory_and_pickle(self):
+        shm = self.flat_schema.to_shared_memory()
+        try:
+            attached = FlatHedSchema.from_shared_memory(shm.name)
+            pickled = pickle.dumps(attached)
+            self.assertLess(len(pickled), 1000)
+            unpickled = pickle.loads(pickled)
+            self.assertEqual(unpickled.get_tag_entry("Red").name, self.hed_schema.get_tag_entry("Red").name)
+            unpickled.close()
+            attached.close()
+        finally:
+            shm.close()
+            shm.unlink()
+        copied = pickle.loads(pickle.dumps(self.flat_schema))
+        self.assertEqual(copied.to_bytes(), self.flat_schema.to_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import os
 
-from hed.schema import load_schema, HedSchemaGroup
+from hed.schema import load_schema, HedSchemaGroup, HedKey
 
 
 class TestHedSchema(unittest.TestCase):
@@ -21,6 +21,13 @@ class TestHedSchema(unittest.TestCase):
         tag_entry = self.hed_schema_group.get_tag_entry("Event", schema_namespace="tl:")
         self.assertTrue(tag_entry)
 
+    def test_get_tags_with_attribute(self):
+        unique_tags = self.hed_schema_group.get_tags_with_attribute(HedKey.Unique)
+        self.assertIn("Property/Organizational-property/Event-context", unique_tags)
+        self.assertEqual([tag for tag in unique_tags if tag.startswith("tl:")],
+                         ["tl:" + tag for tag in unique_tags if not tag.startswith("tl:")])
+        self.assertEqual(self.hed_schema_group.query_tags({"or": [HedKey.Unique]}), unique_tags)
+
     def test_bad_prefixes(self):
         schema = self.hed_schema_group
 
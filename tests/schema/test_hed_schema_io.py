@@ -3,7 +3,8 @@ import unittest
 from hed.errors import HedFileError
 from hed.errors.error_types import SchemaErrors
 from hed.schema import load_schema, HedSchemaGroup, load_schema_version, HedSchema
-from hed.schema.hed_schema_io import parse_version_list, _load_schema_version
+from hed.schema.hed_schema_io import parse_version_list, _load_schema_version, from_string, get_hed_xml_version
+from hed.schema.schema_io.xml2schema import SchemaLoaderXML
 from tests.schema.test_schema_converters import with_temp_file, get_temp_filename
 
 import os
@@ -78,6 +79,26 @@ class TestHedSchema(unittest.TestCase):
         self.assertEqual(hed_schema.schema_namespace, "testspace:")
         self.assertEqual(hed_schema.name, schema_path)
 
+    def test_load_xml_schema(self):
+        schema_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), '../data/schema_tests/HED8.2.0.xml')
+        with open(schema_path, encoding="utf-8") as fp:
+            schema_string = fp.read()
+        hed_schema = load_schema(schema_path)
+        self.assertEqual(hed_schema, from_string(schema_string))
+        self.assertEqual(get_hed_xml_version(schema_path), "8.2.0")
+        loader = SchemaLoaderXML(schema_path)
+        self.assertEqual(len(loader.input_data), 0)
+
+        with self.assertRaises(HedFileError) as context:
+            from_string(schema_string.replace("<name>Event</name>", "<name></name>", 1))
+        self.assertEqual(context.exception.code, HedExceptions.HED_SCHEMA_NODE_NAME_INVALID)
+        with self.assertRaises(HedFileError) as context:
+            from_string(schema_string.replace("unitModifierDefinitions>", "modifierDefinitions>"))
+        self.assertEqual(context.exception.code, HedExceptions.INVALID_HED_FORMAT)
+        with self.assertRaises(HedFileError) as context:
+            from_string(schema_string[:len(schema_string) // 2])
+        self.assertEqual(context.exception.code, HedExceptions.CANNOT_PARSE_XML)
+
     def test_load_schema_version(self):
         ver1 = "8.0.0"
         schemas1 = load_schema_version(ver1)
@@ -413,6 +434,22 @@ class TestHedSchemaMerging(unittest.TestCase):
 
         self._base_merging_test(files)
 
+    def test_unmerged_shares_standard(self):
+        standard_schema = load_schema_version("8.2.0")
+        standard_xml = standard_schema.get_as_xml_string()
+        standard_sound = standard_schema.tags["Instrument-sound"]
+        loaded_schema = load_schema(os.path.join(self.full_base_folder, "basic_root.mediawiki"))
+
+        # Unchanged standard entries are shared, while the rooted tags go into a copy of their tree.
+        self.assertIs(loaded_schema.tags["Event"], standard_schema.tags["Event"])
+        self.assertIs(loaded_schema.unit_classes["timeUnits"], standard_schema.unit_classes["timeUnits"])
+        self.assertIsNot(loaded_schema.tags["Instrument-sound"], standard_sound)
+        self.assertIn("Oboe-sound", loaded_schema.tags["Instrument-sound"].children)
+        self.assertNotIn("Oboe-sound", standard_sound.children)
+        self.assertIs(standard_schema.tags["Instrument-sound"], standard_sound)
+        self.assertEqual(standard_schema.get_as_xml_string(), standard_xml)
+        self.assertEqual(loaded_schema, load_schema(os.path.join(self.full_base_folder, "basic_root.xml")))
+
     @with_temp_file(".mediawiki")
     def test_saving_bad_sort(self, filename):
         loaded_schema = load_schema(os.path.join(self.full_base_folder, "bad_sort_test.mediawiki"))
@@ -143,6 +143,34 @@ class TestHedSchemaDF(unittest.TestCase):
                          "MadeUpLongTagNameParent")
         self.assertEqual(loaded_schema, loaded_out_of_order)
 
+    def test_loading_reversed_tags(self):
+        schema = load_schema_version("8.3.0")
+        dataframes = schema.get_as_dataframes()
+        tag_df = dataframes[df_constants.TAG_KEY]
+        dataframes[df_constants.TAG_KEY] = tag_df.iloc[::-1].reset_index(drop=True)
+
+        loaded_reversed = from_dataframes(dataframes)
+        self.assertEqual(schema, loaded_reversed)
+        self.assertEqual(loaded_reversed.tags["Duration"].takes_value_child_entry.name, "Property/Data-property/"
+                         "Data-value/Spatiotemporal-value/Temporal-value/Duration/#")
+        for key, df in loaded_reversed.get_as_dataframes().items():
+            self.assertEqual(len(df), len(dataframes[key]))
+
+    def test_loading_malformed_child_before_parent(self):
+        # The malformed attributes of a row read after its parent are reported once
+        dataframes = create_empty_dataframes()
+        dataframes[df_constants.STRUCT_KEY] = self._create_structure_df()
+        tag_df = pd.DataFrame([], columns=df_constants.tag_columns, dtype=str)
+        tag_df = self._add_tag_row(tag_df, "MadeUpLongTagNameChild", "MadeUpLongTagNameParent")
+        tag_df = self._add_tag_row(tag_df, "MadeUpLongTagNameParent", "HedTag")
+        tag_df.loc[0, df_constants.attributes] = "1bad"
+        dataframes[df_constants.TAG_KEY] = tag_df
+
+        with self.assertRaises(HedFileError) as error:
+            _ = from_dataframes(dataframes)
+        self.assertEqual(len(error.exception.issues), 1)
+        self.assertEqual(error.exception.args[0], HedExceptions.WIKI_DELIMITERS_INVALID)
+
     def test_loading_circular(self):
         # Verify a circular reference properly reports an error
         dataframes = create_empty_dataframes()
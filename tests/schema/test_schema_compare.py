@@ -5,8 +5,10 @@ import copy
 from hed.schema import HedKey, HedSectionKey
 from hed.schema.schema_compare import compare_schemas
 from hed.schema.schema_compare import (gather_schema_changes, find_matching_tags, pretty_print_change_dict,
-                                       compare_differences)
+                                       compare_differences, get_schema_changeset, apply_schema_changeset)
 from hed import load_schema_version, load_schema
+from hed.errors import HedFileError
+import json
 
 from tests.schema import util_create_schemas
 import os
@@ -113,3 +115,33 @@ class TestSchemaComparison(unittest.TestCase):
         schema2 = copy.deepcopy(schema1)
         diff_string = compare_differences(schema1, schema2, attribute_filter=HedKey.InLibrary)
         self.assertFalse(diff_string)
+
+    def test_entry_fingerprints(self):
+        schema1 = load_schema_version("8.3.0")
+        schema2 = copy.deepcopy(schema1)
+        entry = schema2.tags["Sensory-event"]
+        entry.attributes[HedKey.SuggestedTag] = ",".join(reversed(entry.attributes[HedKey.SuggestedTag].split(",")))
+        schema2.tags["Agent"].description = "A changed description."
+        schema2.finalize_dictionaries()
+
+        self.assertEqual(schema1.tags["Sensory-event"], entry)
+        self.assertEqual(schema1.tags["Sensory-event"].fingerprint, entry.fingerprint)
+        self.assertNotEqual(schema1.tags["Agent"], schema2.tags["Agent"])
+        self.assertNotEqual(schema1.tags["Agent"].fingerprint, schema2.tags["Agent"].fingerprint)
+        _, _, _, unequal_entries = compare_schemas(schema1, schema2, attribute_filter=None)
+        self.assertEqual(list(unequal_entries[HedSectionKey.Tags]), ["Agent"])
+
+    def test_apply_schema_changeset(self):
+        schema1 = load_schema(os.path.join(self.base_data, "schema_compare.mediawiki"))
+        schema2 = load_schema(os.path.join(self.base_data, "schema_compare2.mediawiki"))
+        changeset = json.loads(json.dumps(get_schema_changeset(schema1, schema2)))
+        self.assertIn("AddedTag", changeset["sections"][HedSectionKey.Tags.value]["added"])
+        self.assertIn("RemovingUnitClass/#", changeset["sections"][HedSectionKey.Tags.value]["modified"])
+
+        patched_schema = apply_schema_changeset(schema1, changeset)
+        self.assertEqual(patched_schema, schema2)
+        self.assertEqual(patched_schema.get_as_mediawiki_string(), schema2.get_as_mediawiki_string())
+        self.assertEqual(get_schema_changeset(schema2, patched_schema)["sections"], {})
+
+        with self.assertRaises(HedFileError):
+            apply_schema_changeset(schema2, changeset)
@@ -2,6 +2,8 @@ import unittest
 import os
 
 from hed import schema
+from hed.errors.error_types import ErrorContext
+from hed.schema import schema_compliance
 
 
 class Test(unittest.TestCase):
@@ -22,3 +24,26 @@ class Test(unittest.TestCase):
         issues = hed_schema.check_compliance()
         self.assertTrue(isinstance(issues, list))
         self.assertTrue(len(issues) > 1)
+
+    def test_cached_and_parallel_compliance(self):
+        hed_schema = schema.load_schema_version("score_1.1.0")
+        schema_compliance._compliance_cache.clear()
+        issues = hed_schema.check_compliance()
+        self.assertEqual(len(schema_compliance._compliance_cache), 1)
+        self.assertEqual(hed_schema.check_compliance(), issues)
+        renamed = hed_schema.check_compliance(name="renamed.xml")
+        self.assertEqual(len(renamed), len(issues))
+        self.assertTrue(all(issue[ErrorContext.FILE_NAME] == "renamed.xml" for issue in renamed))
+        self.assertEqual(len(schema_compliance._compliance_cache), 1)
+
+        schema_compliance._compliance_cache.clear()
+        self.assertEqual(hed_schema.check_compliance(workers=2), issues)
+
+        schema_path = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                   '../data/schema_tests/HED8.2.0.mediawiki')
+        original = schema.load_schema(schema_path)
+        changed = schema.load_schema(schema_path)
+        self.assertEqual(schema_compliance.get_content_hash(changed), schema_compliance.get_content_hash(original))
+        changed.tags["Event"]._set_attribute_value("extensionAllowed", True)
+        self.assertNotEqual(schema_compliance.get_content_hash(changed),
+                            schema_compliance.get_content_hash(original))
@@ -1,8 +1,10 @@
 import unittest
 import os
 import shutil
+import tempfile
 from hed import load_schema_version
-from hed.scripts.script_util import add_extension, sort_base_schemas, validate_all_schema_formats, validate_schema
+from hed.scripts.script_util import add_extension, sort_base_schemas, validate_all_schema_formats, validate_schema, \
+    validate_all_schemas
 import contextlib
 
 
@@ -164,6 +166,31 @@ class TestValidateAllSchemaFormats(unittest.TestCase):
         shutil.rmtree(cls.base_path)  # This will delete the directory and all its contents
 
 
+class TestValidateAllSchemas(unittest.TestCase):
+    def test_parallel_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            good_basename = os.path.join(temp_dir, "prerelease", "good_schema")
+            bad_basename = os.path.join(temp_dir, "prerelease", "bad_schema")
+            os.makedirs(os.path.dirname(good_basename))
+            schema = load_schema_version("8.3.0")
+            schema.save_as_xml(good_basename + ".xml")
+            schema.save_as_mediawiki(good_basename + ".mediawiki")
+            schema.save_as_dataframes(os.path.join(temp_dir, "prerelease", "hedtsv", "good_schema"))
+            schema.save_as_xml(bad_basename + ".xml")
+            schema.save_as_dataframes(os.path.join(temp_dir, "prerelease", "hedtsv", "bad_schema"))
+            load_schema_version("8.2.0").save_as_mediawiki(bad_basename + ".mediawiki")
+
+            schema_files = {good_basename: [".xml", ".mediawiki"], bad_basename: [".xml", ".mediawiki"],
+                            os.path.join(temp_dir, "does_not_matter"): [".XML"]}
+            with contextlib.redirect_stdout(None):
+                sequential_issues = validate_all_schemas(schema_files)
+                parallel_issues = validate_all_schemas(schema_files, max_workers=2)
+        self.assertEqual(len(sequential_issues), 2)
+        self.assertIn("Multiple schemas of type", sequential_issues[0])
+        self.assertIn("Only fully lowercase extensions ", sequential_issues[1])
+        self.assertEqual(parallel_issues, sequential_issues)
+
+
 class TestValidateSchema(unittest.TestCase):
     def test_load_invalid_extension(self):
         # Verify capital letters fail validation
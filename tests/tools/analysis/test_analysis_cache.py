@@ -0,0 +1,70 @@
+import unittest
+from pandas import DataFrame
+from hed.models.tabular_input import TabularInput
+from hed.schema.hed_schema_io import load_schema_version
+from hed.tools.analysis.analysis_cache import AnalysisCache
+from hed.tools.remodeling.dispatcher import Dispatcher
+
+
+class Test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version(xml_version="8.2.0")
+        cls.df = DataFrame({'onset': [0.0, 1.0, 2.0, 3.0],
+                            'HED': ["Sensory-event, (Duration/2 s, (Red))", "Blue", "Condition-variable/Fast", ""]})
+
+    def test_reuse(self):
+        cache = AnalysisCache()
+        event_man = cache.get_event_manager(TabularInput(self.df.copy(), name="run-1"), self.schema)
+        self.assertIs(cache.get_event_manager(TabularInput(self.df.copy(), name="run-1"), self.schema), event_man)
+        tag_man = cache.get_tag_manager(TabularInput(self.df.copy(), name="run-1"), self.schema)
+        self.assertIs(tag_man.event_manager, event_man)
+        self.assertIs(cache.get_tag_manager(TabularInput(self.df.copy(), name="run-1"), self.schema), tag_man)
+        type_man = cache.get_type_manager(TabularInput(self.df.copy(), name="run-1"), self.schema)
+        type_man.add_type("condition-variable")
+        self.assertIs(cache.get_type_manager(TabularInput(self.df.copy(), name="run-1"), self.schema), type_man)
+        self.assertEqual(type_man.types, ["condition-variable"])
+
+        df_extra = self.df.copy()
+        df_extra['new_column'] = [1, 2, 3, 4]
+        self.assertIs(cache.get_event_manager(TabularInput(df_extra, name="run-1"), self.schema), event_man)
+        self.assertIsNot(cache.get_event_manager(TabularInput(self.df.copy(), name="run-2"), self.schema), event_man)
+
+    def test_invalidation(self):
+        cache = AnalysisCache()
+        event_man = cache.get_event_manager(TabularInput(self.df.copy(), name="run-1"), self.schema)
+        df_changed = self.df.copy()
+        df_changed.loc[1, 'HED'] = "Green"
+        changed_man = cache.get_event_manager(TabularInput(df_changed, name="run-1"), self.schema)
+        self.assertIsNot(changed_man, event_man)
+        self.assertEqual(str(changed_man.hed_strings[1]), "Green")
+        df_shifted = self.df.copy()
+        df_shifted['onset'] = df_shifted['onset'] + 1
+        self.assertIsNot(cache.get_event_manager(TabularInput(df_shifted, name="run-1"), self.schema), changed_man)
+        cache.clear()
+        self.assertIsNot(cache.get_event_manager(TabularInput(self.df.copy(), name="run-1"), self.schema), event_man)
+
+    def test_shared_results_unchanged(self):
+        cache = AnalysisCache()
+        tag_man = cache.get_tag_manager(TabularInput(self.df.copy(), name="run-1"), self.schema)
+        hed_objs = tag_man.get_hed_objs(include_context=True)
+        hed_objs[0] = None
+        self.assertIsNotNone(tag_man.get_hed_objs(include_context=True)[0])
+        hed, base, context = tag_man.event_manager.unfold_context()
+        hed[0] = "Changed"
+        self.assertNotEqual(tag_man.event_manager.unfold_context()[0][0], "Changed")
+
+    def test_dispatcher_clears_cache(self):
+        operations = [{"operation": "factor_hed_tags",
+                       "parameters": {"query_names": ["red"], "queries": ["Red"], "expand_context": True}},
+                      {"operation": "remove_columns",
+                       "parameters": {"column_names": ["HED"], "ignore_missing": True}}]
+        dispatch = Dispatcher(operations, data_root=None, backup_name=None, hed_versions=self.schema)
+        df_new = dispatch.run_operations(self.df.copy())
+        self.assertEqual(list(df_new['red']), [1, 1, 0, 0])
+        self.assertFalse(dispatch.analysis_cache._entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -216,6 +216,29 @@ class Test(unittest.TestCase):
         self.assertTrue(all("Black" in item for item in base[0:1]))
         self.assertTrue(all("Red" in item for item in base[0:1]))
 
+    def test_get_active_events(self):
+        df = pd.DataFrame({'onset': [1, 2, 3, 4, 5, 6],
+                           'HED': ['(Duration/3.5 s, (Black))', '(Duration/1 s, (Red))', 'Blue', 'n/a',
+                                   '(Duration/10 s, (Green))', 'Label/1']})
+        manager = EventManager(TabularInput(df), self.schema)
+        self.assertEqual([str(event.contents) for event in manager.get_active_events(2.5)],
+                         ["((Black))", "((Red))"])
+        self.assertEqual([str(event.contents) for event in manager.get_active_events(4.2)], ["((Black))"])
+        self.assertEqual(manager.get_active_events(0.5), [])
+        self.assertEqual([str(event.contents) for event in manager.get_context_events(3)], ["((Black))"])
+        self.assertEqual(manager.get_context_events(0), [])
+        contexts = list(manager.contexts)
+        self.assertEqual([manager.get_context(index) for index in range(len(df))], contexts)
+        self.assertEqual(contexts, ["", "((Black))", "((Black))", "((Black))", "", "((Green))"])
+        self.assertEqual(manager.base[0], "((Black))")
+
+    def test_get_active_events_no_onset(self):
+        df = pd.DataFrame({'HED': ['(Duration/3.5 s, (Black))', 'Blue']})
+        manager = EventManager(TabularInput(df), self.schema)
+        self.assertEqual(manager.get_active_events(1), [])
+        self.assertEqual(manager.get_context_events(1), [])
+        self.assertIsNone(manager.contexts)
+
 
 if __name__ == '__main__':
     unittest.main()
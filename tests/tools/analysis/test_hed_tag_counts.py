@@ -65,6 +65,21 @@ class Test(unittest.TestCase):
         self.assertEqual(14, len(counts3.tag_dict))
         self.assertEqual(2, counts3.tag_dict['experiment-structure'].events)
 
+    def test_value_counts(self):
+        counts1 = HedTagCounts('Base_name1')
+        counts1.update_tag_counts(HedString("Duration/3 s, (Duration/3 s, Red)", self.hed_schema), 'run-1')
+        counts1.update_tag_counts(HedString("Duration/4 s, Blue", self.hed_schema), 'run-2')
+        duration = counts1.tag_dict['duration']
+        self.assertEqual(duration.events, 2)
+        self.assertEqual(list(duration.files), ['run-1', 'run-2'])
+        self.assertEqual(duration.value_dict, {'3 s': 2, '4 s': 1})
+        self.assertEqual(counts1.tag_dict['red'].value_dict, {None: 1})
+        counts2 = HedTagCounts("All", 0)
+        counts2.merge_tag_dicts(counts1.tag_dict)
+        counts2.merge_tag_dicts(counts1.tag_dict)
+        self.assertEqual(counts2.tag_dict['duration'].events, 4)
+        self.assertEqual(counts2.tag_dict['duration'].value_dict, {'3 s': 4, '4 s': 2})
+
     def test_hed_tag_count(self):
         name = 'Base_name1'
         counts1 = HedTagCounts(name, 0)
@@ -1,5 +1,6 @@
 import os
 import unittest
+import pandas as pd
 from pandas import DataFrame
 from hed.models import DefinitionDict
 from hed.models.hed_string import HedString
@@ -145,6 +146,29 @@ class Test(unittest.TestCase):
                 self.assertEqual(len(factors.columns), summary["levels"], 'get_factors has factors levels')
                 self.assertEqual(len(factors.columns), len(var_manager._type_map[variable].levels))
 
+    def test_level_storage(self):
+        var_fact = HedTypeFactors('condition-variable', 'var1', 6)
+        var_fact.add_level_index('cond1', 1)
+        var_fact.add_level_index('cond2', 3)
+        var_fact.add_level_index('cond1', 1)
+        var_fact.add_level_index('cond1', 4)
+        levels = var_fact.levels
+        self.assertEqual(list(levels.keys()), ['cond1', 'cond2'])
+        self.assertEqual(levels['cond1'], {1: 0, 4: 0})
+        var_fact.add_level_index('cond3', 5)
+        self.assertIn('cond3', levels)
+        one_hot = var_fact.get_factors()
+        self.assertEqual(list(one_hot.columns), ['var1.cond1', 'var1.cond2', 'var1.cond3'])
+        self.assertEqual(list(one_hot['var1.cond1']), [0, 1, 0, 0, 1, 0])
+        categorical = var_fact.get_factors(factor_encoding="categorical")
+        self.assertEqual(list(categorical['var1']), ['n/a', 'cond1', 'n/a', 'cond2', 'cond1', 'cond3'])
+        sparse = var_fact.get_factors(sparse=True)
+        self.assertTrue(all(isinstance(dtype, pd.SparseDtype) for dtype in sparse.dtypes))
+        self.assertTrue(sparse.sparse.to_dense().equals(one_hot))
+        summary = var_fact.get_summary()
+        self.assertEqual(summary['level_counts'], {'cond1': 2, 'cond2': 1, 'cond3': 1})
+        self.assertEqual(summary['events'], 4)
+
     def test_count_events(self):
         list1 = [0, 2, 6, 1, 2, 0, 0]
         number_events1, number_multiple1, max_multiple1 = HedTypeFactors._count_level_events(list1)
@@ -113,6 +113,22 @@ class Test(unittest.TestCase):
         self.assertEqual(df_new.iloc[3]["event_type"], 'n/a',
                          "remap should have n/a in the targets when key is missing")
 
+    def test_remap_empty_map(self):
+        key_map = KeyMap(['a'], ['c'])
+        df_new, missing = key_map.remap(pd.DataFrame({'a': [1, 2]}))
+        self.assertEqual(missing, [0, 1])
+        self.assertEqual(df_new['c'].tolist(), ['n/a', 'n/a'])
+
+    def test_update_empty_frame(self):
+        key_map = KeyMap(['a', 'b'])
+        key_map.update(pd.DataFrame({'a': [], 'b': []}))
+        self.assertFalse(key_map.map_dict)
+        template = key_map.make_template()
+        self.assertTrue(template.empty)
+        self.assertEqual(list(template.columns), ['key_counts', 'a', 'b'])
+        key_map.update(pd.DataFrame({'a': [1, 1], 'b': [2, 2]}))
+        self.assertEqual(key_map.make_template()['key_counts'].tolist(), [2])
+
     def test_remap_files(self):
         key_cols = ['type']
         target_cols = ['event_type', 'task_role', 'letter']
@@ -160,6 +176,22 @@ class Test(unittest.TestCase):
         self.assertEqual(len(t_map.col_map.columns), 4, "update should produce correct number of columns")
         self.assertEqual(len(t_map.col_map), len(t_map.count_dict), "update should produce the correct number of rows")
 
+    def test_update_counts_and_remap(self):
+        t_map = KeyMap(['a', 'b'], ['c'])
+        t_map.update(pd.DataFrame({'a': [1, 2, 1, 1, 2], 'b': ['x', 'y', 'x', 'z', None], 'c': [5, 6, 7, 8, 9]}))
+        self.assertEqual(t_map.col_map['c'].tolist(), [5, 6, 8, 9])
+        template = t_map.make_template()
+        self.assertEqual(template['key_counts'].tolist(), [2, 1, 1, 1])
+        t_map.update(pd.DataFrame({'a': [2, 3], 'b': ['y', 'y']}))
+        self.assertEqual(t_map._get_counts(), [2, 2, 1, 1, 1])
+        df_new, missing = t_map.remap(pd.DataFrame({'a': [1, 3, 4, 2], 'b': ['z', 'y', 'y', None]}))
+        self.assertEqual(df_new['c'].tolist(), [8, 'n/a', 'n/a', 9])
+        self.assertEqual(missing, [2])
+        t_map.resort()
+        df_sorted, missing_sorted = t_map.remap(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+        self.assertEqual(df_sorted['c'].tolist(), [5, 6])
+        self.assertFalse(missing_sorted)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,8 +4,9 @@ import shutil
 import unittest
 from unittest.mock import patch
 import zipfile
+import pandas as pd
 from hed.errors import HedFileError
-from hed.tools.remodeling.cli.run_remodel import parse_arguments, parse_tasks, main
+from hed.tools.remodeling.cli.run_remodel import parse_arguments, parse_tasks, main, _write_data_file
 
 
 class Test(unittest.TestCase):
@@ -163,6 +164,35 @@ class Test(unittest.TestCase):
             main(arg_list)
             self.assertFalse(fp.getvalue())
 
+    def test_main_workers(self):
+        sequential_path = os.path.realpath(os.path.join(self.extract_path, 'temp', 'sequential'))
+        parallel_path = os.path.realpath(os.path.join(self.extract_path, 'temp', 'parallel'))
+        arg_list = [self.data_root, self.summary_model_path, '-x', 'derivatives', 'stimuli', '-b', '-nu',
+                    '-s', '.json', '-i', 'none']
+        main(arg_list + ['-w', sequential_path])
+        main(arg_list + ['-w', parallel_path, '--workers', '2'])
+        summaries = []
+        for path in [sequential_path, parallel_path]:
+            summary_dir = os.path.join(path, 'remodel', 'summaries', 'Hed type summary')
+            summary_files = os.listdir(summary_dir)
+            self.assertEqual(len(summary_files), 1)
+            with open(os.path.join(summary_dir, summary_files[0])) as fp:
+                summaries.append(fp.read())
+        self.assertEqual(summaries[0], summaries[1])
+
+    def test_main_workers_file_errors(self):
+        bad_file = os.path.join(self.data_root, 'sub-002', 'eeg', 'sub-002_task-FacePerception_run-1_events.tsv')
+        with open(bad_file, 'w'):
+            pass
+        work_path = os.path.realpath(os.path.join(self.extract_path, 'temp'))
+        arg_list = [self.data_root, self.summary_model_path, '-x', 'derivatives', 'stimuli', '-b', '-nb', '-nu',
+                    '-w', work_path, '--workers', '2']
+        with self.assertRaises(HedFileError) as context:
+            main(arg_list)
+        self.assertEqual(context.exception.args[0], "RemodelingFileErrors")
+        self.assertIn(bad_file, context.exception.args[1])
+        self.assertTrue(os.listdir(os.path.join(work_path, 'remodel', 'summaries', 'Hed type summary')))
+
     def test_main_errors(self):
         # Test bad data directory
         arg_list = ['junk/junk', self.model_path, '-x', 'derivatives', '-bn', 'back1']
@@ -188,6 +218,16 @@ class Test(unittest.TestCase):
             main(arg_list)
             self.assertTrue(fp.getvalue())
 
+    def test_write_data_file_symlink(self):
+        data_file = os.path.join(self.data_root, 'sub-002', 'eeg', 'sub-002_task-FacePerception_run-1_events.tsv')
+        target = os.path.join(self.data_root, 'derivatives', 'sub-002_run-1_events.tsv')
+        os.replace(data_file, target)
+        os.symlink(target, data_file)
+        _write_data_file(pd.DataFrame({'onset': [1.5], 'duration': [0]}), data_file)
+        self.assertTrue(os.path.islink(data_file))
+        self.assertEqual(os.path.realpath(data_file), target)
+        self.assertEqual(list(pd.read_csv(target, sep='\t').columns), ['onset', 'duration'])
+
     def test_run_bids_ops_verbose(self):
         arg_list = [self.data_root, self.model_path, '-x', 'derivatives']
         with patch('sys.stdout', new=io.StringIO()) as fp:
@@ -61,6 +61,17 @@ class Test(unittest.TestCase):
         file_list = get_file_list(self.derv_path, name_suffix='events', extensions=['.tsv'])
         self.assertEqual(len(file_list), 3, "The backup of events.tsv has the right number of files")
 
+    def test_main_link(self):
+        arg_list = [self.test_root, '-bn', BackupManager.DEFAULT_BACKUP_NAME, '-x', 'derivatives',
+                    '-f', 'events', '-e', '.tsv', '-s', 'link', '-w', '2']
+        main(arg_list)
+        back_man = BackupManager(self.test_root)
+        backup_files = back_man.get_backup_files(BackupManager.DEFAULT_BACKUP_NAME)
+        data_files = back_man.get_backup_files(BackupManager.DEFAULT_BACKUP_NAME, original_paths=True)
+        self.assertEqual(len(backup_files), 3)
+        for backup_file, data_file in zip(backup_files, data_files):
+            self.assertTrue(os.path.samefile(backup_file, data_file))
+
     def test_main_all(self):
         arg_list = [self.test_root, '-bn', BackupManager.DEFAULT_BACKUP_NAME, '-bd', self.derv_path,
                     '-x', 'derivatives', '-f', '*', '-e', '*']
@@ -1,6 +1,6 @@
 import json
 import unittest
-from hed.tools.remodeling.operations.base_op import BaseOp
+from hed.tools.remodeling.operations.base_op import BaseOp, ColumnSet
 
 
 class TestOp(BaseOp):
@@ -65,6 +65,24 @@ class Test(unittest.TestCase):
         with self.assertRaises(TypeError):
             TestOpNoName({})
 
+    def test_column_set(self):
+        columns = ColumnSet(["a", "b"])
+        self.assertIn("a", columns)
+        self.assertNotIn("c", columns)
+        self.assertFalse(columns.is_all)
+        all_but = ColumnSet.all(["a", "c"])
+        self.assertFalse(all_but.is_all)
+        self.assertNotIn("a", all_but)
+        self.assertIn("b", all_but)
+        self.assertEqual(all_but.union(columns), ColumnSet.all(["c"]))
+        self.assertEqual(all_but.difference(["b"]), ColumnSet.all(["a", "b", "c"]))
+        self.assertEqual(columns.difference(["a"]), ColumnSet(["b"]))
+        self.assertEqual(columns.union(ColumnSet.all(["a", "d"])), ColumnSet.all(["d"]))
+
+    def test_get_input_columns(self):
+        op = TestOp(json.loads(self.json_parameters))
+        self.assertTrue(op.get_input_columns(ColumnSet()).is_all)
+
 
 if __name__ == '__main__':
     unittest.main()
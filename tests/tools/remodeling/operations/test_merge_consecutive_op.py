@@ -99,6 +99,17 @@ class Test(unittest.TestCase):
         df, df_new = self.get_dfs(op)
         self.assertEqual(len(df), len(df_new))
 
+    def test_do_op_unmerged_first_group(self):
+        # The first run of the code has a single event, so only the second run is merged.
+        parms = json.loads(self.json_parms)
+        parms["event_code"] = "go"
+        parms["match_columns"] = []
+        df = pd.DataFrame([[1.0, 0.5, 'go'], [2.0, 0.5, 'stop'], [3.0, 0.5, 'go'], [4.0, 2.5, 'go'], [5.0, 0.5, 'go'],
+                           [9.0, 0.5, 'stop']], columns=['onset', 'duration', 'trial_type'])
+        df_new = MergeConsecutiveOp(parms).do_op(self.dispatch, df, 'run-01')
+        self.assertEqual(list(df_new["onset"]), [1.0, 2.0, 3.0, 9.0])
+        self.assertEqual(list(df_new["duration"]), [0.5, 0.5, 3.5, 0.5])
+
     def test_get_remove_groups(self):
         match_df = pd.DataFrame(self.sample_data, columns=self.sample_columns)
         match_df = match_df.replace('n/a', np.nan)
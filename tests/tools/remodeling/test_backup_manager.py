@@ -133,6 +133,104 @@ class Test(unittest.TestCase):
         return_val2 = test_man.create_backup(file_list, backup_name="test_back1", verbose=False)
         self.assertTrue(return_val2, "create_backup returns true when it has created a backup.")
 
+    def test_create_backup_link(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        self.assertTrue(test_man.create_backup(file_list, backup_name="linked", strategy='link'))
+        backup_files = test_man.get_backup_files("linked", original_paths=False)
+        data_files = test_man.get_backup_files("linked", original_paths=True)
+        for backup_file, data_file in zip(backup_files, data_files):
+            self.assertTrue(os.path.samefile(backup_file, data_file))
+        hashes = test_man.get_backup_hashes("linked")
+        self.assertEqual(len(hashes), len(file_list))
+        self.assertEqual(hashes[test_man.get_file_key(file_list[0])], BackupManager.get_file_hash(file_list[0]))
+        with self.assertRaises(HedFileError) as context:
+            test_man.create_backup(file_list, backup_name="bad", strategy='move')
+        self.assertEqual(context.exception.code, "BadBackupStrategy")
+
+    def test_create_backup_dedup(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        test_man.create_backup(file_list, backup_name="first", max_workers=2)
+        with open(file_list[0], 'a') as fp:
+            fp.write("changed\n")
+        test_man.create_backup(file_list, backup_name="second", strategy='reflink')
+        first_files = test_man.get_backup_files("first")
+        second_files = test_man.get_backup_files("second")
+        self.assertFalse(os.path.samefile(first_files[0], second_files[0]))
+        for first_file, second_file in zip(first_files[1:], second_files[1:]):
+            self.assertTrue(os.path.samefile(first_file, second_file))
+        self.assertEqual(len(BackupManager(self.test_root).backups_dict), 2)
+
+    def test_create_backup_dedup_safe(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        test_man.create_backup(file_list, backup_name="linked", strategy='link')
+        test_man.create_backup(file_list, backup_name="copied")
+        for data_file, copied_file in zip(test_man.get_backup_files("linked", original_paths=True),
+                                          test_man.get_backup_files("copied")):
+            self.assertFalse(os.path.samefile(data_file, copied_file))
+        with open(file_list[0], 'a') as fp:
+            fp.write("changed\n")
+        with open(test_man.get_backup_path("copied", file_list[1]), 'a') as fp:
+            fp.write("changed\n")
+        test_man.create_backup(file_list, backup_name="second")
+        copied_files = test_man.get_backup_files("copied")
+        second_files = test_man.get_backup_files("second")
+        self.assertFalse(os.path.samefile(copied_files[1], second_files[1]))
+        self.assertEqual(BackupManager.get_file_hash(second_files[1]), BackupManager.get_file_hash(file_list[1]))
+        for copied_file, second_file in zip(copied_files[2:], second_files[2:]):
+            self.assertTrue(os.path.samefile(copied_file, second_file))
+
+    def test_restore_backup_symlink(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        test_man.create_backup(file_list, backup_name="first")
+        target = os.path.join(self.test_root, 'target.tsv')
+        os.replace(file_list[0], target)
+        os.symlink(target, file_list[0])
+        with open(target, 'a') as fp:
+            fp.write("changed\n")
+        self.assertEqual(test_man.restore_backup("first", verbose=False), [target])
+        self.assertTrue(os.path.islink(file_list[0]))
+        self.assertEqual(BackupManager.get_file_hash(target),
+                         BackupManager.get_file_hash(test_man.get_backup_path("first", file_list[0])))
+
+    def test_create_backup_verbose(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        with patch('sys.stdout', new=io.StringIO()) as fp:
+            test_man.create_backup(file_list, backup_name="first", verbose=True)
+            self.assertEqual(fp.getvalue().count("Copying "), len(file_list))
+        with open(file_list[0], 'a') as fp:
+            fp.write("changed\n")
+        with patch('sys.stdout', new=io.StringIO()) as fp:
+            test_man.create_backup(file_list, backup_name="second", verbose=True, strategy='link')
+            lines = fp.getvalue().splitlines()
+        self.assertTrue(lines[1].startswith(f"Linking {file_list[0]} to "))
+        self.assertEqual(sum(line.startswith("Linking duplicate of ") for line in lines), len(file_list) - 1)
+
+    def test_restore_backup(self):
+        test_man = BackupManager(self.test_root)
+        file_list = get_file_list(self.test_root)
+        test_man.create_backup(file_list, backup_name="linked", strategy='link')
+        with patch('sys.stdout', new=io.StringIO()):
+            self.assertFalse(test_man.restore_backup("linked"))
+        backup_file = test_man.get_backup_path("linked", file_list[1])
+        with open(backup_file, 'r') as fp:
+            contents = fp.read()
+        os.remove(file_list[0])
+        with open(file_list[1] + '.new', 'w') as fp:
+            fp.write(contents + "changed\n")
+        os.replace(file_list[1] + '.new', file_list[1])
+        restored = test_man.restore_backup("linked", verbose=False)
+        self.assertEqual(sorted(restored), sorted(file_list[:2]))
+        self.assertTrue(os.path.exists(file_list[0]))
+        with open(file_list[1], 'r') as fp:
+            self.assertEqual(fp.read(), contents)
+        self.assertFalse(os.path.samefile(backup_file, file_list[1]))
+        self.assertEqual(test_man.restore_backup("linked", verbose=False), [])
+
     def test_get_task(self):
         task1 = BackupManager.get_task(['abc', 'def'], 'temp/myabc.txt')
         self.assertFalse(task1)
@@ -7,7 +7,7 @@ import numpy as np
 import zipfile
 from hed.errors.exceptions import HedFileError
 from hed.tools.remodeling.dispatcher import Dispatcher
-from hed.tools.remodeling.operations.base_op import BaseOp
+from hed.tools.remodeling.operations.base_op import BaseOp, ColumnSet
 from hed.tools.util.io_util import get_file_list
 
 
@@ -112,6 +112,66 @@ class Test(unittest.TestCase):
         self.assertEqual(len(dispatch.parsed_ops), len(model1),
                          "dispatcher operation list should have one item for each operation")
 
+    def test_run_operations_op_stats(self):
+        model_path1 = os.path.join(self.data_path, 'simple_reorder_rmdl.json')
+        with open(model_path1) as fp:
+            model1 = json.load(fp)
+        dispatch = Dispatcher(model1)
+        dispatch.run_operations(self.file_path)
+        dispatch.run_operations(self.file_path)
+        self.assertEqual(len(dispatch.op_stats), len(model1))
+        self.assertEqual(dispatch.op_stats[0]['operation'], model1[0]['operation'])
+        self.assertEqual(dispatch.op_stats[1]['files'], 2)
+        self.assertGreater(dispatch.op_stats[1]['max_memory'], 0)
+        other = Dispatcher(model1)
+        other.merge_op_stats(dispatch.op_stats)
+        other.merge_op_stats(dispatch.op_stats)
+        self.assertEqual(other.op_stats[1]['files'], 4)
+        report = other.get_op_report()
+        self.assertEqual(len(report.split('\n')), len(model1) + 1)
+
+    def test_normalize_data(self):
+        df = pd.DataFrame({'a': ['x', 'n/a', None], 'b': [1.0, np.nan, 3.0], 'c': ['u', 'v', 'w'],
+                           'd': pd.Categorical(['p', 'n/a', 'p'])})
+        df_new = Dispatcher.normalize_data(df)
+        self.assertEqual(list(df['a']), ['x', 'n/a', None])
+        self.assertTrue(df_new['a'][1:].isna().all())
+        self.assertEqual(list(df_new['d'].isna()), [False, True, False])
+        self.assertEqual(df_new['d'].dtype, object)
+        self.assertTrue(np.shares_memory(df_new['b'].to_numpy(), df['b'].to_numpy()))
+        df_clean = pd.DataFrame({'b': [1.0, np.nan], 'c': ['u', np.nan]})
+        self.assertIs(Dispatcher.normalize_data(df_clean), df_clean)
+        df_dup = pd.DataFrame([['n/a', 1], ['y', 2]], columns=['a', 'a'], index=[5, 5])
+        df_new_dup = Dispatcher.normalize_data(df_dup)
+        self.assertEqual(list(df_new_dup.columns), ['a', 'a'])
+        self.assertEqual(list(df_new_dup.index), [5, 5])
+        self.assertTrue(pd.isna(df_new_dup.iloc[0, 0]))
+        self.assertTrue(Dispatcher.post_proc_data(df_new).equals(Dispatcher.post_proc_data(
+            Dispatcher.prep_data(Dispatcher.post_proc_data(df)))))
+
+    def test_get_input_columns(self):
+        test = [{"operation": "remove_rows", "parameters": {"column_name": "trial_type", "remove_values": ["go"]}},
+                {"operation": "summarize_column_values",
+                 "parameters": {"summary_name": "values", "summary_filename": "values",
+                                "skip_columns": ["onset", "duration", "sex", "response_accuracy",
+                                                 "response_hand", "stop_signal_delay"],
+                                "value_columns": ["response_time"]}}]
+        dispatch = Dispatcher(test)
+        self.assertTrue(dispatch.get_input_columns().is_all)
+        columns = dispatch.get_input_columns(ColumnSet())
+        self.assertTrue(columns.all_except)
+        self.assertIn("trial_type", columns)
+        self.assertNotIn("sex", columns)
+        self.assertIn("unknown_column", columns)
+        dispatch.read_columns = columns
+        df = dispatch.get_data_file(self.file_path)
+        self.assertEqual(list(df.columns), ["trial_type", "response_time"])
+        self.assertEqual(len(df), len(self.sample_data))
+        dispatch.read_columns = ColumnSet(["not_a_column"])
+        df_empty = dispatch.get_data_file(self.file_path)
+        self.assertEqual(len(df_empty.columns), 0)
+        self.assertEqual(len(df_empty), len(self.sample_data))
+
     def test_run_operations_hed(self):
         events_path = os.path.realpath(os.path.join(self.data_path, 'sub-002_task-FacePerception_run-1_events.tsv'))
         sidecar_path = os.path.realpath(os.path.join(self.data_path, 'task-FacePerception_events.json'))